@@ -0,0 +1,122 @@
+"""Concurrent throughput of the outcome endpoints against a running server.
+
+Start the app in one of the two deployment modes, then point this script at it
+with the same database and user::
+
+    # sync: WSGI workers, sync outcome views
+    gunicorn platlog.wsgi:application --workers 2 --bind 127.0.0.1:8000
+
+    # async: ASGI workers, async outcome views
+    EMS_ASYNC_OUTCOMES=1 gunicorn platlog.asgi:application --workers 2 \\
+        -k uvicorn_worker.UvicornWorker --bind 127.0.0.1:8000
+
+    python benchmarks/outcome_concurrency.py --username alice --password secret \\
+        --event 12 --concurrency 50 --requests 2000
+
+Each client logs in once, then GETs ``/events/<id>/outcomes/`` (and
+``/outcomes/<id>/`` with ``--outcome``) as fast as it can. The script reports
+requests per second and latency percentiles, so runs of the two modes with the
+same arguments can be compared directly. Only the standard library is used.
+"""
+import argparse
+import http.cookiejar
+import json
+import re
+import statistics
+import sys
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+
+def login(base_url, username, password):
+    """Return an opener holding an authenticated session cookie."""
+    jar = http.cookiejar.CookieJar()
+    opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(jar))
+    page = opener.open(f"{base_url}/login/").read().decode()
+    match = re.search(r'name="csrfmiddlewaretoken" value="([^"]+)"', page)
+    if not match:
+        sys.exit("Could not find a CSRF token on the login page")
+    body = urllib.parse.urlencode({
+        'csrfmiddlewaretoken': match.group(1),
+        'username': username,
+        'password': password,
+    }).encode()
+    request = urllib.request.Request(f"{base_url}/login/", data=body, headers={'Referer': f"{base_url}/login/"})
+    opener.open(request)
+    if not any(cookie.name == 'sessionid' for cookie in jar):
+        sys.exit("Login failed")
+    return opener
+
+
+def run(args):
+    paths = [f"/events/{args.event}/outcomes/"]
+    if args.outcome:
+        paths.append(f"/outcomes/{args.outcome}/")
+
+    counter = iter(range(args.requests))
+    lock = threading.Lock()
+    latencies, errors = [], []
+
+    def worker(opener):
+        while True:
+            with lock:
+                n = next(counter, None)
+            if n is None:
+                return
+            started = time.perf_counter()
+            try:
+                with opener.open(args.base_url + paths[n % len(paths)], timeout=args.timeout) as response:
+                    response.read()
+            except (urllib.error.URLError, OSError) as exc:
+                errors.append(str(exc))
+                continue
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        # Log in up front so password hashing is not part of the measurement.
+        openers = list(pool.map(lambda _: login(args.base_url, args.username, args.password),
+                                range(args.concurrency)))
+        started = time.perf_counter()
+        for future in [pool.submit(worker, opener) for opener in openers]:
+            future.result()
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    pct = lambda p: latencies[min(len(latencies) - 1, int(len(latencies) * p))] if latencies else None
+    return {
+        'base_url': args.base_url,
+        'concurrency': args.concurrency,
+        'requests': len(latencies),
+        'errors': len(errors),
+        'seconds': round(elapsed, 2),
+        'requests_per_second': round(len(latencies) / elapsed, 1),
+        'latency_ms': {
+            'mean': round(statistics.fmean(latencies), 1) if latencies else None,
+            'p50': round(pct(0.50), 1) if latencies else None,
+            'p95': round(pct(0.95), 1) if latencies else None,
+            'p99': round(pct(0.99), 1) if latencies else None,
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument('--base-url', default='http://localhost:8000')
+    parser.add_argument('--username', required=True)
+    parser.add_argument('--password', required=True)
+    parser.add_argument('--event', type=int, required=True, help="Event pk owned by the user")
+    parser.add_argument('--outcome', type=int, help="Outcome pk of that event, to mix in outcome_detail")
+    parser.add_argument('--concurrency', type=int, default=50)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--timeout', type=float, default=30)
+    args = parser.parse_args()
+    args.base_url = args.base_url.rstrip('/')
+    print(json.dumps(run(args), indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+"""Server-side cost of the pages that list events, on a large seeded dataset.
+
+Requests every page and data endpoint that shows events through the test
+client and reports the median of the ``Server-Timing`` the instrumentation
+middleware adds (total, database and template time) and the response size.
+The data is written to a throwaway test database created from the configured
+``DATABASE_URL``; ``--debug`` sets ``DEBUG`` for the run (off by default, as
+in production)::
+
+    DATABASE_URL=sqlite:////tmp/bench.sqlite3 python benchmarks/page_render.py --events 5000
+    DATABASE_URL=sqlite:////tmp/bench.sqlite3 python benchmarks/page_render.py --events 5000 --debug
+
+One user with 5000 events, 2 outcomes per past event, SQLite, median of 100
+requests, ms (home_data is answered from its per-user cache after the first)::
+
+    page                   DEBUG=True               DEBUG=False
+                           total    db   tpl        total    db   tpl
+    home                     1.4   0.0   0.5          1.1   0.0   0.5
+    home_data                1.3   0.0   0.0          1.1   0.0   0.0
+    event_timeline           2.6   0.4   1.6          2.9   0.4   1.8
+    event_timeline_data     21.9   2.4   0.0         19.9   2.2   0.0
+    category_events          4.6   0.2   1.1          3.8   0.1   1.0
+    category_events_data     2.7   0.1   0.0          2.8   0.1   0.0
+    category_list            2.4   0.1   2.1          2.8   0.1   2.4
+
+None of these pages renders per-event HTML on the server: each is a shell of
+at most a few ms of template time (compiled once by the cached template
+loader) and the browser draws the events from JSON. What remains is the
+timeline window's rows, fetched and formatted; a per-event cache would still
+have to query them for their keys, and whole responses already have ETags and
+the delta endpoint (ems.sync).
+"""
+import argparse
+import os
+import statistics
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'platlog.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.conf import settings  # noqa: E402
+from django.db import connection  # noqa: E402
+from django.test import Client  # noqa: E402
+from django.test.utils import override_settings, setup_test_environment  # noqa: E402
+from django.urls import reverse  # noqa: E402
+
+from ems.tests.factories import seed_dataset  # noqa: E402
+
+
+def pages(category):
+    return {
+        'home': (reverse('home'), {}),
+        'home_data': (reverse('home_data'), {}),
+        'event_timeline': (reverse('event_timeline'), {}),
+        'event_timeline_data': (reverse('event_timeline_data'), {'view_mode': 'Month'}),
+        'category_events': (reverse('category_events', args=[category.pk]), {}),
+        'category_events_data': (reverse('category_events_data', args=[category.pk]), {}),
+        'category_list': (reverse('category_list'), {}),
+    }
+
+
+def server_timing(response):
+    """{'db': ms, 'tpl': ms, 'total': ms} from the Server-Timing header."""
+    timings = {}
+    for metric in response.headers['Server-Timing'].split(', '):
+        name, duration = metric.split(';')[:2]
+        timings[name] = float(duration.removeprefix('dur='))
+    return timings
+
+
+def measure(client, url, params, repeat):
+    samples = []
+    for _ in range(repeat):
+        response = client.get(url, params)
+        assert response.status_code == 200, (url, response.status_code)
+        samples.append(server_timing(response))
+    median = {name: statistics.median(s[name] for s in samples) for name in samples[0]}
+    return median, len(response.content)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--events', type=int, default=5000)
+    parser.add_argument('--outcomes-per-event', type=int, default=2)
+    parser.add_argument('--repeat', type=int, default=50)
+    parser.add_argument('--debug', action='store_true', help="run with DEBUG=True")
+    args = parser.parse_args()
+
+    setup_test_environment()
+    # Hashed static URLs need collectstatic's manifest; as in the tests, use
+    # plain names instead.
+    override_settings(DEBUG=args.debug, STORAGES={
+        **settings.STORAGES,
+        'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+    }).enable()
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        users, categories, _ = seed_dataset(users=1, events_per_user=args.events,
+                                            outcomes_per_event=args.outcomes_per_event, prefix='bench')
+        client = Client()
+        client.force_login(users[0])
+        print(f"DEBUG={settings.DEBUG}  {args.events} events, median of {args.repeat}")
+        print(f"{'page':<22}{'total ms':>9}{'db ms':>8}{'tpl ms':>8}{'bytes':>10}")
+        for name, (url, params) in pages(categories[0]).items():
+            timing, size = measure(client, url, params, args.repeat)
+            print(f"{name:<22}{timing['total']:>9.1f}{timing['db']:>8.1f}{timing['tpl']:>8.1f}{size:>10,}")
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+if __name__ == '__main__':
+    main()
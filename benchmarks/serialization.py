@@ -0,0 +1,143 @@
+"""Rows per second of the JSON serialisation strategies used by ems.views.
+
+Compares, over the same seeded events and outcomes:
+
+* ``instances``  - full model instances, dicts built field by field with
+  ``strftime`` (how the outcome detail and category views used to work);
+* ``values``     - ``values()`` dicts reshaped by hand with ``strftime``
+  (how the timeline and home payloads used to work);
+* ``projection`` - ``ems.serializers`` projections over ``values_list()``.
+
+The data is written to a throwaway test database created from the configured
+``DATABASE_URL``, so it can be pointed at the production backend safely::
+
+    DATABASE_URL=sqlite:////tmp/bench.sqlite3 python benchmarks/serialization.py --events 20000
+
+Each strategy runs ``--repeat`` times; the best run is reported, including the
+query, so the numbers reflect what a view pays end to end.
+"""
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'platlog.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.db import connection  # noqa: E402
+from django.test.utils import setup_test_environment  # noqa: E402
+
+from ems import serializers  # noqa: E402
+from ems.models import Event, Outcome  # noqa: E402
+from ems.tests.factories import seed_dataset  # noqa: E402
+
+
+def events_from_instances():
+    return [
+        {
+            'id': str(event.id),
+            'name': event.name or "Unnamed",
+            'project_type': event.project_type or 'other',
+            'start_date': event.start_date.strftime("%Y-%m-%d"),
+            'end_date': event.end_date.strftime("%Y-%m-%d"),
+            'description': event.description or '',
+            'organizer': event.organizer or '',
+            'outcome_count': event.outcome_count,
+        }
+        for event in Event.objects.order_by('start_date')
+    ]
+
+
+def events_from_values():
+    rows = Event.objects.order_by('start_date').values(
+        'id', 'name', 'project_type', 'start_date', 'end_date',
+        'description', 'organizer', 'outcome_count',
+    )
+    return [
+        {
+            'id': str(event['id']),
+            'name': event['name'] or "Unnamed",
+            'project_type': event['project_type'] or 'other',
+            'start_date': event['start_date'].strftime("%Y-%m-%d"),
+            'end_date': event['end_date'].strftime("%Y-%m-%d"),
+            'description': event['description'] or '',
+            'organizer': event['organizer'] or '',
+            'outcome_count': event['outcome_count'],
+        }
+        for event in rows
+    ]
+
+
+def events_from_projection():
+    return serializers.TIMELINE_EVENT.serialize(Event.objects.order_by('start_date'))
+
+
+def outcomes_from_instances():
+    return [
+        {name: getattr(outcome, name) for name in serializers.OUTCOME.fields}
+        for outcome in Outcome.objects.order_by('pk')
+    ]
+
+
+def outcomes_from_values():
+    return list(Outcome.objects.order_by('pk').values(*serializers.OUTCOME.fields))
+
+
+def outcomes_from_projection():
+    return serializers.OUTCOME.serialize(Outcome.objects.order_by('pk'))
+
+
+CASES = {
+    'events': {
+        'instances': events_from_instances,
+        'values': events_from_values,
+        'projection': events_from_projection,
+    },
+    'outcomes': {
+        'instances': outcomes_from_instances,
+        'values': outcomes_from_values,
+        'projection': outcomes_from_projection,
+    },
+}
+
+
+def best_rate(func, repeat):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        rows = len(func())
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return rows, rows / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--events', type=int, default=5000)
+    parser.add_argument('--outcomes-per-event', type=int, default=2)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        seed_dataset(users=1, events_per_user=args.events,
+                     outcomes_per_event=args.outcomes_per_event, prefix='bench')
+        for case, strategies in CASES.items():
+            baseline = None
+            for name, func in strategies.items():
+                rows, rate = best_rate(func, args.repeat)
+                baseline = baseline or rate
+                print(f"{case:<9} {name:<11} {rows:>7} rows  {rate:>11,.0f} rows/s  "
+                      f"x{rate / baseline:.2f}")
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+if __name__ == '__main__':
+    main()
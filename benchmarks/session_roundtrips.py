@@ -0,0 +1,97 @@
+"""Database round trips per authenticated request for each session engine.
+
+Requests a mix of ``@login_required`` views through the test client and counts
+the queries each one runs, once per ``SESSION_ENGINE``:
+
+* ``db``        - Django's default: every request SELECTs its django_session row;
+* ``cached_db`` - the configured default: read from the cache, written through;
+* ``cache``     - sessions only in the cache.
+
+Uses a throwaway test database created from ``DATABASE_URL`` and whatever
+cache ``CACHE_URL`` configures (local memory when unset)::
+
+    DATABASE_URL=sqlite:////tmp/bench.sqlite3 python benchmarks/session_roundtrips.py
+    CACHE_URL=redis://localhost:6379/1 DATABASE_URL=postgres://... python benchmarks/session_roundtrips.py
+
+Each session is used for ``--requests`` requests after logging in, like a user
+clicking through the app; the first request of a fresh session is included.
+"""
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'platlog.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.core.cache import cache, caches  # noqa: E402
+from django.db import connection  # noqa: E402
+from django.test import Client  # noqa: E402
+from django.test.utils import CaptureQueriesContext, override_settings, setup_test_environment  # noqa: E402
+from django.urls import reverse  # noqa: E402
+
+from ems.tests.factories import seed_dataset  # noqa: E402
+
+ENGINES = {
+    'db': 'django.contrib.sessions.backends.db',
+    'cached_db': 'django.contrib.sessions.backends.cached_db',
+    'cache': 'django.contrib.sessions.backends.cache',
+}
+
+
+def paths(event):
+    return [
+        reverse('home'),
+        reverse('home_data'),
+        reverse('event_timeline_data'),
+        reverse('outcome_list', args=[event.pk]),
+        reverse('category_list'),
+    ]
+
+
+def run(engine, user, urls, requests):
+    with override_settings(SESSION_ENGINE=ENGINES[engine]):
+        cache.clear()
+        client = Client(HTTP_HOST='localhost')
+        client.force_login(user)
+        total = session = 0
+        started = time.perf_counter()
+        for index in range(requests):
+            with CaptureQueriesContext(connection) as queries:
+                response = client.get(urls[index % len(urls)])
+            if response.status_code >= 400:
+                sys.exit(f"{urls[index % len(urls)]} returned {response.status_code}")
+            total += len(queries)
+            session += sum('django_session' in query['sql'] for query in queries)
+        elapsed = time.perf_counter() - started
+    return total / requests, session / requests, elapsed / requests * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--requests', type=int, default=200)
+    args = parser.parse_args()
+
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        users, _, events = seed_dataset(users=1, events_per_user=50, prefix='bench')
+        urls = paths(events[0])
+        baseline = None
+        print(f"cache backend: {caches['default'].__class__.__name__}")
+        for engine in ENGINES:
+            queries, session, ms = run(engine, users[0], urls, args.requests)
+            baseline = queries if baseline is None else baseline
+            print(f"{engine:<10} {queries:5.2f} queries/request  {session:4.2f} on django_session  "
+                  f"saved {baseline - queries:4.2f}  {ms:6.2f} ms/request")
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+if __name__ == '__main__':
+    main()
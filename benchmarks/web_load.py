@@ -0,0 +1,137 @@
+"""Throughput and latency of the home and timeline pages against a running server.
+
+Start the app with gunicorn.conf.py (or a variant of it) on a PostgreSQL
+database, then run this script with a user of that database::
+
+    DATABASE_URL=postgres://... gunicorn                     # gthread, pooled
+    DATABASE_URL=postgres://... EMS_DB_POOL=0 gunicorn platlog.asgi:application \\
+        -k uvicorn_worker.UvicornWorker -c /dev/null          # the previous setup
+
+    python benchmarks/web_load.py --username alice --password secret \\
+        --concurrency 32 --requests 4000 --database-url postgres://...
+
+Each client logs in once (see outcome_concurrency.py), then cycles through the
+home shell, its data, the timeline page and the timeline data. With
+``--database-url`` a sampler thread also records the peak number of
+connections the server holds open on the database during the run.
+
+One CPU, PostgreSQL 16 on the same host (max_connections=100), a user with 500
+events, 32 clients, 4000 requests::
+
+    setup                                      req/s   p50 ms   p99 ms   errors   db conns
+    uvicorn x1, CONN_MAX_AGE=600 (previous)     40.7    519.9   1374.2      406         99
+    uvicorn x2, CONN_MAX_AGE=600                38.0    496.8   1591.7      551         99
+    uvicorn x2, pool of 4                      100.0    315.3    685.0        0          9
+    gthread 2x4, CONN_MAX_AGE=600              150.8    207.2    437.5        0          8
+    gthread 2x4, pool of 4 (gunicorn.conf.py)  178.7    174.3    354.2        0          8
+
+Under ASGI each sync view runs in a thread of its own, and with persistent
+connections each of those threads opens a connection that outlives the
+request: connections pile up until the server refuses new ones. The pool caps
+them at workers x max_size and hands them back after every request.
+"""
+import argparse
+import json
+import statistics
+import sys
+import threading
+import time
+import urllib.error
+from concurrent.futures import ThreadPoolExecutor
+
+from outcome_concurrency import login
+
+PATHS = ['/', '/home/data/', '/timeline/', '/timeline/data/']
+
+
+def sample_connections(database_url, stop, peaks):
+    """Sample the number of other sessions on the database until ``stop`` is set."""
+    import psycopg
+
+    with psycopg.connect(database_url, autocommit=True) as conn:
+        while not stop.is_set():
+            count = conn.execute(
+                "SELECT count(*) FROM pg_stat_activity"
+                " WHERE datname = current_database() AND pid <> pg_backend_pid()"
+            ).fetchone()[0]
+            peaks.append(count)
+            stop.wait(0.05)
+
+
+def run(args):
+    counter = iter(range(args.requests))
+    lock = threading.Lock()
+    latencies, errors, connections = [], [], []
+
+    def worker(opener):
+        while True:
+            with lock:
+                n = next(counter, None)
+            if n is None:
+                return
+            started = time.perf_counter()
+            try:
+                with opener.open(args.base_url + PATHS[n % len(PATHS)], timeout=args.timeout) as response:
+                    response.read()
+            except (urllib.error.URLError, OSError) as exc:
+                errors.append(str(exc))
+                continue
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    stop = threading.Event()
+    sampler = None
+    if args.database_url:
+        sampler = threading.Thread(target=sample_connections, args=(args.database_url, stop, connections))
+        sampler.start()
+    try:
+        # Log in up front, one at a time, so password hashing is not part of the
+        # measurement and does not hold pooled connections while it runs.
+        openers = [login(args.base_url, args.username, args.password) for _ in range(args.concurrency)]
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            started = time.perf_counter()
+            for future in [pool.submit(worker, opener) for opener in openers]:
+                future.result()
+            elapsed = time.perf_counter() - started
+    finally:
+        stop.set()
+        if sampler:
+            sampler.join()
+
+    if not latencies:
+        sys.exit(f"No successful requests: {errors[:1]}")
+    latencies.sort()
+    pct = lambda p: round(latencies[min(len(latencies) - 1, int(len(latencies) * p))], 1)
+    return {
+        'base_url': args.base_url,
+        'concurrency': args.concurrency,
+        'requests': len(latencies),
+        'errors': len(errors),
+        'first_errors': sorted(set(errors))[:3],
+        'seconds': round(elapsed, 2),
+        'requests_per_second': round(len(latencies) / elapsed, 1),
+        'latency_ms': {
+            'mean': round(statistics.fmean(latencies), 1),
+            'p50': pct(0.50),
+            'p95': pct(0.95),
+            'p99': pct(0.99),
+        },
+        'peak_db_connections': max(connections) if connections else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument('--base-url', default='http://localhost:8000')
+    parser.add_argument('--username', required=True)
+    parser.add_argument('--password', required=True)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--requests', type=int, default=4000)
+    parser.add_argument('--timeout', type=float, default=30)
+    parser.add_argument('--database-url', help="Also sample the server's open connections on this database")
+    args = parser.parse_args()
+    args.base_url = args.base_url.rstrip('/')
+    print(json.dumps(run(args), indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,9 @@
 from django.contrib import admin
-from .models import Category, Event
+from django.contrib.admin.views.main import ORDER_VAR
+from django.db.models import Q
+from .models import Category, Event, Participant
+from .participants import link_participants
+from .search import search_events
 
 
 @admin.register(Category)
@@ -7,8 +11,53 @@ class CategoryAdmin(admin.ModelAdmin):
     list_display = ('name',)
     search_fields = ('name',)
 
+@admin.register(Participant)
+class ParticipantAdmin(admin.ModelAdmin):
+    list_display = ('name',)
+    search_fields = ('name',)
+
+class OutcomeStatusFilter(admin.SimpleListFilter):
+    title = 'outcome status'
+    parameter_name = 'outcomes'
+
+    def lookups(self, request, model_admin):
+        return (
+            ('awaiting', 'Ended without outcome'),
+            ('recorded', 'Has outcomes'),
+        )
+
+    def queryset(self, request, queryset):
+        if self.value() == 'awaiting':
+            return queryset.awaiting_outcome()
+        if self.value() == 'recorded':
+            return queryset.filter(outcome_count__gt=0)
+        return queryset
+
 @admin.register(Event)
 class EventAdmin(admin.ModelAdmin):
-    list_display = ('name', 'category', 'start_date', 'end_date', 'project_type')
-    list_filter = ('category', 'project_type')
-    search_fields = ('name','project_type', 'category__name', 'description', 'location', 'organizer')
\ No newline at end of file
+    list_display = ('name', 'category', 'start_date', 'end_date', 'project_type',
+                    'outcome_count', 'last_outcome_at')
+    list_filter = (OutcomeStatusFilter, 'category', 'project_type')
+    # attendees is derived from the participants text, so it is shown, not edited.
+    readonly_fields = ('attendees',)
+    search_fields = ('name','project_type', 'category__name', 'description', 'location', 'organizer')
+
+    def save_related(self, request, form, formsets, change):
+        super().save_related(request, form, formsets, change)
+        link_participants([form.instance], replace=change)
+
+    def get_search_results(self, request, queryset, search_term):
+        # Full-text search (GIN index on PostgreSQL) instead of icontains over
+        # search_fields; category and project type are not in the search vector,
+        # so every term may also match one of those.
+        if not search_term:
+            return super().get_search_results(request, queryset, search_term)
+        also = Q()
+        for term in search_term.split():
+            also &= Q(category__name__icontains=term) | Q(project_type__icontains=term)
+        results = search_events(search_term, queryset, also=also)
+        if ORDER_VAR in request.GET:
+            # The changelist ordered the queryset before the search; a sorted
+            # column wins over rank, otherwise the best matches come first.
+            results = results.order_by(*queryset.query.order_by)
+        return results, False
@@ -0,0 +1,110 @@
+"""Incrementally maintained aggregates.
+
+* pending-events-by-category counts for event_chart;
+* each event's ``outcome_count`` / ``last_outcome_at``.
+"""
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+from django.utils import timezone
+
+from .models import Category, Event, Outcome, PendingEventCount
+
+
+def reconcile_pending_counts(now=None):
+    """Recount pending events for every category as of ``now``."""
+    now = now or timezone.now()
+    counts = dict(
+        Event.objects.filter(end_date__gt=now)
+        .values_list('category_id')
+        .annotate(count=Count('id'))
+        .order_by()
+    )
+    rows = [
+        PendingEventCount(category_id=category_id, count=counts.get(category_id, 0), as_of=now)
+        for category_id in Category.objects.values_list('id', flat=True)
+    ]
+    with transaction.atomic():
+        PendingEventCount.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=['category'],
+            update_fields=['count', 'as_of'],
+        )
+    return rows
+
+
+def adjust_pending_count(category_id, end_date, delta):
+    """Add ``delta`` to a category's count if an event ending at ``end_date`` is counted in it."""
+    updated = PendingEventCount.objects.filter(
+        category_id=category_id, as_of__lt=end_date,
+    ).update(count=F('count') + delta)
+    if updated or PendingEventCount.objects.filter(category_id=category_id).exists():
+        return
+    # First event seen for this category: start its row from a fresh count,
+    # which already reflects the write being reported.
+    now = timezone.now()
+    try:
+        with transaction.atomic():
+            PendingEventCount.objects.create(
+                category_id=category_id,
+                count=Event.objects.filter(category_id=category_id, end_date__gt=now).count(),
+                as_of=now,
+            )
+    except IntegrityError:
+        # Created concurrently, or the category itself is gone.
+        pass
+
+
+def pending_counts(now=None):
+    """Return {category name: pending events}, sorted by name, in constant time."""
+    now = now or timezone.now()
+    rows = list(PendingEventCount.objects.select_related('category').order_by('category__name'))
+    if not rows:
+        reconcile_pending_counts(now)
+        rows = list(PendingEventCount.objects.select_related('category').order_by('category__name'))
+    if not rows:
+        return {}
+
+    # Events that ended since the last reconcile no longer count as pending.
+    counts = {row.category_id: row.count for row in rows}
+    as_of = {row.category_id: row.as_of for row in rows}
+    ended = Event.objects.filter(
+        end_date__gt=min(as_of.values()), end_date__lte=now,
+    ).values_list('category_id', 'end_date')
+    for category_id, end_date in ended:
+        if category_id in as_of and end_date > as_of[category_id]:
+            counts[category_id] -= 1
+
+    return {row.category.name: counts[row.category_id] for row in rows if counts[row.category_id] > 0}
+
+
+# ------------------------------
+# OUTCOME STATS
+# ------------------------------
+def _latest_outcome_at():
+    return Subquery(
+        Outcome.objects.filter(event=OuterRef('pk')).order_by('-created_at').values('created_at')[:1]
+    )
+
+
+def adjust_outcome_stats(event_id, delta, created_at=None):
+    """Apply one outcome added to (delta=1) or removed from (delta=-1) an event, in one UPDATE."""
+    if delta > 0:
+        latest = Greatest(Coalesce(F('last_outcome_at'), Value(created_at)), Value(created_at))
+    else:
+        # The removed outcome may have been the latest; take it from what is left.
+        latest = _latest_outcome_at()
+    Event.objects.filter(pk=event_id).update(outcome_count=F('outcome_count') + delta,
+                                             last_outcome_at=latest)
+
+
+def refresh_outcome_stats(event_ids=None):
+    """Recompute outcome stats from the outcome rows, for some events or all; returns rows updated."""
+    events = Event.objects.all() if event_ids is None else Event.objects.filter(pk__in=event_ids)
+    counts = (
+        Outcome.objects.filter(event=OuterRef('pk'))
+        .order_by().values('event').annotate(n=Count('pk')).values('n')
+    )
+    return events.update(outcome_count=Coalesce(Subquery(counts), 0),
+                         last_outcome_at=_latest_outcome_at())
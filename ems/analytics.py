@@ -0,0 +1,158 @@
+"""Outcome hours, outcome counts and event counts per time bucket.
+
+Buckets (week, month or quarter) and groups (project type, category or
+user) are computed in the database with ``Trunc*`` and ``GROUP BY``; Python
+only merges the two aggregate result sets (outcomes are bucketed by their
+``start_date``, events by theirs).
+
+Finished buckets are cached without expiry: a parameter set is split at the
+start of the current bucket and only the part from there on is recomputed
+per request. Writes that land before the current bucket of any granularity
+(back-dated outcomes, edited or deleted events and outcomes, bulk imports)
+and renamed categories or users call ``invalidate_history``, which retires
+every cached history at once.
+"""
+from datetime import date, datetime, time, timedelta
+
+from django.core.cache import cache
+from django.db.models import Count, DateField, F, Sum
+from django.db.models.functions import TruncMonth, TruncQuarter, TruncWeek
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+from .models import Event, Outcome
+
+BUCKETS = {
+    'week': TruncWeek,
+    'month': TruncMonth,
+    'quarter': TruncQuarter,
+}
+# Group name -> path from Event to the grouping value.
+GROUPS = {
+    'project_type': 'project_type',
+    'category': 'category__name',
+    'user': 'user__username',
+}
+DEFAULT_SPAN = timedelta(days=365)
+MAX_SPAN = timedelta(days=10 * 366)
+
+GENERATION_KEY = 'ems:analytics:generation'
+
+
+def bucket_start(bucket, day):
+    """First day of the ``bucket`` containing ``day``."""
+    if bucket == 'week':
+        return day - timedelta(days=day.weekday())
+    if bucket == 'month':
+        return day.replace(day=1)
+    return day.replace(month=(day.month - 1) // 3 * 3 + 1, day=1)
+
+
+def history_end(today=None):
+    """Start of the latest current bucket; anything before it is in some bucket size's history."""
+    today = today or timezone.localdate()
+    return max(bucket_start(bucket, today) for bucket in BUCKETS)
+
+
+def _local_midnight(day):
+    return datetime.combine(day, time.min, tzinfo=timezone.get_current_timezone())
+
+
+def parse_params(params, today=None):
+    """Validate request parameters; returns (bucket, group, first day, last day)."""
+    today = today or timezone.localdate()
+    bucket = params.get('bucket') or 'month'
+    group = params.get('group') or 'project_type'
+    if bucket not in BUCKETS:
+        raise ValueError(f"bucket must be one of: {', '.join(BUCKETS)}")
+    if group not in GROUPS:
+        raise ValueError(f"group must be one of: {', '.join(GROUPS)}")
+    try:
+        end = parse_date(params['end']) if params.get('end') else today
+        start = parse_date(params['start']) if params.get('start') else end - DEFAULT_SPAN
+    except ValueError:
+        end = start = None
+    if start is None or end is None:
+        raise ValueError("start and end must be dates (YYYY-MM-DD)")
+    if start > end:
+        raise ValueError("start must not be after end")
+    if end - start > MAX_SPAN:
+        raise ValueError("Requested range is too large")
+    return bucket, group, bucket_start(bucket, start), end
+
+
+def _aggregate(bucket, group, since, until):
+    """Rows for [since, until) keyed by (period, group value)."""
+    trunc = BUCKETS[bucket]
+    path = GROUPS[group]
+    lower, upper = _local_midnight(since), _local_midnight(until)
+    rows = {}
+    outcomes = (
+        Outcome.objects.filter(start_date__gte=lower, start_date__lt=upper)
+        .values(period=trunc('start_date', output_field=DateField()), key=F(f'event__{path}'))
+        .annotate(hours=Sum('duration'), outcomes=Count('id'))
+        .order_by()
+    )
+    for row in outcomes:
+        rows[row['period'], row['key']] = {'hours': row['hours'] or 0, 'outcomes': row['outcomes'], 'events': 0}
+    events = (
+        Event.objects.filter(start_date__gte=lower, start_date__lt=upper)
+        .values(period=trunc('start_date', output_field=DateField()), key=F(path))
+        .annotate(events=Count('id'))
+        .order_by()
+    )
+    for row in events:
+        entry = rows.setdefault((row['period'], row['key']), {'hours': 0, 'outcomes': 0, 'events': 0})
+        entry['events'] = row['events']
+    return [
+        {'period': period.isoformat(), 'group': key, 'hours': round(values['hours'], 2),
+         'outcomes': values['outcomes'], 'events': values['events']}
+        for (period, key), values in rows.items()
+    ]
+
+
+def _generation():
+    return cache.get_or_set(GENERATION_KEY, 1, None)
+
+
+def invalidate_history():
+    """Drop every cached finished bucket (after writes dated before the current buckets)."""
+    try:
+        cache.incr(GENERATION_KEY)
+    except ValueError:
+        cache.set(GENERATION_KEY, 1, None)
+
+
+def outcome_hours(bucket, group, start, end, today=None):
+    """Rows of hours/outcomes/events per (period, group) for days ``start``..``end``."""
+    today = today or timezone.localdate()
+    until = end + timedelta(days=1)
+    settled = min(until, bucket_start(bucket, today))
+
+    rows = []
+    if start < settled:
+        key = f"ems:analytics:{_generation()}:{bucket}:{group}:{start}:{settled}"
+        history = cache.get(key)
+        if history is None:
+            history = _aggregate(bucket, group, start, settled)
+            cache.set(key, history, None)
+        rows.extend(history)
+    if settled < until:
+        rows.extend(_aggregate(bucket, group, max(start, settled), until))
+    rows.sort(key=lambda row: (row['period'], str(row['group'])))
+    return rows
+
+
+def touches_history(value, today=None):
+    """Whether a stored date or datetime falls before the current buckets."""
+    if value is None:
+        return False
+    if isinstance(value, str):
+        value = Outcome._meta.get_field('start_date').to_python(value)
+    if isinstance(value, datetime):
+        if timezone.is_naive(value):
+            value = timezone.make_aware(value)
+        value = timezone.localdate(value)
+    elif not isinstance(value, date):
+        return True
+    return value < history_end(today)
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class EmsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'ems'
+
+    def ready(self):
+        # Register cache invalidation receivers.
+        from . import signals
@@ -0,0 +1,83 @@
+"""Async versions of the outcome endpoints.
+
+The timeline modal calls these on every click. Under ASGI (``platlog.asgi``)
+they wait on the database without holding a worker thread, so one process can
+serve many of them at once. ``ems.urls`` routes to them when
+``settings.EMS_ASYNC_OUTCOMES`` is set; responses match the sync views.
+"""
+from django.contrib.auth.decorators import login_required
+from django.db.models import Count, Max
+from django.http import Http404, JsonResponse
+from django.shortcuts import aget_object_or_404
+
+from .conditional import not_modified, set_validators, validators
+from . import pagination, serializers
+from .importers import OUTCOME_FIELDS
+from .models import Event, Outcome
+
+
+@login_required(login_url='login')
+async def outcome_list(request, event_id):
+    """Return a page of an event's outcomes, newest first (GET), or create new outcome (POST)."""
+    user = await request.auser()
+    events = Event.objects.filter(user=user)
+    if request.method == "GET":
+        events = events.annotate(outcomes_modified=Max('outcome_entries__updated_at'),
+                                 outcome_total=Count('outcome_entries'))
+    event = await aget_object_or_404(events, pk=event_id)
+
+    if request.method == "GET":
+        etag, last_modified = validators(event.outcomes_modified, event.outcome_total)
+        response = not_modified(request, etag, last_modified)
+        if response is not None:
+            return response
+        try:
+            after, size = pagination.page_params(request.GET)
+        except ValueError as exc:
+            return JsonResponse({"error": str(exc)}, status=400)
+        outcomes, next_cursor = await pagination.apaginate(
+            serializers.OUTCOME, event.outcome_entries.all(), 'created_at', after, size
+        )
+        return set_validators(JsonResponse({"outcomes": outcomes, "next_cursor": next_cursor}),
+                              etag, last_modified)
+
+    elif request.method == "POST":
+        outcome = await Outcome.objects.acreate(
+            event=event,
+            **{name: request.POST.get(name) for name in OUTCOME_FIELDS}
+        )
+        return JsonResponse({"status": "success", "id": outcome.id})
+
+    return JsonResponse({"error": "Invalid method"}, status=405)
+
+
+@login_required(login_url='login')
+async def outcome_detail(request, outcome_id):
+    """Return a single outcome for editing."""
+    user = await request.auser()
+    data = await serializers.OUTCOME_DETAIL.afirst(
+        Outcome.objects.filter(pk=outcome_id, event__user=user)
+    )
+    if data is None:
+        raise Http404("No Outcome matches the given query.")
+    etag, last_modified = validators(data.pop("updated_at"))
+    response = not_modified(request, etag, last_modified)
+    if response is not None:
+        return response
+    return set_validators(JsonResponse(data), etag, last_modified)
+
+
+@login_required(login_url='login')
+async def outcome_update(request, outcome_id):
+    """Update an existing outcome."""
+    user = await request.auser()
+    outcome = await aget_object_or_404(Outcome, pk=outcome_id, event__user=user)
+
+    if request.method != "POST":
+        return JsonResponse({"error": "Invalid method"}, status=405)
+
+    for name in OUTCOME_FIELDS:
+        setattr(outcome, name, request.POST.get(name))
+    await outcome.asave()
+
+    return JsonResponse({"status": "success"})
@@ -0,0 +1,20 @@
+"""Cache keys and invalidation for per-user payloads."""
+from django.conf import settings
+from django.core.cache import cache
+
+# Upper bound for how long a dashboard payload is reused. Entries are also
+# dropped on every write to the user's events/outcomes (see ems.signals).
+HOME_CACHE_TIMEOUT = getattr(settings, 'EMS_HOME_CACHE_TIMEOUT', 300)
+# The dashboard page itself carries no event data (that is home_data), so
+# browsers may reuse it for this long without asking.
+HOME_SHELL_MAX_AGE = getattr(settings, 'EMS_HOME_SHELL_MAX_AGE', 300)
+
+
+def home_cache_key(user_id):
+    return f"ems:home:{user_id}"
+
+
+def invalidate_home(user_id):
+    """Forget the cached dashboard payload of a user."""
+    if user_id is not None:
+        cache.delete(home_cache_key(user_id))
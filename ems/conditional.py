@@ -0,0 +1,44 @@
+"""ETag / Last-Modified validators for the JSON endpoints.
+
+Each endpoint derives its validators from a cheap aggregate over the rows it
+would serialise (the newest ``updated_at`` and a row count) instead of from
+the rendered body, so a ``304 Not Modified`` skips the main query as well as
+the serialisation. The count is folded into the ETag because deleting a row
+does not move the newest timestamp; ``If-None-Match`` takes precedence over
+``If-Modified-Since``, so clients that send both also notice deletions.
+"""
+import hashlib
+
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+
+
+def validators(last_modified, *parts):
+    """Return (ETag, Last-Modified timestamp) for a newest-change time and extra state."""
+    stamp = last_modified.timestamp() if last_modified else None
+    digest = hashlib.md5(repr((stamp, *parts)).encode(), usedforsecurity=False).hexdigest()
+    return quote_etag(digest), (int(stamp) if stamp is not None else None)
+
+
+def content_etag(body):
+    """ETag for a body that is built once and cached, such as the dashboard payload."""
+    if isinstance(body, str):
+        body = body.encode()
+    return quote_etag(hashlib.md5(body, usedforsecurity=False).hexdigest())
+
+
+def set_validators(response, etag, last_modified):
+    """Attach the validators; clients may store the response but must revalidate it."""
+    response.headers['ETag'] = etag
+    if last_modified is not None:
+        response.headers['Last-Modified'] = http_date(last_modified)
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+def not_modified(request, etag, last_modified):
+    """Return a 304 response if the client's copy is current, else None."""
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is not None:
+        set_validators(response, etag, last_modified)
+    return response
@@ -0,0 +1,128 @@
+"""Streaming export of events joined with their outcomes.
+
+Rows are read through a server-side cursor (``QuerySet.iterator``) and
+written out as they arrive, so an export never holds the full result set.
+
+* CSV has one row per outcome, with the event columns repeated; events
+  without outcomes get a single row with empty outcome columns.
+* NDJSON has one event object per line with its outcomes nested under
+  ``outcomes``; it can be loaded back with ``manage.py import_events``.
+"""
+import csv
+import json
+from datetime import datetime, time, timedelta
+from itertools import groupby
+
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+from .models import Event
+
+EVENT_COLUMNS = {
+    'event_id': 'event_id',
+    'user': 'user__username',
+    'category': 'category__name',
+    'name': 'name',
+    'project_type': 'project_type',
+    'start_date': 'start_date',
+    'end_date': 'end_date',
+    'description': 'description',
+    'location': 'location',
+    'organizer': 'organizer',
+    'participants': 'participants',
+}
+OUTCOME_COLUMNS = {
+    'start_date': 'outcome_entries__start_date',
+    'end_date': 'outcome_entries__end_date',
+    'duration': 'outcome_entries__duration',
+    'rappo': 'outcome_entries__rappo',
+    'topics': 'outcome_entries__topics',
+    'outcome_text': 'outcome_entries__outcome_text',
+    'recommendation': 'outcome_entries__recommendation',
+}
+CSV_HEADER = list(EVENT_COLUMNS) + [f"outcome_{name}" for name in OUTCOME_COLUMNS]
+FORMATS = {
+    'csv': 'text/csv',
+    'ndjson': 'application/x-ndjson',
+}
+CHUNK_SIZE = 2000
+
+
+def filter_events(user=None, category=None, project_type=None, start=None, end=None,
+                  awaiting_outcome=False):
+    """Build the export queryset; string arguments come straight from a request or CLI.
+
+    ``start``/``end`` are YYYY-MM-DD dates and select events overlapping the range;
+    ``awaiting_outcome`` keeps only events that ended without an outcome.
+    """
+    events = Event.objects.awaiting_outcome() if awaiting_outcome else Event.objects.all()
+    if user:
+        events = events.filter(user__username=user)
+    if category:
+        events = events.filter(category__name=category)
+    if project_type:
+        if project_type not in dict(Event.PROJECT_TYPES):
+            raise ValueError(f"Unknown project_type {project_type!r}")
+        events = events.filter(project_type=project_type)
+    tz = timezone.get_current_timezone()
+    if start:
+        day = parse_date(start)
+        if day is None:
+            raise ValueError("start must be a YYYY-MM-DD date")
+        events = events.filter(end_date__gte=datetime.combine(day, time.min, tzinfo=tz))
+    if end:
+        day = parse_date(end)
+        if day is None:
+            raise ValueError("end must be a YYYY-MM-DD date")
+        events = events.filter(start_date__lt=datetime.combine(day + timedelta(days=1), time.min, tzinfo=tz))
+    return events
+
+
+def _rows(events):
+    lookups = list(EVENT_COLUMNS.values()) + list(OUTCOME_COLUMNS.values())
+    return (
+        events.order_by('id', 'outcome_entries__start_date', 'outcome_entries__id')
+        .values_list('id', *lookups)
+        .iterator(chunk_size=CHUNK_SIZE)
+    )
+
+
+def _value(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return '' if value is None else value
+
+
+class _Echo:
+    """File-like object whose write() hands back the line instead of storing it."""
+
+    def write(self, value):
+        return value
+
+
+def iter_csv(events):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(CSV_HEADER)
+    for row in _rows(events):
+        yield writer.writerow([_value(v) for v in row[1:]])
+
+
+def iter_ndjson(events):
+    n_event = len(EVENT_COLUMNS)
+    for _, rows in groupby(_rows(events), key=lambda row: row[0]):
+        first = next(rows)
+        record = {name: _value(v) for name, v in zip(EVENT_COLUMNS, first[1:1 + n_event])}
+        record['outcomes'] = [
+            {name: _value(v) for name, v in zip(OUTCOME_COLUMNS, row[1 + n_event:])}
+            for row in (first, *rows)
+            if row[1 + n_event] is not None   # LEFT JOIN row of an event without outcomes
+        ]
+        yield json.dumps(record) + "\n"
+
+
+def iter_export(events, fmt):
+    if fmt == 'csv':
+        return iter_csv(events)
+    if fmt == 'ndjson':
+        return iter_ndjson(events)
+    raise ValueError(f"Unsupported format {fmt!r}")
@@ -0,0 +1,286 @@
+"""Streaming bulk import of events and outcomes from CSV or JSONL.
+
+Each record is an event or an outcome, told apart by a ``kind`` column/key
+(``event`` when missing)::
+
+    kind,event_id,user,category,name,project_type,start_date,end_date,...
+    event,EV-20240301-0001,alice,Workshops,Kickoff,kwp2,2024-03-01 09:00,2024-03-01 17:00,...
+    outcome,EV-20240301-0001,,,,,2024-03-01 09:00,2024-03-01 12:00,3,Bob,...
+
+Outcome records name their event through ``event_id``; in JSONL an event may
+also carry its outcomes inline under an ``outcomes`` list. Categories are
+matched by name and users by username. The file is read one record at a time
+and written in ``bulk_create`` batches, so memory use does not grow with the
+file; rows that fail are reported by line number and the load carries on.
+"""
+import csv
+import io
+import json
+from dataclasses import dataclass, field
+
+from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
+from django.db import DatabaseError, transaction
+from django.utils import timezone
+
+from . import analytics
+from .aggregates import reconcile_pending_counts, refresh_outcome_stats
+from .caching import invalidate_home
+from .models import Category, Event, Outcome
+from .participants import link_participants
+
+EVENT_FIELDS = ('name', 'project_type', 'start_date', 'end_date', 'description',
+                'location', 'organizer', 'participants')
+OUTCOME_FIELDS = ('start_date', 'end_date', 'duration', 'rappo', 'topics',
+                  'outcome_text', 'recommendation')
+# Left at the model default when empty, as the forms allow.
+OPTIONAL_FIELDS = {'description', 'location', 'organizer', 'participants',
+                   'topics', 'recommendation'}
+# FKs are resolved through the in-memory maps, not validated row by row.
+RELATED_FIELDS = ['user', 'category', 'event']
+
+MAX_REPORTED_ERRORS = 1000
+
+
+@dataclass
+class ImportResult:
+    events: int = 0
+    outcomes: int = 0
+    error_count: int = 0
+    errors: list = field(default_factory=list)
+
+    def add_error(self, line, message):
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append((line, message))
+
+
+def detect_format(filename):
+    return 'jsonl' if filename.lower().endswith(('.jsonl', '.ndjson', '.json')) else 'csv'
+
+
+def iter_records(stream, fmt):
+    """Yield (line number, record dict or None, error message) from a text stream."""
+    if fmt == 'csv':
+        reader = csv.DictReader(stream)
+        for record in reader:
+            yield reader.line_num, {k: v for k, v in record.items() if k}, None
+    elif fmt == 'jsonl':
+        for line_no, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as exc:
+                yield line_no, None, f"Invalid JSON: {exc}"
+                continue
+            if not isinstance(record, dict):
+                yield line_no, None, "Expected a JSON object"
+                continue
+            yield line_no, record, None
+    else:
+        raise ValueError(f"Unsupported format {fmt!r}")
+
+
+def clean_record(obj, record, fields):
+    """Copy record values onto a model instance and validate them."""
+    exclude = list(RELATED_FIELDS)
+    for name in fields:
+        value = record.get(name)
+        if isinstance(value, str):
+            value = value.strip()
+        if value in (None, '') and name in OPTIONAL_FIELDS:
+            exclude.append(name)
+            continue
+        setattr(obj, name, value)
+    obj.full_clean(exclude=exclude, validate_unique=False, validate_constraints=False)
+    for name in ('start_date', 'end_date'):
+        value = getattr(obj, name)
+        if timezone.is_naive(value):
+            setattr(obj, name, timezone.make_aware(value))
+    if obj.end_date < obj.start_date:
+        raise ValidationError("end_date is before start_date")
+
+
+def describe_error(exc):
+    if isinstance(exc, ValidationError) and hasattr(exc, 'message_dict'):
+        return "; ".join(f"{name}: {' '.join(msgs)}" for name, msgs in exc.message_dict.items())
+    if isinstance(exc, ValidationError):
+        return " ".join(exc.messages)
+    return str(exc)
+
+
+class EventImporter:
+    """Load event/outcome records in batches, collecting per-row errors."""
+
+    def __init__(self, default_user=None, batch_size=500):
+        self.default_user = default_user
+        self.batch_size = batch_size
+        self.result = ImportResult()
+        self.categories = dict(Category.objects.values_list('name', 'id'))
+        self.users = dict(User.objects.values_list('username', 'id'))
+        self.touched_users = set()
+        self._events = []     # (line, Event, generated id?)
+        self._outcomes = []   # (line, Outcome, event_id reference or parent Event)
+
+    def run(self, stream, fmt):
+        for line, record, error in iter_records(stream, fmt):
+            if error:
+                self.result.add_error(line, error)
+                continue
+            kind = (record.get('kind') or 'event').strip().lower()
+            if kind == 'event':
+                self.add_event(line, record)
+            elif kind == 'outcome':
+                self.add_outcome(line, record, record.get('event_id') or record.get('event'))
+            else:
+                self.result.add_error(line, f"Unknown kind {kind!r}")
+        self.flush()
+        self.finish()
+        return self.result
+
+    # ------------------------------
+    # RECORDS
+    # ------------------------------
+    def add_event(self, line, record):
+        try:
+            event = self.build_event(record)
+        except (ValidationError, ValueError, TypeError) as exc:
+            self.result.add_error(line, describe_error(exc))
+            return
+        generated = not record.get('event_id')
+        self._events.append((line, event, generated))
+        for outcome in record.get('outcomes') or []:
+            self.add_outcome(line, outcome, event)
+        if len(self._events) >= self.batch_size:
+            self.flush_events()
+
+    def build_event(self, record):
+        username = (record.get('user') or '').strip()
+        if username:
+            user_id = self.users.get(username)
+            if user_id is None:
+                raise ValueError(f"Unknown user {username!r}")
+        elif self.default_user is not None:
+            user_id = self.default_user.pk
+        else:
+            raise ValueError("user is required")
+
+        category_name = (record.get('category') or '').strip()
+        category_id = self.categories.get(category_name)
+        if category_id is None:
+            raise ValueError(f"Unknown category {category_name!r}")
+
+        # Blank ids are filled in by Event.objects.bulk_create, one query per batch.
+        event = Event(
+            user_id=user_id,
+            category_id=category_id,
+            event_id=(record.get('event_id') or '').strip(),
+        )
+        clean_record(event, record, EVENT_FIELDS)
+        return event
+
+    def add_outcome(self, line, record, event_ref):
+        if not isinstance(record, dict):
+            self.result.add_error(line, "Outcome must be an object")
+            return
+        if not event_ref:
+            self.result.add_error(line, "Outcome has no event_id")
+            return
+        outcome = Outcome()
+        try:
+            clean_record(outcome, record, OUTCOME_FIELDS)
+        except (ValidationError, ValueError, TypeError) as exc:
+            self.result.add_error(line, describe_error(exc))
+            return
+        self._outcomes.append((line, outcome, event_ref))
+        if len(self._outcomes) >= self.batch_size:
+            self.flush()
+
+    # ------------------------------
+    # BATCHES
+    # ------------------------------
+    def flush(self):
+        self.flush_events()
+        self.flush_outcomes()
+
+    def flush_events(self):
+        batch, self._events = self._events, []
+        if not batch:
+            return
+        created = self._insert(Event, batch)
+        link_participants(created, replace=False)
+        self.result.events += len(created)
+        self.touched_users.update(event.user_id for event in created)
+
+    def flush_outcomes(self):
+        batch, self._outcomes = self._outcomes, []
+        if not batch:
+            return
+        refs = {ref for _, _, ref in batch if isinstance(ref, str)}
+        owners = {
+            event_id: (pk, user_id)
+            for event_id, pk, user_id in Event.objects.filter(event_id__in=refs)
+            .values_list('event_id', 'id', 'user_id')
+        }
+        ready = []
+        for line, outcome, ref in batch:
+            if isinstance(ref, Event):
+                if ref.pk is None:
+                    self.result.add_error(line, "Outcome skipped: its event was not imported")
+                    continue
+                outcome.event_id, owner = ref.pk, ref.user_id
+            elif ref in owners:
+                outcome.event_id, owner = owners[ref]
+            else:
+                self.result.add_error(line, f"Unknown event {ref!r}")
+                continue
+            self.touched_users.add(owner)
+            ready.append((line, outcome, False))
+        created = self._insert(Outcome, ready)
+        refresh_outcome_stats({outcome.event_id for outcome in created})
+        self.result.outcomes += len(created)
+
+    def _insert(self, model, batch):
+        """Insert a batch in one transaction, isolating bad rows if it fails."""
+        try:
+            with transaction.atomic():
+                return model.objects.bulk_create([obj for _, obj, _ in batch])
+        except DatabaseError:
+            pass
+        created = []
+        for line, obj, generated in batch:
+            # A generated id can still clash with one supplied by an earlier import.
+            for attempt in range(5 if generated else 1):
+                if generated:
+                    # Draw afresh: numbers reserved by the failed batch may have been rolled back.
+                    obj.event_id = ''
+                try:
+                    with transaction.atomic():
+                        model.objects.bulk_create([obj])
+                    created.append(obj)
+                    break
+                except DatabaseError as exc:
+                    obj.pk = None
+                    error = exc
+            else:
+                self.result.add_error(line, f"Database error: {error}")
+        return created
+
+    def finish(self):
+        """Bring aggregates and caches that signals would have maintained up to date."""
+        if self.result.events:
+            reconcile_pending_counts()
+        if self.result.events or self.result.outcomes:
+            analytics.invalidate_history()
+        for user_id in self.touched_users:
+            invalidate_home(user_id)
+
+
+def import_file(fileobj, fmt, default_user=None, batch_size=500, encoding='utf-8-sig'):
+    """Import a binary file object; returns an ImportResult."""
+    stream = io.TextIOWrapper(fileobj, encoding=encoding, newline='')
+    try:
+        return EventImporter(default_user=default_user, batch_size=batch_size).run(stream, fmt)
+    finally:
+        stream.detach()
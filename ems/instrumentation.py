@@ -0,0 +1,148 @@
+"""Per-request metrics: DB queries, template render time and per-view counters.
+
+Metrics for the request being served live in a context variable, so they are
+collected correctly under threaded workers and for ORM calls that async code
+runs in worker threads. The per-view counters are kept in process memory;
+each gunicorn worker reports its own.
+"""
+import contextvars
+import threading
+import time
+
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+from django.template.backends.django import DjangoTemplates, Template
+
+# Requests slower than this are logged as structured "slow_request" lines.
+SLOW_REQUEST_MS = getattr(settings, 'EMS_SLOW_REQUEST_MS', 500)
+
+_current = contextvars.ContextVar('ems_request_metrics', default=None)
+
+
+class RequestMetrics:
+    __slots__ = ('started', 'db_queries', 'db_ms', 'template_ms')
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.db_queries = 0
+        self.db_ms = 0.0
+        self.template_ms = 0.0
+
+    @property
+    def total_ms(self):
+        return (time.perf_counter() - self.started) * 1000
+
+
+def start_request():
+    """Begin collecting metrics for the current request; returns (token, metrics)."""
+    install_query_recorder()
+    metrics = RequestMetrics()
+    return _current.set(metrics), metrics
+
+
+def end_request(token):
+    _current.reset(token)
+
+
+# ------------------------------
+# DATABASE
+# ------------------------------
+def record_query(execute, sql, params, many, context):
+    metrics = _current.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.db_queries += 1
+        metrics.db_ms += (time.perf_counter() - started) * 1000
+
+
+def _add_wrapper(connection):
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+def install_query_recorder():
+    """Attach the query recorder to this thread's connection wrappers."""
+    for connection in connections.all():
+        _add_wrapper(connection)
+
+
+@receiver(connection_created)
+def _connection_created(sender, connection, **kwargs):
+    # Connections opened by other threads (e.g. async ORM calls) are covered here.
+    _add_wrapper(connection)
+
+
+# ------------------------------
+# TEMPLATES
+# ------------------------------
+class TimedTemplate(Template):
+    def render(self, context=None, request=None):
+        metrics = _current.get()
+        if metrics is None:
+            return super().render(context, request)
+        started = time.perf_counter()
+        try:
+            return super().render(context, request)
+        finally:
+            metrics.template_ms += (time.perf_counter() - started) * 1000
+
+
+class TimedDjangoTemplates(DjangoTemplates):
+    """Django template backend that adds render time to the request metrics."""
+
+    def from_string(self, template_code):
+        return TimedTemplate(self.engine.from_string(template_code), self)
+
+    def get_template(self, template_name):
+        template = super().get_template(template_name)
+        return TimedTemplate(template.template, self)
+
+
+# ------------------------------
+# PER-VIEW COUNTERS
+# ------------------------------
+_lock = threading.Lock()
+_view_stats = {}
+
+
+def record_view(view_name, metrics, total_ms, size):
+    with _lock:
+        stats = _view_stats.setdefault(view_name, {
+            'requests': 0,
+            'total_ms': 0.0,
+            'max_ms': 0.0,
+            'db_queries': 0,
+            'db_ms': 0.0,
+            'template_ms': 0.0,
+            'bytes': 0,
+        })
+        stats['requests'] += 1
+        stats['total_ms'] += total_ms
+        stats['max_ms'] = max(stats['max_ms'], total_ms)
+        stats['db_queries'] += metrics.db_queries
+        stats['db_ms'] += metrics.db_ms
+        stats['template_ms'] += metrics.template_ms
+        stats['bytes'] += size or 0
+
+
+def view_stats():
+    """Return a snapshot of the counters with per-request averages."""
+    with _lock:
+        snapshot = {name: dict(stats) for name, stats in _view_stats.items()}
+    for stats in snapshot.values():
+        n = stats['requests']
+        stats['avg_ms'] = round(stats['total_ms'] / n, 2)
+        stats['avg_db_queries'] = round(stats['db_queries'] / n, 2)
+        stats['avg_bytes'] = round(stats['bytes'] / n)
+    return snapshot
+
+
+def reset_view_stats():
+    with _lock:
+        _view_stats.clear()
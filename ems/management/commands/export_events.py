@@ -0,0 +1,42 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ems.exporters import FORMATS, filter_events, iter_export
+from ems.models import Event
+
+
+class Command(BaseCommand):
+    help = "Stream events joined with their outcomes to a CSV or NDJSON file."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--format', choices=list(FORMATS), default='csv')
+        parser.add_argument('--output', '-o', help="File to write (default: stdout)")
+        parser.add_argument('--user', help="Only events owned by this username")
+        parser.add_argument('--category', help="Only events in this category (by name)")
+        parser.add_argument('--project-type', choices=[code for code, _ in Event.PROJECT_TYPES])
+        parser.add_argument('--start', help="Only events ending on or after this date (YYYY-MM-DD)")
+        parser.add_argument('--end', help="Only events starting on or before this date (YYYY-MM-DD)")
+        parser.add_argument('--awaiting-outcome', action='store_true',
+                            help="Only events that ended without an outcome")
+
+    def handle(self, *args, **options):
+        try:
+            events = filter_events(
+                user=options['user'],
+                category=options['category'],
+                project_type=options['project_type'],
+                start=options['start'],
+                end=options['end'],
+                awaiting_outcome=options['awaiting_outcome'],
+            )
+        except ValueError as exc:
+            raise CommandError(str(exc))
+
+        output = open(options['output'], 'w', newline='') if options['output'] else sys.stdout
+        try:
+            for chunk in iter_export(events, options['format']):
+                output.write(chunk)
+        finally:
+            if output is not sys.stdout:
+                output.close()
@@ -0,0 +1,40 @@
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from ems.importers import detect_format, import_file
+
+
+class Command(BaseCommand):
+    help = "Stream events and outcomes from a CSV or JSONL file into the database."
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="CSV or JSONL file to import")
+        parser.add_argument('--format', choices=['csv', 'jsonl'],
+                            help="File format (default: guessed from the extension)")
+        parser.add_argument('--user', help="Username owning events that do not name one")
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        default_user = None
+        if options['user']:
+            try:
+                default_user = User.objects.get(username=options['user'])
+            except User.DoesNotExist:
+                raise CommandError(f"Unknown user {options['user']!r}")
+
+        fmt = options['format'] or detect_format(options['path'])
+        try:
+            with open(options['path'], 'rb') as fileobj:
+                result = import_file(fileobj, fmt, default_user=default_user,
+                                     batch_size=options['batch_size'])
+        except OSError as exc:
+            raise CommandError(str(exc))
+
+        for line, message in result.errors:
+            self.stderr.write(f"line {line}: {message}")
+        if result.error_count > len(result.errors):
+            self.stderr.write(f"... {result.error_count - len(result.errors)} more errors")
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {result.events} events and {result.outcomes} outcomes "
+            f"({result.error_count} rows rejected)."
+        ))
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from ems.sync import TOMBSTONE_RETENTION, prune_tombstones
+
+
+class Command(BaseCommand):
+    help = "Delete tombstones of deleted events and outcomes past the delta-sync retention. Run daily."
+
+    def handle(self, *args, **options):
+        deleted = prune_tombstones()
+        self.stdout.write(self.style.SUCCESS(
+            f"Pruned {deleted} tombstones older than {TOMBSTONE_RETENTION.days} days."
+        ))
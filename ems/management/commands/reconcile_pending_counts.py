@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from ems.aggregates import reconcile_pending_counts
+
+
+class Command(BaseCommand):
+    help = "Recount pending events per category for the event chart. Run periodically."
+
+    def handle(self, *args, **options):
+        rows = reconcile_pending_counts()
+        self.stdout.write(self.style.SUCCESS(
+            f"Reconciled {len(rows)} categories, {sum(r.count for r in rows)} pending events."
+        ))
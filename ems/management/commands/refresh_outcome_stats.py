@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from ems.aggregates import refresh_outcome_stats
+from ems.models import Event
+
+
+class Command(BaseCommand):
+    help = "Recompute every event's outcome_count and last_outcome_at from its outcomes."
+
+    def add_arguments(self, parser):
+        parser.add_argument('event_ids', nargs='*', type=int, help="Only these events (pk); default all.")
+
+    def handle(self, *args, **options):
+        updated = refresh_outcome_stats(options['event_ids'] or None)
+        self.stdout.write(self.style.SUCCESS(
+            f"Refreshed {updated} events, {Event.objects.awaiting_outcome().count()} ended without an outcome."
+        ))
@@ -0,0 +1,73 @@
+import re
+import urllib.request
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+VENDOR_DIR = Path(__file__).resolve().parents[2] / 'static' / 'ems' / 'vendor'
+
+# Front-end libraries served from our own static files, by path under
+# ems/vendor/ (as used by {% vendor %}) -> pinned release URL. Run this once
+# after changing a pin and commit the files; the build only runs --check.
+VENDOR_ASSETS = {
+    'bootstrap/bootstrap.min.css':
+        'https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/dist/css/bootstrap.min.css',
+    'bootstrap/bootstrap.bundle.min.js':
+        'https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/dist/js/bootstrap.bundle.min.js',
+    'jquery/jquery.min.js':
+        'https://code.jquery.com/jquery-3.6.0.min.js',
+}
+
+# Pinned libraries not vendored yet; {% vendor %} links their release URL.
+# To vendor one, move it to VENDOR_ASSETS, run this command and commit the file.
+CDN_ASSETS = {
+    'chartjs/chart.umd.js':
+        'https://cdn.jsdelivr.net/npm/chart.js@4.4.1/dist/chart.umd.js',
+    'frappe-gantt/frappe-gantt.css':
+        'https://cdn.jsdelivr.net/npm/frappe-gantt@1.0.3/dist/frappe-gantt.css',
+    'frappe-gantt/frappe-gantt.umd.js':
+        'https://cdn.jsdelivr.net/npm/frappe-gantt@1.0.3/dist/frappe-gantt.umd.js',
+}
+
+SOURCE_MAP_COMMENT = re.compile(rb'(?://|/\*)# sourceMappingURL=[^\s*]+(?: ?\*/)?\s*$')
+
+
+def strip_source_map(content):
+    """Drop a trailing sourceMappingURL comment.
+
+    The maps are not vendored, and ManifestStaticFilesStorage refuses to
+    collect files referencing missing ones.
+    """
+    return SOURCE_MAP_COMMENT.sub(b'', content.rstrip()).rstrip() + b'\n'
+
+
+class Command(BaseCommand):
+    help = "Download the pinned front-end libraries into ems/static/ems/vendor/ (missing files only)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--force', action='store_true', help="Download every file again")
+        parser.add_argument('--check', action='store_true',
+                            help="Only report missing files; exit with an error if any are")
+
+    def handle(self, *args, **options):
+        missing = [path for path in VENDOR_ASSETS if options['force'] or not (VENDOR_DIR / path).exists()]
+        if options['check']:
+            if missing:
+                raise CommandError(f"Missing vendored assets: {', '.join(missing)}")
+            self.stdout.write(self.style.SUCCESS(f"All {len(VENDOR_ASSETS)} vendored assets present."))
+            return
+
+        for path in missing:
+            url = VENDOR_ASSETS[path]
+            try:
+                with urllib.request.urlopen(url, timeout=30) as response:
+                    content = response.read()
+            except OSError as exc:
+                raise CommandError(f"Could not download {url}: {exc}")
+            target = VENDOR_DIR / path
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(strip_source_map(content))
+            self.stdout.write(f"{path} <- {url}")
+        self.stdout.write(self.style.SUCCESS(
+            f"Downloaded {len(missing)} of {len(VENDOR_ASSETS)} vendored assets."
+        ))
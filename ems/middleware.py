@@ -0,0 +1,179 @@
+import json
+import logging
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.middleware.gzip import GZipMiddleware
+from django.utils.cache import patch_vary_headers
+from django.utils.regex_helper import _lazy_re_compile
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+from . import instrumentation
+
+try:
+    import brotli
+except ImportError:  # optional; responses fall back to gzip
+    brotli = None
+
+logger = logging.getLogger('ems.requests')
+
+
+class RequestInstrumentationMiddleware:
+    """Time each request and report it via Server-Timing, logs and per-view counters.
+
+    Place it first in MIDDLEWARE so session and auth queries are included.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        token, metrics = instrumentation.start_request()
+        try:
+            response = self.get_response(request)
+        finally:
+            instrumentation.end_request(token)
+        return self.finish(request, response, metrics)
+
+    async def __acall__(self, request):
+        token, metrics = instrumentation.start_request()
+        try:
+            response = await self.get_response(request)
+        finally:
+            instrumentation.end_request(token)
+        return self.finish(request, response, metrics)
+
+    def finish(self, request, response, metrics):
+        total_ms = metrics.total_ms
+        match = getattr(request, 'resolver_match', None)
+        view_name = match.view_name if match else '<unresolved>'
+        size = None if response.streaming else len(response.content)
+
+        response.headers['Server-Timing'] = ", ".join([
+            f'db;dur={metrics.db_ms:.1f};desc="{metrics.db_queries} queries"',
+            f'tpl;dur={metrics.template_ms:.1f}',
+            f'total;dur={total_ms:.1f}',
+        ])
+        instrumentation.record_view(view_name, metrics, total_ms, size)
+
+        if total_ms >= instrumentation.SLOW_REQUEST_MS:
+            record = {
+                'view': view_name,
+                'method': request.method,
+                'path': request.path,
+                'status': response.status_code,
+                'total_ms': round(total_ms, 1),
+                'db_queries': metrics.db_queries,
+                'db_ms': round(metrics.db_ms, 1),
+                'template_ms': round(metrics.template_ms, 1),
+                'bytes': size,
+            }
+            logger.warning("slow_request %s", json.dumps(record), extra={'request_metrics': record})
+        return response
+
+
+class StaticFilesMiddleware(WhiteNoiseMiddleware):
+    """WhiteNoise that can sit in an async middleware chain.
+
+    WhiteNoise 6 is sync-only, which makes Django run every request under ASGI
+    through a single thread-sensitive executor. Static files are looked up in
+    memory and served directly; everything else is awaited.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response=None, **kwargs):
+        super().__init__(get_response, **kwargs)
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        if self.autorefresh:
+            static_file = self.find_file(request.path_info)
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            return self.serve(static_file, request)
+        return await self.get_response(request)
+
+
+re_accepts_brotli = _lazy_re_compile(r"\bbr\b")
+
+
+class CompressionMiddleware(GZipMiddleware):
+    """Brotli (when installed and accepted) or gzip for text responses.
+
+    Only HTML, JSON, CSV and other text types are compressed, and buffered
+    responses only from ``EMS_COMPRESS_MIN_SIZE`` bytes; streaming responses
+    such as exports are always compressed, chunk by chunk. Place it below
+    StaticFilesMiddleware, which serves its own precompressed files.
+
+    HTML always gets gzip: it carries the CSRF token, and only GZipMiddleware
+    pads its output with random bytes against BREACH.
+    """
+
+    brotli_quality = 5   # fast enough for dynamic responses; 11 is for static assets
+    compressible_types = ('text/', 'application/json', 'application/x-ndjson',
+                          'application/javascript')
+
+    def process_response(self, request, response):
+        content_type = response.get('Content-Type', '')
+        if not content_type.startswith(self.compressible_types):
+            return response
+        min_size = getattr(settings, 'EMS_COMPRESS_MIN_SIZE', 1024)
+        if not response.streaming and len(response.content) < min_size:
+            return response
+        if brotli is None or response.has_header('Content-Encoding') or content_type.startswith('text/html'):
+            return super().process_response(request, response)
+        if not re_accepts_brotli.search(request.META.get('HTTP_ACCEPT_ENCODING', '')):
+            return super().process_response(request, response)
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+        if response.streaming:
+            if response.is_async:
+                response.streaming_content = self._abrotli(response.streaming_content)
+            else:
+                response.streaming_content = self._brotli(response.streaming_content)
+            del response.headers['Content-Length']
+        else:
+            compressed = brotli.compress(response.content, quality=self.brotli_quality)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response.headers['Content-Length'] = str(len(compressed))
+
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response.headers['ETag'] = 'W/' + etag
+        response.headers['Content-Encoding'] = 'br'
+        return response
+
+    def _brotli(self, chunks):
+        compressor = brotli.Compressor(quality=self.brotli_quality)
+        for chunk in chunks:
+            # Flush per chunk so clients receive rows as they are produced.
+            data = compressor.process(chunk) + compressor.flush()
+            if data:
+                yield data
+        yield compressor.finish()
+
+    async def _abrotli(self, chunks):
+        compressor = brotli.Compressor(quality=self.brotli_quality)
+        async for chunk in chunks:
+            data = compressor.process(chunk) + compressor.flush()
+            if data:
+                yield data
+        yield compressor.finish()
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.7 on 2026-10-17 19:54
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count
+from django.utils import timezone
+
+
+def seed_pending_counts(apps, schema_editor):
+    Category = apps.get_model('ems', 'Category')
+    Event = apps.get_model('ems', 'Event')
+    PendingEventCount = apps.get_model('ems', 'PendingEventCount')
+    now = timezone.now()
+    counts = dict(
+        Event.objects.filter(end_date__gt=now)
+        .values_list('category_id')
+        .annotate(count=Count('id'))
+        .order_by()
+    )
+    PendingEventCount.objects.bulk_create(
+        PendingEventCount(category_id=pk, count=counts.get(pk, 0), as_of=now)
+        for pk in Category.objects.values_list('id', flat=True)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ems', '0002_access_path_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PendingEventCount',
+            fields=[
+                ('category', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='pending_count', serialize=False, to='ems.category')),
+                ('count', models.IntegerField(default=0)),
+                ('as_of', models.DateTimeField()),
+            ],
+        ),
+        migrations.RunPython(seed_pending_counts, migrations.RunPython.noop),
+    ]
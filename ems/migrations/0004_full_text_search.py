@@ -0,0 +1,88 @@
+# Generated by Django 5.2.7 on 2026-10-17 19:58
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+# Weighted documents kept in search_vector by BEFORE INSERT/UPDATE triggers, so
+# every write path (forms, bulk_create, imports, raw updates) stays indexed.
+# The text search configuration must match ems.search.SEARCH_CONFIG.
+POSTGRES_FORWARD = [
+    """
+    CREATE FUNCTION ems_event_search_vector() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector :=
+            setweight(to_tsvector('english', coalesce(NEW.name, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(NEW.description, '')), 'B') ||
+            setweight(to_tsvector('english', coalesce(NEW.location, '')), 'C') ||
+            setweight(to_tsvector('english', coalesce(NEW.organizer, '')), 'C');
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER ems_event_search_vector_update
+    BEFORE INSERT OR UPDATE OF name, description, location, organizer ON ems_event
+    FOR EACH ROW EXECUTE FUNCTION ems_event_search_vector()
+    """,
+    """
+    CREATE FUNCTION ems_outcome_search_vector() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector :=
+            setweight(to_tsvector('english', coalesce(NEW.topics, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(NEW.outcome_text, '')), 'B') ||
+            setweight(to_tsvector('english', coalesce(NEW.recommendation, '')), 'B');
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER ems_outcome_search_vector_update
+    BEFORE INSERT OR UPDATE OF topics, outcome_text, recommendation ON ems_outcome
+    FOR EACH ROW EXECUTE FUNCTION ems_outcome_search_vector()
+    """,
+    # Backfill existing rows through the triggers.
+    "UPDATE ems_event SET name = name",
+    "UPDATE ems_outcome SET topics = topics",
+    "CREATE INDEX ems_event_search_idx ON ems_event USING gin (search_vector)",
+    "CREATE INDEX ems_outcome_search_idx ON ems_outcome USING gin (search_vector)",
+]
+
+POSTGRES_BACKWARD = [
+    "DROP INDEX IF EXISTS ems_outcome_search_idx",
+    "DROP INDEX IF EXISTS ems_event_search_idx",
+    "DROP TRIGGER IF EXISTS ems_outcome_search_vector_update ON ems_outcome",
+    "DROP FUNCTION IF EXISTS ems_outcome_search_vector()",
+    "DROP TRIGGER IF EXISTS ems_event_search_vector_update ON ems_event",
+    "DROP FUNCTION IF EXISTS ems_event_search_vector()",
+]
+
+
+def run_on_postgres(statements):
+    def run(apps, schema_editor):
+        # Other backends fall back to icontains matching in ems.search.
+        if schema_editor.connection.vendor != 'postgresql':
+            return
+        for statement in statements:
+            schema_editor.execute(statement)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ems', '0003_pending_event_count'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='outcome',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(run_on_postgres(POSTGRES_FORWARD), run_on_postgres(POSTGRES_BACKWARD)),
+    ]
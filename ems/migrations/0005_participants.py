@@ -0,0 +1,53 @@
+# Generated by Django 5.2.7 on 2026-10-17 19:58
+
+from django.db import migrations, models
+
+
+def backfill_attendees(apps, schema_editor):
+    Event = apps.get_model('ems', 'Event')
+    Participant = apps.get_model('ems', 'Participant')
+    Attendance = Event.attendees.through
+
+    def flush(batch):
+        names = {name for _, names in batch for name in names}
+        Participant.objects.bulk_create([Participant(name=n) for n in names], ignore_conflicts=True)
+        ids = dict(Participant.objects.filter(name__in=names).values_list('name', 'id'))
+        Attendance.objects.bulk_create(
+            [Attendance(event_id=pk, participant_id=ids[n]) for pk, names in batch for n in names],
+            ignore_conflicts=True,
+        )
+
+    batch = []
+    events = Event.objects.exclude(participants__isnull=True).exclude(participants='')
+    for pk, text in events.values_list('id', 'participants').iterator(chunk_size=500):
+        names = list(dict.fromkeys(n for n in (' '.join(raw.split())[:150] for raw in text.split(',')) if n))
+        if names:
+            batch.append((pk, names))
+        if len(batch) >= 500:
+            flush(batch)
+            batch = []
+    if batch:
+        flush(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ems', '0004_full_text_search'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Participant',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=150, unique=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='attendees',
+            field=models.ManyToManyField(blank=True, related_name='events', to='ems.participant'),
+        ),
+        migrations.RunPython(backfill_attendees, migrations.RunPython.noop),
+    ]
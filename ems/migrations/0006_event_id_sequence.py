@@ -0,0 +1,39 @@
+# Generated by Django 5.2.7 on 2026-10-17 20:08
+
+from django.db import migrations, models
+
+
+def create_sequence(apps, schema_editor):
+    # Other backends use the EventIdCounter row (see ems.models._next_event_numbers).
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute("CREATE SEQUENCE IF NOT EXISTS ems_event_id_seq")
+    else:
+        apps.get_model('ems', 'EventIdCounter').objects.get_or_create(pk=1)
+
+
+def drop_sequence(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute("DROP SEQUENCE IF EXISTS ems_event_id_seq")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ems', '0005_participants'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EventIdCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('value', models.BigIntegerField(default=0)),
+            ],
+        ),
+        migrations.AlterField(
+            model_name='event',
+            name='event_id',
+            field=models.CharField(blank=True, editable=False, help_text='e.g., EV-20251109-0042; assigned on save or bulk_create', max_length=20, unique=True),
+        ),
+        migrations.RunPython(create_sequence, drop_sequence),
+    ]
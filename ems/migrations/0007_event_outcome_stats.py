@@ -0,0 +1,44 @@
+# Generated by Django 5.2.7 on 2026-10-17 20:10
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_outcome_stats(apps, schema_editor):
+    Event = apps.get_model('ems', 'Event')
+    Outcome = apps.get_model('ems', 'Outcome')
+    outcomes = Outcome.objects.filter(event=OuterRef('pk'))
+    Event.objects.update(
+        outcome_count=Coalesce(Subquery(
+            outcomes.order_by().values('event').annotate(n=Count('pk')).values('n')
+        ), 0),
+        last_outcome_at=Subquery(outcomes.order_by('-created_at').values('created_at')[:1]),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ems', '0006_event_id_sequence'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='last_outcome_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='outcome_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(condition=models.Q(('outcome_count', 0)), fields=['end_date'], name='ems_event_no_outcome_idx'),
+        ),
+        migrations.RunPython(backfill_outcome_stats, migrations.RunPython.noop),
+    ]
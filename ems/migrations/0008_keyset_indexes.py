@@ -0,0 +1,31 @@
+# Generated by Django 5.2.7 on 2026-10-17 20:45
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ems', '0007_event_outcome_stats'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='event',
+            name='ems_event_category_start_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='outcome',
+            name='ems_outcome_event_created_idx',
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['category', '-start_date', '-id'], name='ems_event_category_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='outcome',
+            index=models.Index(fields=['event', 'created_at', 'id'], name='ems_outcome_event_created_idx'),
+        ),
+    ]
@@ -1,16 +1,75 @@
-from django.db import models
+from django.contrib.postgres.search import SearchVectorField
+from django.db import DEFAULT_DB_ALIAS, connections, models
 from django.contrib.auth.models import User
 from django.utils import timezone
-import uuid
+
+# PostgreSQL sequence behind event ids (migration 0006). nextval() never blocks
+# and never hands out a number twice, whichever worker or transaction asks.
+EVENT_ID_SEQUENCE = 'ems_event_id_seq'
+
+
+def _next_event_numbers(count, using=DEFAULT_DB_ALIAS):
+    """Reserve ``count`` event id numbers in one query."""
+    if count <= 0:
+        return []
+    connection = connections[using]
+    if connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT nextval(%s) FROM generate_series(1, %s)", [EVENT_ID_SEQUENCE, count])
+            return sorted(row[0] for row in cursor.fetchall())
+    # Other backends (SQLite in development) serialise writers, so a counter row
+    # bumped in a single statement is enough.
+    table = connection.ops.quote_name(EventIdCounter._meta.db_table)
+    with connection.cursor() as cursor:
+        cursor.execute(f"UPDATE {table} SET value = value + %s WHERE id = 1 RETURNING value", [count])
+        row = cursor.fetchone()
+    if row is None:   # row seeded by migration 0006 was removed, e.g. by a flush
+        EventIdCounter.objects.using(using).create(pk=1, value=count)
+        row = (count,)
+    return list(range(row[0] - count + 1, row[0] + 1))
+
+
+def generate_event_id(number=None):
+    """Return a new ``EV-YYYYMMDD-NNNN`` id; the number comes from a database sequence.
+
+    Ids generated before the sequence have three hex characters after the date
+    and so can never clash with the (at least four digit) sequence numbers.
+    """
+    if number is None:
+        number = _next_event_numbers(1)[0]
+    return f"EV-{timezone.now().strftime('%Y%m%d')}-{number:04d}"
+
+
+def assign_event_ids(events, using=DEFAULT_DB_ALIAS):
+    """Give every event without an event_id a new one, reserving numbers in one query."""
+    pending = [event for event in events if not event.event_id]
+    day = timezone.now().strftime('%Y%m%d')
+    for event, number in zip(pending, _next_event_numbers(len(pending), using)):
+        event.event_id = f"EV-{day}-{number:04d}"
+    return events
+
+
+class EventQuerySet(models.QuerySet):
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = assign_event_ids(list(objs), using=self.db)
+        return super().bulk_create(objs, *args, **kwargs)
+
+    def awaiting_outcome(self, now=None):
+        """Events that have ended without any outcome (served by ems_event_no_outcome_idx)."""
+        return self.filter(outcome_count=0, end_date__lt=now or timezone.now())
 
 
-def generate_event_id():
-    return f"EV-{timezone.now().strftime('%Y%m%d')}-{uuid.uuid4().hex[:3].upper()}"
 class Category(models.Model):
     name = models.CharField(max_length=100, unique=True)
     def __str__(self):
         return self.name
 
+class Participant(models.Model):
+    name = models.CharField(max_length=150, unique=True)
+
+    def __str__(self):
+        return self.name
+
 class Event(models.Model):
     PROJECT_TYPES = [
         ('kwp2', 'PROTECT WP2'),
@@ -22,12 +81,13 @@ class Event(models.Model):
     event_id = models.CharField(
         max_length=20,
         unique=True,
-        default=generate_event_id,
+        blank=True,
         editable=False,
-        help_text="e.g., EV-20251109-1A2"
+        help_text="e.g., EV-20251109-0042; assigned on save or bulk_create"
     )
 
-    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    # No index of its own: ems_event_user_start_idx leads with user.
+    user = models.ForeignKey(User, on_delete=models.CASCADE, db_index=False)
     name = models.CharField(max_length=150)
     category = models.ForeignKey(Category, on_delete=models.CASCADE)
     project_type = models.CharField(max_length=50, choices=PROJECT_TYPES)
@@ -37,15 +97,57 @@ class Event(models.Model):
     location = models.CharField(max_length=255, default='')
     organizer = models.CharField(max_length=100, default='')
     participants = models.TextField(blank=True, null=True, help_text="Comma-separated list of participants")
+    # Normalised copy of ``participants``, written by ems.participants.link_participants.
+    attendees = models.ManyToManyField(Participant, related_name='events', blank=True)
+    # Maintained by a PostgreSQL trigger (migration 0004); NULL on other backends.
+    search_vector = SearchVectorField(null=True, editable=False)
+    # Maintained by ems.signals on every Outcome write; bulk writers call
+    # ems.aggregates.refresh_outcome_stats, as does ``manage.py refresh_outcome_stats``.
+    outcome_count = models.PositiveIntegerField(default=0, editable=False)
+    last_outcome_at = models.DateTimeField(null=True, blank=True, editable=False)
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Written only through F()/subquery updates, never from an in-memory copy.
+    DERIVED_FIELDS = ('outcome_count', 'last_outcome_at')
+
+    objects = EventQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # home: a user's events in start order
+            models.Index(fields=['user', 'start_date'], name='ems_event_user_start_idx'),
+            # event_chart: future events grouped by category
+            models.Index(fields=['end_date', 'category'], name='ems_event_end_category_idx'),
+            # category_events: newest first within a category, keyset pages on (start_date, id)
+            models.Index(fields=['category', '-start_date', '-id'], name='ems_event_category_start_idx'),
+            # timeline: events overlapping a date window
+            models.Index(fields=['start_date', 'end_date'], name='ems_event_window_idx'),
+            # dashboard/admin/reports: events that ended without an outcome
+            models.Index(fields=['end_date'], condition=models.Q(outcome_count=0),
+                         name='ems_event_no_outcome_idx'),
+            # timeline delta sync: events saved since a watermark
+            models.Index(fields=['updated_at'], name='ems_event_updated_idx'),
+        ]
+
     def __str__(self):
             return f"{self.name} ({self.user.username})"
 
+    def save(self, *args, **kwargs):
+        if not self.event_id:
+            assign_event_ids([self], using=kwargs.get('using') or DEFAULT_DB_ALIAS)
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            # Don't write back outcome stats that may have changed since this copy was loaded.
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.DERIVED_FIELDS
+            ]
+        super().save(*args, **kwargs)
+
 class Outcome(models.Model):
-    event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name='outcome_entries')
+    # No index of its own: the (event, ...) indexes below lead with event.
+    event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name='outcome_entries', db_index=False)
     start_date = models.DateTimeField()
     end_date = models.DateTimeField()
     duration = models.FloatField(help_text="Duration in hours")
@@ -53,8 +155,75 @@ class Outcome(models.Model):
     topics = models.TextField()
     outcome_text = models.TextField()
     recommendation = models.TextField()
+    # Maintained by a PostgreSQL trigger (migration 0004); NULL on other backends.
+    search_vector = SearchVectorField(null=True, editable=False)
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            # outcome_list: keyset pages on (created_at, id) within an event
+            models.Index(fields=['event', 'created_at', 'id'], name='ems_outcome_event_created_idx'),
+            models.Index(fields=['event', 'start_date'], name='ems_outcome_event_start_idx'),
+            # timeline delta sync: outcomes saved since a watermark
+            models.Index(fields=['updated_at'], name='ems_outcome_updated_idx'),
+        ]
+
     def __str__(self):
         return f"Outcome for {self.event.name} ({self.start_date.date()})"
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Lets ems.signals notice an outcome moved to another event or date without a query.
+        instance._loaded_event_id = instance.__dict__.get('event_id')
+        instance._loaded_start_date = instance.__dict__.get('start_date')
+        return instance
+
+
+class PendingEventCount(models.Model):
+    """Events per category whose end_date is after ``as_of``.
+
+    Kept current by ems.signals on every Event write and rebuilt by the
+    ``reconcile_pending_counts`` command, which moves ``as_of`` forward.
+    Events that ended since ``as_of`` are subtracted at read time (see
+    ems.aggregates.pending_counts).
+    """
+    category = models.OneToOneField(Category, on_delete=models.CASCADE, primary_key=True,
+                                    related_name='pending_count')
+    count = models.IntegerField(default=0)
+    as_of = models.DateTimeField()
+
+    def __str__(self):
+        return f"{self.category_id}: {self.count} pending as of {self.as_of}"
+
+
+class Tombstone(models.Model):
+    """A deleted event or outcome, so delta-sync clients learn about it (see ems.sync).
+
+    Written by ems.signals on post_delete and pruned by the ``prune_tombstones``
+    command once older than ems.sync.TOMBSTONE_RETENTION.
+    """
+    EVENT = 'event'
+    OUTCOME = 'outcome'
+    KINDS = [(EVENT, 'Event'), (OUTCOME, 'Outcome')]
+
+    kind = models.CharField(max_length=10, choices=KINDS)
+    object_id = models.BigIntegerField()
+    # The deleted event itself, or the event a deleted outcome belonged to.
+    event_pk = models.BigIntegerField()
+    deleted_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['deleted_at'], name='ems_tombstone_deleted_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} {self.object_id} deleted {self.deleted_at}"
+
+
+class EventIdCounter(models.Model):
+    """Last event id number handed out, on backends without sequences (see _next_event_numbers)."""
+    value = models.BigIntegerField(default=0)
@@ -0,0 +1,177 @@
+"""Create and update many outcomes in one request.
+
+A batch is a list of outcome objects. Items with an ``id`` replace that
+outcome's fields, like ``outcome_update``; items with an ``event`` (the event
+pk) create a new outcome on it, like ``outcome_list`` POST::
+
+    {"outcomes": [
+        {"event": 12, "start_date": "2024-03-01 09:00", "end_date": "2024-03-01 12:00",
+         "duration": 3, "rappo": "Bob", "topics": "...", "outcome_text": "...",
+         "recommendation": "..."},
+        {"id": 40, "start_date": ..., ...}
+    ]}
+
+Every item is validated and ownership of all referenced events and outcomes
+is checked in a single query. Only if the whole batch is valid is it written,
+with one ``bulk_create`` and one ``bulk_update`` inside a transaction.
+"""
+from dataclasses import dataclass, field
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import DateTimeField, IntegerField, Value
+from django.utils import timezone
+
+from . import analytics
+from .aggregates import refresh_outcome_stats
+from .caching import invalidate_home
+from .importers import OUTCOME_FIELDS, clean_record, describe_error
+from .models import Event, Outcome
+
+MAX_BATCH_SIZE = 500
+
+
+@dataclass
+class BatchResult:
+    results: list = field(default_factory=list)
+    created: int = 0
+    updated: int = 0
+    errors: int = 0
+
+    @property
+    def ok(self):
+        return not self.errors
+
+    def as_dict(self):
+        return {
+            'created': self.created,
+            'updated': self.updated,
+            'errors': self.errors,
+            'results': self.results,
+        }
+
+
+def _reference(value):
+    """Parse an id/event reference; bools are rejected although they are ints."""
+    if isinstance(value, bool):
+        raise ValueError
+    return int(value)
+
+
+def _owned(user, event_ids, outcome_ids):
+    """Return (owned event pks, {outcome pk: (event pk, stored start_date)}) for the user, in one query."""
+    parts = []
+    if event_ids:
+        parts.append(
+            Event.objects.filter(user=user, pk__in=event_ids)
+            .values_list('pk', Value(None, output_field=IntegerField()),
+                         Value(None, output_field=DateTimeField()))
+        )
+    if outcome_ids:
+        parts.append(
+            Outcome.objects.filter(event__user=user, pk__in=outcome_ids)
+            .values_list('event_id', 'pk', 'start_date')
+        )
+    if not parts:
+        return set(), {}
+    rows = parts[0].union(*parts[1:], all=True) if len(parts) > 1 else parts[0]
+    events, outcomes = set(), {}
+    for event_id, outcome_id, start_date in rows:
+        if outcome_id is None:
+            events.add(event_id)
+        else:
+            outcomes[outcome_id] = (event_id, start_date)
+    return events, outcomes
+
+
+def apply_outcome_batch(user, items):
+    """Validate and write a batch for ``user``; returns a BatchResult.
+
+    Nothing is written unless every item is valid.
+    """
+    result = BatchResult()
+    parsed = []   # (index, item, outcome pk or None, event pk or None)
+    for index, item in enumerate(items):
+        if not isinstance(item, dict):
+            parsed.append((index, None, None, None))
+            continue
+        try:
+            if item.get('id') is not None:
+                parsed.append((index, item, _reference(item['id']), None))
+            else:
+                parsed.append((index, item, None, _reference(item.get('event'))))
+        except (TypeError, ValueError):
+            parsed.append((index, None, None, None))
+
+    owned_events, owned_outcomes = _owned(
+        user,
+        {event_id for _, _, _, event_id in parsed if event_id is not None},
+        {outcome_id for _, _, outcome_id, _ in parsed if outcome_id is not None},
+    )
+
+    to_create, to_update, seen = [], [], set()
+    for index, item, outcome_id, event_id in parsed:
+        entry = {'index': index}
+        result.results.append(entry)
+        if item is None:
+            error = "Each outcome needs an integer 'id' (update) or 'event' (create)"
+        elif outcome_id is not None and outcome_id not in owned_outcomes:
+            error = f"Outcome {outcome_id} not found"
+        elif outcome_id is not None and outcome_id in seen:
+            error = f"Outcome {outcome_id} appears more than once"
+        elif event_id is not None and event_id not in owned_events:
+            error = f"Event {event_id} not found"
+        else:
+            error = None
+            if outcome_id is not None:
+                seen.add(outcome_id)
+                outcome = Outcome(pk=outcome_id, event_id=owned_outcomes[outcome_id][0])
+                # As if loaded, for the analytics check below.
+                outcome._loaded_start_date = owned_outcomes[outcome_id][1]
+            else:
+                outcome = Outcome(event_id=event_id)
+            try:
+                clean_record(outcome, item, OUTCOME_FIELDS)
+            except (ValidationError, ValueError, TypeError) as exc:
+                error = describe_error(exc)
+        if error:
+            entry.update(status='error', error=error)
+            result.errors += 1
+        elif outcome_id is not None:
+            to_update.append((entry, outcome))
+        else:
+            to_create.append((entry, outcome))
+
+    if not result.ok:
+        for entry in result.results:
+            entry.setdefault('status', 'skipped')
+        return result
+
+    now = timezone.now()
+    with transaction.atomic():
+        if to_create:
+            Outcome.objects.bulk_create([outcome for _, outcome in to_create])
+            refresh_outcome_stats({outcome.event_id for _, outcome in to_create})
+        if to_update:
+            for _, outcome in to_update:
+                outcome.updated_at = now
+            Outcome.objects.bulk_update(
+                [outcome for _, outcome in to_update],
+                [*OUTCOME_FIELDS, 'updated_at'],
+            )
+    for entry, outcome in to_create:
+        entry.update(status='created', id=outcome.pk)
+    for entry, outcome in to_update:
+        entry.update(status='updated', id=outcome.pk)
+    result.created, result.updated = len(to_create), len(to_update)
+
+    # Bulk writes skip the save signals that keep the home page and analytics
+    # caches fresh (the outcome stats were refreshed above, inside the transaction).
+    # Like outcome_analytics, only dates before the current buckets retire history.
+    invalidate_home(user.pk)
+    written = [outcome for _, outcome in to_create + to_update]
+    if any(analytics.touches_history(outcome.start_date)
+           or analytics.touches_history(getattr(outcome, '_loaded_start_date', None))
+           for outcome in written):
+        analytics.invalidate_history()
+    return result
@@ -0,0 +1,82 @@
+"""Keyset (cursor) pagination, newest first, over ``(timestamp, id)``.
+
+A page after the key ``(t, id)`` is fetched with::
+
+    WHERE field <= t AND (field < t OR id < last id)
+    ORDER BY field DESC, id DESC LIMIT size + 1
+
+The first condition is redundant but lets the database start the scan of the
+(parent, field, id) index at the cursor, so every page costs one index seek plus
+``size + 1`` rows; ``OFFSET`` would read and discard all earlier rows first.
+The extra row only tells whether there is a next page.
+
+Clients get the key of a page's last row as an opaque URL-safe cursor and send
+it back as ``?cursor=``. Unlike an offset it stays correct while rows are added
+or deleted in between.
+"""
+import base64
+import binascii
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+
+DEFAULT_PAGE_SIZE = 25
+MAX_PAGE_SIZE = 100
+
+
+def encode_cursor(value, pk):
+    """Cursor pointing just after the row keyed ``(value, pk)``."""
+    raw = f"{value.isoformat()}|{pk}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """The ``(value, pk)`` key of a cursor; ValueError if it is not one of ours."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode()
+        value, pk = raw.rsplit('|', 1)
+        key = parse_datetime(value), int(pk)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError("Invalid cursor") from None
+    if key[0] is None:
+        raise ValueError("Invalid cursor")
+    return key
+
+
+def page_params(params, default_size=DEFAULT_PAGE_SIZE):
+    """Validate ``cursor`` and ``limit``; returns (cursor key or None, page size)."""
+    try:
+        size = int(params.get('limit') or default_size)
+    except ValueError:
+        raise ValueError("limit must be an integer") from None
+    if not 1 <= size <= MAX_PAGE_SIZE:
+        raise ValueError(f"limit must be between 1 and {MAX_PAGE_SIZE}")
+    cursor = params.get('cursor')
+    return (decode_cursor(cursor) if cursor else None), size
+
+
+def _page_rows(projection, queryset, field, after, size):
+    if after is not None:
+        value, pk = after
+        queryset = queryset.filter(
+            Q(**{f'{field}__lte': value}),
+            Q(**{f'{field}__lt': value}) | Q(pk__lt=pk),
+        )
+    # The key columns go last, after the projection's own; format() ignores them.
+    return queryset.order_by(f'-{field}', '-pk').values_list(*projection.columns, field, 'pk')[:size + 1]
+
+
+def _page(projection, rows, size):
+    cursor = encode_cursor(*rows[size - 1][-2:]) if len(rows) > size else None
+    return projection.format_all(rows[:size]), cursor
+
+
+def paginate(projection, queryset, field, after=None, size=DEFAULT_PAGE_SIZE):
+    """One page of ``queryset`` through ``projection``: (items, next cursor or None)."""
+    return _page(projection, list(_page_rows(projection, queryset, field, after, size)), size)
+
+
+async def apaginate(projection, queryset, field, after=None, size=DEFAULT_PAGE_SIZE):
+    """Async ``paginate``."""
+    rows = [row async for row in _page_rows(projection, queryset, field, after, size)]
+    return _page(projection, rows, size)
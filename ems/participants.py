@@ -0,0 +1,50 @@
+"""Normalised participants, parsed from the comma-separated Event.participants text."""
+from .models import Event, Participant
+
+MAX_NAME_LENGTH = Participant._meta.get_field('name').max_length
+
+
+def parse_participants(text):
+    """Split a comma-separated list into unique, whitespace-normalised names."""
+    names = []
+    for raw in (text or '').split(','):
+        name = ' '.join(raw.split())[:MAX_NAME_LENGTH]
+        if name and name not in names:
+            names.append(name)
+    return names
+
+
+def resolve_participants(names):
+    """Return {name: participant id}, creating the participants that are missing."""
+    names = set(names)
+    ids = dict(Participant.objects.filter(name__in=names).values_list('name', 'id'))
+    missing = names - ids.keys()
+    if missing:
+        Participant.objects.bulk_create(
+            [Participant(name=name) for name in missing], ignore_conflicts=True,
+        )
+        ids.update(Participant.objects.filter(name__in=missing).values_list('name', 'id'))
+    return ids
+
+
+def link_participants(events, replace=True):
+    """Write the attendees of saved events from their ``participants`` text.
+
+    Runs a fixed number of queries however many events are passed, so bulk
+    writers can call it once per batch. ``replace=False`` skips clearing
+    existing links, for events that were just created.
+    """
+    names_by_event = {event.pk: parse_participants(event.participants) for event in events}
+    ids = resolve_participants(name for names in names_by_event.values() for name in names)
+
+    Attendance = Event.attendees.through
+    if replace:
+        Attendance.objects.filter(event_id__in=names_by_event).delete()
+    Attendance.objects.bulk_create(
+        [
+            Attendance(event_id=event_id, participant_id=ids[name])
+            for event_id, names in names_by_event.items()
+            for name in names
+        ],
+        ignore_conflicts=True,
+    )
@@ -0,0 +1,83 @@
+"""Ranked search over events and their outcomes.
+
+On PostgreSQL this uses the ``search_vector`` columns (kept current by
+triggers, GIN-indexed). Other backends, such as a local SQLite database,
+fall back to ``icontains`` matching of every search term, newest first.
+"""
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import connection
+from django.db.models import Exists, F, FloatField, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from .models import Event, Outcome
+
+# Must match the configuration used by the triggers in migration 0004.
+SEARCH_CONFIG = 'english'
+
+EVENT_TEXT_FIELDS = ('name', 'description', 'location', 'organizer')
+OUTCOME_TEXT_FIELDS = ('topics', 'outcome_text', 'recommendation')
+
+
+def search_events(query, events=None, also=None):
+    """Filter ``events`` to those matching ``query``, best matches first.
+
+    Events match on their own text or on the text of any of their outcomes.
+    ``also`` is an optional Q of further matches, for fields outside the
+    search vector; those rank below any text match. The result is annotated
+    with ``rank``.
+    """
+    events = Event.objects.all() if events is None else events
+    if connection.vendor == 'postgresql':
+        return _search_postgres(query, events, also)
+    return _search_fallback(query, events, also)
+
+
+def match_events(query, events=None):
+    """Filter ``events`` to those matching ``query``, without ranking or reordering."""
+    events = Event.objects.all() if events is None else events
+    if connection.vendor == 'postgresql':
+        search = SearchQuery(query, config=SEARCH_CONFIG, search_type='websearch')
+        matching_outcomes = Outcome.objects.filter(event=OuterRef('pk'), search_vector=search)
+        return events.filter(Q(search_vector=search) | Exists(matching_outcomes))
+    return _match_fallback(query, events)
+
+
+def _search_postgres(query, events, also=None):
+    search = SearchQuery(query, config=SEARCH_CONFIG, search_type='websearch')
+    matching_outcomes = Outcome.objects.filter(event=OuterRef('pk'), search_vector=search)
+    best_outcome_rank = Subquery(
+        matching_outcomes.annotate(rank=SearchRank(F('search_vector'), search))
+        .order_by('-rank')
+        .values('rank')[:1],
+        output_field=FloatField(),
+    )
+    match = Q(search_vector=search) | Exists(matching_outcomes)
+    if also is not None:
+        match |= also
+    return (
+        events.filter(match)
+        .annotate(rank=(
+            Coalesce(SearchRank(F('search_vector'), search), Value(0.0))
+            + Coalesce(best_outcome_rank, Value(0.0))
+        ))
+        .order_by('-rank', '-start_date')
+    )
+
+
+def _match_fallback(query, events):
+    for term in query.split():
+        outcome_match = Q()
+        for name in OUTCOME_TEXT_FIELDS:
+            outcome_match |= Q(**{f"{name}__icontains": term})
+        match = Exists(Outcome.objects.filter(outcome_match, event=OuterRef('pk')))
+        for name in EVENT_TEXT_FIELDS:
+            match |= Q(**{f"{name}__icontains": term})
+        events = events.filter(match)
+    return events
+
+
+def _search_fallback(query, events, also=None):
+    matches = _match_fallback(query, events)
+    if also is not None:
+        matches = events.filter(Q(pk__in=matches.values('pk')) | also)
+    return matches.annotate(rank=Value(0.0)).order_by('-start_date')
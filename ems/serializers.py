@@ -0,0 +1,165 @@
+"""Projection-based serialisation for the JSON endpoints and list pages.
+
+A ``Projection`` maps output keys to the column each one is read from and an
+optional formatter::
+
+    TIMELINE_EVENT = Projection(
+        id=('id', str),
+        name=('name', default('Unnamed')),
+        start_date=('start_date', iso_date),
+        outcome_count='outcome_count',
+    )
+    TIMELINE_EVENT.serialize(Event.objects.filter(user=user))
+
+Rows come from ``values_list()`` on exactly the projected columns, so no model
+instances are built and unused TextFields are never loaded. Formatters are
+bound once when the projection is defined; per row there is one tuple read
+and one call per formatted field. Columns without a formatter pass through
+unchanged (``JsonResponse`` encodes datetimes itself, templates format them).
+
+The projections used by ``ems.views`` and ``ems.async_views`` are defined at
+the bottom of this module.
+"""
+from .importers import OUTCOME_FIELDS
+from .models import Event
+
+
+def iso_date(value):
+    """Calendar date of a datetime as YYYY-MM-DD, or "" if unset."""
+    return value.date().isoformat() if value else ""
+
+
+def default(fallback):
+    """Formatter replacing empty values with ``fallback``."""
+    def format_value(value):
+        return value or fallback
+    return format_value
+
+
+def choice_label(field):
+    """Formatter returning the display label of a model field's choice."""
+    labels = {value: str(label) for value, label in field.flatchoices}
+
+    def format_value(value):
+        return labels.get(value, value)
+    return format_value
+
+
+def rounded(digits):
+    """Formatter rounding a number to ``digits`` places."""
+    def format_value(value):
+        return round(value, digits)
+    return format_value
+
+
+class Projection:
+    """Output keys, each read from a column through an optional formatter."""
+
+    def __init__(self, **fields):
+        self.fields = {}
+        for key, spec in fields.items():
+            source, formatter = (spec, None) if isinstance(spec, str) else spec
+            self.fields[key] = (source, formatter)
+        # Several keys may read the same column (a value and its label).
+        self.columns = tuple(dict.fromkeys(source for source, _ in self.fields.values()))
+        index = {source: position for position, source in enumerate(self.columns)}
+        self._steps = tuple(
+            (key, index[source], formatter) for key, (source, formatter) in self.fields.items()
+        )
+
+    def extend(self, **fields):
+        """A new projection with extra (or replaced) keys."""
+        return Projection(**{**self.fields, **fields})
+
+    def rows(self, queryset):
+        """The queryset as raw tuples of ``columns``, for callers needing unformatted values."""
+        return queryset.values_list(*self.columns)
+
+    def format(self, row):
+        """One raw row as a dict."""
+        return {
+            key: row[position] if formatter is None else formatter(row[position])
+            for key, position, formatter in self._steps
+        }
+
+    def format_all(self, rows):
+        """Raw rows as a list of dicts."""
+        format_row = self.format
+        return [format_row(row) for row in rows]
+
+    def serialize(self, queryset):
+        """Evaluate ``queryset`` and return a list of dicts."""
+        return self.format_all(self.rows(queryset))
+
+    async def aserialize(self, queryset):
+        """Async ``serialize``."""
+        return self.format_all([row async for row in self.rows(queryset)])
+
+    def first(self, queryset):
+        """The first row as a dict, or None."""
+        row = self.rows(queryset).first()
+        return None if row is None else self.format(row)
+
+    async def afirst(self, queryset):
+        """Async ``first``."""
+        row = await self.rows(queryset).afirst()
+        return None if row is None else self.format(row)
+
+
+# ------------------------------
+# PROJECTIONS
+# ------------------------------
+project_type_label = choice_label(Event._meta.get_field('project_type'))
+
+# Event bars and search hits on the timeline.
+EVENT_CARD = Projection(
+    id=('id', str),
+    name=('name', default("Unnamed")),
+    project_type=('project_type', default('other')),
+    start_date=('start_date', iso_date),
+    end_date=('end_date', iso_date),
+    description=('description', default('')),
+    organizer=('organizer', default('')),
+)
+TIMELINE_EVENT = EVENT_CARD.extend(outcome_count='outcome_count')
+SEARCH_RESULT = EVENT_CARD.extend(rank=('rank', rounded(4)))
+
+# Dashboard rows; is_upcoming and is_pending are annotated by the home view.
+HOME_EVENT = Projection(
+    id='id',
+    name=('name', default("Unnamed")),
+    project_type=('project_type', default("other")),
+    description=('description', default("")),
+    organizer=('organizer', default("")),
+    start_date=('start_date', iso_date),
+    end_date=('end_date', iso_date),
+    outcome_count='outcome_count',
+    is_upcoming='is_upcoming',
+    is_pending='is_pending',
+)
+
+PARTICIPANT_EVENT = Projection(
+    id='id',
+    event_id='event_id',
+    name='name',
+    project_type='project_type',
+    start_date=('start_date', iso_date),
+    end_date=('end_date', iso_date),
+)
+
+# Rows of the category page; dates stay datetimes for the template filters.
+CATEGORY_EVENT = Projection(
+    id='id',
+    name='name',
+    project_type_label=('project_type', project_type_label),
+    start_date='start_date',
+    end_date='end_date',
+    description='description',
+    location='location',
+    organizer='organizer',
+)
+
+OUTCOME = Projection(id='id', **{name: name for name in OUTCOME_FIELDS})
+# With the timestamp outcome_detail derives its validators from; pop it before responding.
+OUTCOME_DETAIL = OUTCOME.extend(updated_at='updated_at')
+CATEGORY_OUTCOME = OUTCOME.extend(event_id='event_id')
@@ -0,0 +1,195 @@
+import weakref
+
+from django.contrib.auth.models import User
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from . import analytics
+from .aggregates import adjust_outcome_stats, adjust_pending_count, refresh_outcome_stats
+from .caching import invalidate_home
+from .models import Category, Event, Outcome, Tombstone
+
+
+# Events already handled per queryset delete, so a bulk delete does its
+# per-event work once rather than once per outcome.
+_deleted_events = weakref.WeakKeyDictionary()
+
+
+def _event_owner_id(event_id):
+    """Return the user id owning an event, if it still exists."""
+    return Event.objects.filter(pk=event_id).values_list('user_id', flat=True).first()
+
+
+def _outcome_owner_id(outcome):
+    """Return the user id owning an outcome's event, if the event still exists."""
+    if Outcome.event.is_cached(outcome):
+        return outcome.event.user_id
+    return _event_owner_id(outcome.event_id)
+
+
+def _cascaded(origin):
+    """Whether an outcome is being deleted along with its event, not on its own."""
+    return not (isinstance(origin, Outcome) or getattr(origin, 'model', None) is Outcome)
+
+
+def _first_for_event(origin, event_id, purpose):
+    """Whether this is the first outcome of its event deleted by ``origin`` for ``purpose``.
+
+    The collector deletes every row before sending post_delete, so work done
+    for the first outcome already sees what the delete leaves behind.
+    """
+    if isinstance(origin, Outcome):
+        return True
+    seen = _deleted_events.setdefault(origin, {}).setdefault(purpose, set())
+    if event_id in seen:
+        return False
+    seen.add(event_id)
+    return True
+
+
+@receiver(pre_save, sender=Event)
+def remember_event_state(sender, instance, **kwargs):
+    # Where the event was counted before this save, for the pending aggregate
+    # (_stored_state) and for analytics (_stored_grouping).
+    instance._stored_state = instance._stored_grouping = None
+    if instance.pk is not None:
+        stored = (
+            Event.objects.filter(pk=instance.pk)
+            .values_list('category_id', 'end_date', 'project_type', 'user_id', 'start_date')
+            .first()
+        )
+        if stored is not None:
+            instance._stored_state = stored[:2]
+            instance._stored_grouping = (stored[0], *stored[2:])
+
+
+@receiver(post_save, sender=Event)
+def event_saved(sender, instance, **kwargs):
+    invalidate_home(instance.user_id)
+
+    stored = getattr(instance, '_stored_state', None)
+    # Views assign the raw form value, so normalise it like the save did.
+    end_date = Event._meta.get_field('end_date').get_prep_value(instance.end_date)
+    current = (instance.category_id, end_date)
+    if stored != current:
+        if stored is not None:
+            adjust_pending_count(*stored, delta=-1)
+        adjust_pending_count(*current, delta=1)
+
+
+@receiver(post_delete, sender=Event)
+def event_deleted(sender, instance, **kwargs):
+    invalidate_home(instance.user_id)
+    adjust_pending_count(instance.category_id, instance.end_date, delta=-1)
+
+
+@receiver(post_save, sender=Event)
+def event_saved_analytics(sender, instance, created, **kwargs):
+    # Finished analytics buckets change when a past event appears, or when an
+    # event is regrouped or moved (taking its outcomes along); not on other edits.
+    stored = getattr(instance, '_stored_grouping', None)
+    if stored is None:
+        changed = analytics.touches_history(instance.start_date)
+    else:
+        start_date = Event._meta.get_field('start_date').get_prep_value(instance.start_date)
+        changed = stored != (instance.category_id, instance.project_type, instance.user_id, start_date)
+    if changed:
+        analytics.invalidate_history()
+
+
+@receiver(post_delete, sender=Event)
+def event_deleted_analytics(sender, instance, **kwargs):
+    # Its outcomes are covered by outcome_analytics as they cascade.
+    if analytics.touches_history(instance.start_date):
+        analytics.invalidate_history()
+
+
+# The labels analytics groups by (analytics.GROUPS); cached history shows them.
+_GROUP_LABELS = {Category: 'name', User: 'username'}
+
+
+@receiver(pre_save, sender=Category)
+@receiver(pre_save, sender=User)
+def remember_group_label(sender, instance, update_fields=None, **kwargs):
+    field = _GROUP_LABELS[sender]
+    instance._stored_label = None
+    # Logins save last_login alone; no need to look the label up then.
+    if instance.pk is None or (update_fields is not None and field not in update_fields):
+        return
+    instance._stored_label = (
+        sender.objects.filter(pk=instance.pk).values_list(field, flat=True).first()
+    )
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_save, sender=User)
+def group_label_saved(sender, instance, **kwargs):
+    stored = getattr(instance, '_stored_label', None)
+    if stored is not None and stored != getattr(instance, _GROUP_LABELS[sender]):
+        analytics.invalidate_history()
+
+
+@receiver(post_save, sender=Outcome)
+def outcome_saved(sender, instance, **kwargs):
+    # Runs before count_saved_outcome, which moves _loaded_event_id on.
+    owner_id = _outcome_owner_id(instance)
+    invalidate_home(owner_id)
+    previous = getattr(instance, '_loaded_event_id', instance.event_id)
+    if previous != instance.event_id:
+        previous_owner_id = _event_owner_id(previous)
+        if previous_owner_id != owner_id:
+            invalidate_home(previous_owner_id)
+
+
+@receiver(post_delete, sender=Outcome)
+def outcome_deleted(sender, instance, origin=None, **kwargs):
+    # Outcomes deleted along with their event: event_deleted covers the owner.
+    if _cascaded(origin) or not _first_for_event(origin, instance.event_id, 'home'):
+        return
+    invalidate_home(_outcome_owner_id(instance))
+
+
+@receiver(post_save, sender=Outcome)
+def count_saved_outcome(sender, instance, created, **kwargs):
+    # Instances built by hand (not loaded) are assumed to stay on their event.
+    previous = getattr(instance, '_loaded_event_id', instance.event_id)
+    if created:
+        adjust_outcome_stats(instance.event_id, 1, instance.created_at)
+    elif previous != instance.event_id:
+        adjust_outcome_stats(previous, -1)
+        adjust_outcome_stats(instance.event_id, 1, instance.created_at)
+    instance._loaded_event_id = instance.event_id
+
+
+@receiver(post_save, sender=Outcome)
+@receiver(post_delete, sender=Outcome)
+def outcome_analytics(sender, instance, **kwargs):
+    previous = getattr(instance, '_loaded_start_date', None)
+    if analytics.touches_history(instance.start_date) or analytics.touches_history(previous):
+        analytics.invalidate_history()
+    instance._loaded_start_date = instance.start_date
+
+
+@receiver(post_delete, sender=Outcome)
+def count_deleted_outcome(sender, instance, origin=None, **kwargs):
+    # Outcomes deleted along with their event take its stats with them.
+    if _cascaded(origin):
+        return
+    if isinstance(origin, Outcome):
+        adjust_outcome_stats(instance.event_id, -1)
+    elif _first_for_event(origin, instance.event_id, 'stats'):
+        refresh_outcome_stats([instance.event_id])
+
+
+@receiver(post_delete, sender=Event)
+@receiver(post_delete, sender=Outcome)
+def record_tombstone(sender, instance, origin=None, **kwargs):
+    # For ems.sync. Outcomes deleted along with their event need none: the
+    # client drops the whole event.
+    if sender is Outcome and _cascaded(origin):
+        return
+    Tombstone.objects.create(
+        kind=Tombstone.EVENT if sender is Event else Tombstone.OUTCOME,
+        object_id=instance.pk,
+        event_pk=instance.pk if sender is Event else instance.event_id,
+    )
@@ -0,0 +1,419 @@
+// Loaded with defer after jQuery and frappe-gantt; URLs come from the script tag.
+const TIMELINE_DATA_URL = document.currentScript.dataset.dataUrl;
+const TIMELINE_CHANGES_URL = document.currentScript.dataset.changesUrl;
+const SNAPSHOT_KEY = 'ems.timeline.v1';
+const FILTER_NAMES = ['q', 'project_type', 'category', 'owner', 'from', 'to'];
+const EDGE_THRESHOLD = 80; // px from either edge before the next window is fetched
+
+let logs = [];
+const loadedIds = new Set();
+let viewMode = 'Day';
+let loadedStart = null;   // ISO date strings of the window covered so far
+let loadedEnd = null;
+let earlierEnd = null;    // window bounds reaching the nearest matches outside it (null: none)
+let laterStart = null;
+let filters = urlFilters();
+let loading = false;
+let gantt;
+let watermark = null;     // server time the loaded copy is current as of (see ems.sync)
+
+function toTask(l) {
+  return {
+    id: String(l.id),
+    name: l.name || "Event",
+    start: new Date(l.start_date),
+    end: new Date(l.end_date),
+    progress: 100,
+    custom_class: (l.project_type || "general").toLowerCase()
+  };
+}
+
+function placeholderTask() {
+  const today = new Date();
+  const weekStart = new Date(today);
+  weekStart.setDate(today.getDate() - ((today.getDay() + 6) % 7));
+  const weekEnd = new Date(weekStart);
+  weekEnd.setDate(weekStart.getDate() + 6);
+  return {
+    id: "placeholder",
+    name: "No Activities Logged Yet",
+    start: weekStart,
+    end: weekEnd,
+    progress: 100,
+    custom_class: "placeholder"
+  };
+}
+
+function buildTasks(list) {
+  return list.length ? list.map(toTask) : [placeholderTask()];
+}
+
+function mergeEvents(events) {
+  events.forEach(l => {
+    if (!loadedIds.has(l.id)) {
+      loadedIds.add(l.id);
+      logs.push(l);
+    }
+  });
+  logs.sort((a, b) => a.start_date.localeCompare(b.start_date));
+}
+
+// GET JSON sending back the ETag/Last-Modified last seen for the URL (jQuery's
+// ifModified); on 304 Not Modified the copy kept here is reused.
+const jsonCache = {};
+function getConditionalJSON(url) {
+  return $.ajax({url: url, dataType: 'json', ifModified: true}).then((data, status) => {
+    if (status === 'notmodified' && url in jsonCache) return jsonCache[url];
+    jsonCache[url] = data;
+    return data;
+  });
+}
+
+// Filter state comes from the page URL and is sent with every window request.
+function urlFilters() {
+  const params = new URLSearchParams(window.location.search);
+  const out = {};
+  FILTER_NAMES.forEach(name => { if (params.get(name)) out[name] = params.get(name); });
+  return out;
+}
+
+function fetchWindow(params) {
+  const query = new URLSearchParams(Object.assign({view_mode: viewMode}, filters, params));
+  return getConditionalJSON(`${TIMELINE_DATA_URL}?${query}`).then(data => {
+    mergeEvents(data.events);
+    if (loadedStart === null || data.start < loadedStart) {
+      loadedStart = data.start;
+      earlierEnd = data.earlier_end;
+    }
+    if (loadedEnd === null || data.end > loadedEnd) {
+      loadedEnd = data.end;
+      laterStart = data.later_start;
+    }
+    saveSnapshot();
+    return data;
+  });
+}
+
+// The loaded events and window bounds are kept in localStorage, so the next
+// visit shows them at once and only asks the server what changed since.
+function filterKey() {
+  return new URLSearchParams(Object.entries(filters).sort()).toString();
+}
+
+function saveSnapshot() {
+  if (!watermark) return;
+  try {
+    localStorage.setItem(SNAPSHOT_KEY, JSON.stringify({
+      filters: filterKey(), watermark, logs, loadedStart, loadedEnd, earlierEnd, laterStart
+    }));
+  } catch (e) {
+    // Storage full or disabled: the next visit loads from the server.
+  }
+}
+
+function restoreSnapshot() {
+  let saved = null;
+  try {
+    saved = JSON.parse(localStorage.getItem(SNAPSHOT_KEY));
+  } catch (e) {}
+  if (!saved || saved.filters !== filterKey() || !saved.watermark) return false;
+  ({watermark, loadedStart, loadedEnd, earlierEnd, laterStart} = saved);
+  logs = [];
+  loadedIds.clear();
+  mergeEvents(saved.logs);
+  return true;
+}
+
+// Events changed since the watermark replace their loaded copies (and may lie
+// outside the loaded window); deleted ones, or ones no longer matching, go.
+function applyChanges(data) {
+  const replaced = new Set(data.deleted.concat(data.events.map(l => l.id)));
+  logs = logs.filter(l => !replaced.has(l.id));
+  replaced.forEach(id => loadedIds.delete(id));
+  mergeEvents(data.events);
+}
+
+function fetchChanges() {
+  const query = new URLSearchParams(Object.assign({}, filters, watermark ? {since: watermark} : {}));
+  return $.getJSON(`${TIMELINE_CHANGES_URL}?${query}`).then(data => {
+    watermark = data.watermark;
+    if (!data.reset) {
+      applyChanges(data);
+      saveSnapshot();
+    }
+    return data;
+  });
+}
+
+// Take a watermark first, then load the window around today: whatever changes
+// after the watermark is picked up by the next fetchChanges().
+function loadFresh() {
+  logs = [];
+  loadedIds.clear();
+  loadedStart = loadedEnd = earlierEnd = laterStart = watermark = null;
+  return fetchChanges().then(() => fetchWindow({}));
+}
+
+function loadEvents() {
+  if (!restoreSnapshot()) return loadFresh();
+  return fetchChanges().then(data => {
+    const today = new Date().toISOString().slice(0, 10);
+    // A saved window away from today would leave a gap; start over instead.
+    if (data.reset || today < loadedStart || today >= loadedEnd) return loadFresh();
+    return data;
+  });
+}
+
+function scrollElement() {
+  return document.querySelector('#gantt .gantt-container') || document.getElementById('gantt');
+}
+
+// Date currently at the left edge of the viewport, so a refresh keeps the user in place.
+function visibleDate() {
+  const el = scrollElement();
+  if (!gantt || !gantt.gantt_start || !el.scrollWidth) return null;
+  const start = new Date(gantt.gantt_start), end = new Date(gantt.gantt_end);
+  return new Date(start.getTime() + (el.scrollLeft / el.scrollWidth) * (end - start));
+}
+
+function scrollToDate(date, center) {
+  const el = scrollElement();
+  if (!gantt || !gantt.gantt_start || !date) return;
+  const start = new Date(gantt.gantt_start), end = new Date(gantt.gantt_end);
+  const x = ((date - start) / (end - start)) * el.scrollWidth;
+  el.scrollLeft = center ? x - el.clientWidth / 2 : x;
+}
+
+function refreshGantt() {
+  const anchor = visibleDate();
+  gantt.refresh(buildTasks(logs));
+  scrollToDate(anchor, false);
+  renderEventSummaries(logs);
+}
+
+// Fetch the window holding the nearest match in one direction; the server says where it is.
+function loadMore(direction) {
+  if (loading) return;
+  const bound = direction === 'earlier' ? earlierEnd : laterStart;
+  if (!bound) return;
+  loading = true;
+  const before = logs.length;
+  const params = direction === 'earlier' ? {end: bound} : {start: bound};
+  fetchWindow(params).then(() => {
+    loading = false;
+    if (logs.length > before) {
+      refreshGantt();
+    } else {
+      loadMore(direction);
+    }
+  }, () => { loading = false; });
+}
+
+function onGanttScroll() {
+  const el = scrollElement();
+  if (el.scrollLeft < EDGE_THRESHOLD) {
+    loadMore('earlier');
+  } else if (el.scrollLeft + el.clientWidth > el.scrollWidth - EDGE_THRESHOLD) {
+    loadMore('later');
+  }
+}
+
+function initGantt() {
+  gantt = new Gantt("#gantt", buildTasks(logs), {
+    view_mode: viewMode,
+    date_format: 'YYYY-MM-DD',
+    on_click: task => task.id !== "placeholder" && openOutcomesModal(task.id, task.name),
+    custom_popup_html: task => `
+      <div class="p-3 bg-white rounded shadow-sm">
+        <h6 class="fw-bold mb-2">${task.name}</h6>
+        <p class="mb-1"><strong>Start:</strong> ${task.start.toISOString().split('T')[0]}</p>
+        <p class="mb-2"><strong>End:</strong> ${task.end.toISOString().split('T')[0]}</p>
+        <button class='btn btn-sm btn-outline-primary w-100' onclick="openOutcomesModal('${task.id}', '${task.name}')">View/Add Outcomes</button>
+      </div>`
+  });
+
+  // Scroll to today line
+  const today = new Date();
+  scrollToDate(today, true);
+  const el = scrollElement();
+  const todayX = gantt.gantt_start && gantt.gantt_end
+    ? ((today - new Date(gantt.gantt_start)) / (new Date(gantt.gantt_end) - new Date(gantt.gantt_start))) * el.scrollWidth
+    : 0;
+  if(todayX>0){
+    const todayLine = document.createElement('div');
+    todayLine.id='today-line';
+    todayLine.style.left = `${todayX}px`;
+    document.getElementById('gantt-container').appendChild(todayLine);
+  }
+  el.addEventListener('scroll', onGanttScroll, {passive: true});
+  renderEventSummaries(logs);
+}
+
+loadEvents().then(initGantt, () => {
+  document.getElementById('gantt').innerHTML = '<p class="p-3 text-danger">Could not load events.</p>';
+});
+
+// Render Event Summary Cards
+function renderEventSummaries(logs){
+  const container = document.getElementById('event-cards');
+  container.innerHTML='';
+  logs.forEach(l => {
+    const box = document.createElement('div');
+    box.className = l.project_type || 'other';
+    box.innerHTML = `
+      <h6 class="fw-bold text-primary mb-2">${l.name}</h6>
+      <p>${l.description || 'No description'}</p>
+      <p><strong>Organizer:</strong> ${l.organizer || 'N/A'}</p>
+    `;
+    box.addEventListener('click', ()=>openOutcomesModal(l.id, l.name));
+    container.appendChild(box);
+  });
+}
+
+// Gantt view buttons: wider modes cover more time, so widen the loaded window too.
+const setView = (mode, activeBtnId) => {
+  viewMode = mode;
+  gantt?.change_view_mode(mode);
+  ['view-day','view-week','view-month'].forEach(id=>{
+    const btn = document.getElementById(id);
+    if(btn){ 
+      btn.classList.toggle('btn-primary', id===activeBtnId); 
+      btn.classList.toggle('btn-outline-primary', id!==activeBtnId); 
+    }
+  });
+  if (gantt) {
+    const before = logs.length;
+    $.when(fetchWindow({end: loadedStart}), fetchWindow({start: loadedEnd})).then(() => {
+      if (logs.length > before) refreshGantt();
+    });
+  }
+};
+document.getElementById('view-day')?.addEventListener('click',()=>setView('Day','view-day'));
+document.getElementById('view-week')?.addEventListener('click',()=>setView('Week','view-week'));
+document.getElementById('view-month')?.addEventListener('click',()=>setView('Month','view-month'));
+
+// Outcome Modal
+let modalOutcomes = [];   // pages loaded so far for the open event, newest first
+
+function fetchOutcomes(eventId, cursor) {
+  const query = cursor ? `?${new URLSearchParams({cursor: cursor})}` : '';
+  return getConditionalJSON(`/events/${eventId}/outcomes/${query}`);
+}
+
+function renderOutcomes(eventId, data, append) {
+  modalOutcomes = append ? modalOutcomes.concat(data.outcomes) : data.outcomes;
+  if(!modalOutcomes.length){
+    $("#outcomesList").html("<p>No outcomes logged for this event...</p>");
+    return;
+  }
+  let html = '<ul class="list-group">';
+  modalOutcomes.forEach(o => {
+    html += `<li class="list-group-item" data-id="${o.id}" style="cursor:pointer;">
+      <strong>${o.outcome_text}</strong> (by ${o.rappo})<br>
+      <em>Topics:</em> ${o.topics || '-'} | <em>Recommendation:</em> ${o.recommendation || '-'}
+    </li>`;
+  });
+  html += '</ul>';
+  if (data.next_cursor) {
+    html += '<button type="button" id="loadMoreOutcomes" class="btn btn-outline-primary btn-sm mt-2">Load more</button>';
+  }
+  $("#outcomesList").html(html);
+
+  $("#outcomesList li").click(function(){
+    const o = modalOutcomes.find(x=>x.id==$(this).data("id"));
+    if(o){
+      $("#outcomeId").val(o.id);
+      $("#start_date").val(o.start_date);
+      $("#end_date").val(o.end_date);
+      $("#duration").val(o.duration);
+      $("#rappo").val(o.rappo);
+      $("#topics").val(o.topics);
+      $("#outcome_text").val(o.outcome_text);
+      $("#recommendation").val(o.recommendation);
+    }
+  });
+  $("#loadMoreOutcomes").click(function(){
+    $(this).prop('disabled', true);
+    fetchOutcomes(eventId, data.next_cursor)
+      .done(more => renderOutcomes(eventId, more, true))
+      .fail(() => { $(this).prop('disabled', false); alert("Could not load more outcomes"); });
+  });
+}
+
+function openOutcomesModal(eventId, eventName){
+  $("#modalEventTitle").text(eventName);
+  $("#eventId").val(eventId);
+  $("#outcomeId").val("");
+  $("#newOutcomeForm")[0].reset();
+  $("#outcomesList").html("Loading...");
+
+  fetchOutcomes(eventId).done(function(data){
+    renderOutcomes(eventId, data, false);
+    new bootstrap.Modal(document.getElementById('outcomeModal')).show();
+  });
+}
+// Swap in the events matching the new filters (saved copy or fresh load).
+function reloadEvents() {
+  loadEvents().then(() => {
+    gantt.refresh(buildTasks(logs));
+    renderEventSummaries(logs);
+    scrollToDate(logs.length ? new Date(logs[0].start_date) : new Date(), true);
+  }, () => alert("Could not load events"));
+}
+
+function applyFilters(next) {
+  filters = next;
+  const form = document.getElementById('timelineFilters');
+  FILTER_NAMES.forEach(name => { form.elements[name].value = filters[name] || ''; });
+  reloadEvents();
+}
+
+// Filters update the URL (so it can be shared or bookmarked) instead of reloading the page.
+$('#timelineFilters').on('submit', function(e){
+  e.preventDefault();
+  const next = {};
+  FILTER_NAMES.forEach(name => {
+    const value = this.elements[name].value.trim();
+    if (value) next[name] = value;
+  });
+  history.pushState(null, '', `${window.location.pathname}?${new URLSearchParams(next)}`);
+  applyFilters(next);
+});
+$('#clearFilters').on('click', function(e){
+  e.preventDefault();
+  history.pushState(null, '', window.location.pathname);
+  applyFilters({});
+});
+window.addEventListener('popstate', () => applyFilters(urlFilters()));
+
+
+// Submit Outcome (create or update)
+$('#newOutcomeForm').on('submit', function(e){
+  e.preventDefault();
+  const eventId = $("#eventId").val();
+  const outcomeId = $("#outcomeId").val(); // hidden input to store existing outcome ID if editing
+
+  const url = outcomeId 
+    ? `/outcomes/${outcomeId}/update/`   // Update existing outcome
+    : `/events/${eventId}/outcomes/`;    // Create new outcome
+  $.post(url, {
+    csrfmiddlewaretoken: $('[name=csrfmiddlewaretoken]').val(),
+    start_date: $("#start_date").val(),
+    end_date: $("#end_date").val(),
+    duration: $("#duration").val(),
+    rappo: $("#rappo").val(),
+    topics: $("#topics").val(),
+    outcome_text: $("#outcome_text").val(),
+    recommendation: $("#recommendation").val(),
+    outcome_id: outcomeId // include this for update
+  }).done(() => {
+    // Stay on the page with its filters and window: pick the outcome count up
+    // from the changes feed and refresh the modal's list.
+    $("#outcomeId").val("");
+    $("#newOutcomeForm")[0].reset();
+    fetchOutcomes(eventId).done(data => renderOutcomes(eventId, data, false));
+    fetchChanges().then(data => data.reset ? reloadEvents() : refreshGantt(),
+                        () => alert("Could not refresh events"));
+  }).fail(() => alert("Error adding/updating outcome"));
+});
+
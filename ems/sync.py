@@ -0,0 +1,60 @@
+"""Changes since a watermark, for clients keeping a local copy of the timeline.
+
+An event counts as changed when it was saved (``Event.updated_at``) or when
+one of its outcomes was saved or deleted, since that moves its outcome count
+(``Outcome.updated_at``, outcome tombstones). Deleted events are reported from
+their tombstones, which ems.signals writes on ``post_delete`` and
+``prune_tombstones`` removes after ``TOMBSTONE_RETENTION``; a watermark older
+than that can no longer be answered and the client reloads instead.
+
+Rows are stamped when written but only become visible when their transaction
+commits, so changes are looked up from ``COMMIT_LAG`` before the watermark.
+Clients apply changes idempotently; the overlap only re-sends a few rows.
+"""
+from datetime import timedelta
+
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .models import Event, Outcome, Tombstone
+
+TOMBSTONE_RETENTION = timedelta(days=30)
+COMMIT_LAG = timedelta(minutes=1)
+# Beyond this many changed events a full reload is cheaper than a delta.
+MAX_CHANGES = 500
+
+
+def parse_watermark(value):
+    """The watermark a client sent back, or None if it sent none."""
+    if not value:
+        return None
+    try:
+        watermark = parse_datetime(value)
+    except ValueError:
+        watermark = None
+    if watermark is None or timezone.is_naive(watermark):
+        raise ValueError("since must be a watermark returned by this endpoint")
+    return watermark
+
+
+def expired(since, now=None):
+    """Whether tombstones from ``since`` on may already have been pruned."""
+    return since < (now or timezone.now()) - TOMBSTONE_RETENTION + COMMIT_LAG
+
+
+def changed_events(since):
+    """(ids of events changed since ``since``, ids of events deleted since then)."""
+    since = since - COMMIT_LAG
+    changed = set(Event.objects.filter(updated_at__gt=since).values_list('pk', flat=True))
+    changed.update(Outcome.objects.filter(updated_at__gt=since).values_list('event_id', flat=True))
+    deleted = set()
+    for kind, event_pk in Tombstone.objects.filter(deleted_at__gt=since).values_list('kind', 'event_pk'):
+        (deleted if kind == Tombstone.EVENT else changed).add(event_pk)
+    return changed - deleted, deleted
+
+
+def prune_tombstones(now=None):
+    """Delete tombstones older than the retention period; returns how many."""
+    cutoff = (now or timezone.now()) - TOMBSTONE_RETENTION
+    deleted, _ = Tombstone.objects.filter(deleted_at__lt=cutoff).delete()
+    return deleted
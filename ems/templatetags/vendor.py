@@ -0,0 +1,14 @@
+from django import template
+from django.templatetags.static import static
+
+from ..management.commands.vendor_assets import CDN_ASSETS, VENDOR_ASSETS
+
+register = template.Library()
+
+
+@register.simple_tag
+def vendor(path):
+    """URL of a pinned front-end library: our static copy, or its release URL until vendored."""
+    if path in VENDOR_ASSETS:
+        return static(f'ems/vendor/{path}')
+    return CDN_ASSETS[path]
@@ -0,0 +1,74 @@
+"""Bulk seeding helpers for tests that need realistically sized data."""
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.utils import timezone
+
+from ems.aggregates import reconcile_pending_counts, refresh_outcome_stats
+from ems.analytics import invalidate_history
+from ems.models import Category, Event, Outcome
+from ems.participants import link_participants
+
+
+def seed_dataset(users=3, events_per_user=10, outcomes_per_event=2, categories=5,
+                 history_days=4 * 365, future_days=90, prefix='seed'):
+    """Create users × events × outcomes spread over past and upcoming dates.
+
+    Rows are written with ``bulk_create`` so thousands of events stay cheap to
+    set up; like any bulk writer, it then reconciles the maintained aggregates.
+    Returns the created users, categories and events.
+    """
+    now = timezone.now()
+    user_objs = User.objects.bulk_create(
+        User(username=f"{prefix}-user-{i}") for i in range(users)
+    )
+    category_objs = Category.objects.bulk_create(
+        Category(name=f"{prefix}-programme-{i}") for i in range(categories)
+    )
+
+    project_types = [code for code, _ in Event.PROJECT_TYPES]
+    span = history_days + future_days
+    events = []
+    for u, user in enumerate(user_objs):
+        for i in range(events_per_user):
+            n = u * events_per_user + i
+            # Spread start dates evenly so most events lie in the past.
+            start = now - timedelta(days=history_days) + timedelta(days=span * i / events_per_user)
+            events.append(Event(
+                event_id=f"EV-{prefix[:4].upper()}-{n:07d}",
+                user=user,
+                name=f"{prefix} event {n}",
+                category=category_objs[n % categories],
+                project_type=project_types[n % len(project_types)],
+                start_date=start,
+                end_date=start + timedelta(days=1 + n % 3),
+                description=f"Description of event {n}",
+                location="Nairobi",
+                organizer=f"Organizer {n % 7}",
+                participants="Alice, Bob",
+            ))
+    events = Event.objects.bulk_create(events, batch_size=500)
+    link_participants(events, replace=False)
+
+    Outcome.objects.bulk_create(
+        (
+            Outcome(
+                event=event,
+                start_date=event.start_date,
+                end_date=event.end_date,
+                duration=2.5,
+                rappo="Rapporteur",
+                topics="Topics",
+                outcome_text=f"Outcome {k} of {event.name}",
+                recommendation="Recommendation",
+            )
+            for event in events
+            if event.end_date < now
+            for k in range(outcomes_per_event)
+        ),
+        batch_size=500,
+    )
+    refresh_outcome_stats([event.pk for event in events])
+    reconcile_pending_counts()
+    invalidate_history()
+    return user_objs, category_objs, events
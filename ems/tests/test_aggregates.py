@@ -0,0 +1,139 @@
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.db.models import Count
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from ems.aggregates import pending_counts, reconcile_pending_counts, refresh_outcome_stats
+from ems.models import Category, Event, Outcome
+
+
+class PendingEventCountTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username='owner')
+        cls.workshops = Category.objects.create(name='Workshops')
+        cls.trainings = Category.objects.create(name='Trainings')
+
+    def create_event(self, category, ends_in):
+        now = timezone.now()
+        return Event.objects.create(
+            user=self.user, name='e', category=category, project_type='other',
+            start_date=now - timedelta(days=1), end_date=now + ends_in,
+        )
+
+    def expected(self, now=None):
+        rows = (
+            Event.objects.filter(end_date__gt=now or timezone.now())
+            .values('category__name').annotate(count=Count('id')).order_by('category__name')
+        )
+        return {row['category__name']: row['count'] for row in rows}
+
+    def test_tracks_create_move_recategorise_delete(self):
+        first = self.create_event(self.workshops, timedelta(days=3))
+        second = self.create_event(self.workshops, timedelta(days=5))
+        self.create_event(self.trainings, -timedelta(days=1))
+        self.assertEqual(pending_counts(), {'Workshops': 2})
+
+        first.category = self.trainings
+        first.save()
+        self.assertEqual(pending_counts(), {'Trainings': 1, 'Workshops': 1})
+
+        second.end_date = timezone.now() - timedelta(hours=1)
+        second.save()
+        self.assertEqual(pending_counts(), {'Trainings': 1})
+
+        first.delete()
+        self.assertEqual(pending_counts(), self.expected())
+        self.assertEqual(pending_counts(), {})
+
+    def test_events_ending_after_reconcile_drop_out(self):
+        self.create_event(self.workshops, timedelta(hours=2))
+        self.create_event(self.workshops, timedelta(days=2))
+        reconcile_pending_counts()
+
+        later = timezone.now() + timedelta(hours=3)
+        self.assertEqual(pending_counts(now=later), {'Workshops': 1})
+        self.assertEqual(pending_counts(now=later), self.expected(later))
+
+        reconcile_pending_counts(now=later)
+        self.assertEqual(pending_counts(now=later), {'Workshops': 1})
+
+
+class OutcomeStatsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username='owner')
+        cls.category = Category.objects.create(name='Workshops')
+
+    def create_event(self, ends_in=-timedelta(days=1)):
+        now = timezone.now()
+        return Event.objects.create(
+            user=self.user, name='e', category=self.category, project_type='other',
+            start_date=now - timedelta(days=2), end_date=now + ends_in,
+        )
+
+    def create_outcome(self, event):
+        now = timezone.now()
+        return Outcome.objects.create(event=event, start_date=now, end_date=now, duration=1,
+                                      rappo='r', topics='t', outcome_text='o', recommendation='r')
+
+    def stats(self, event):
+        return Event.objects.values_list('outcome_count', 'last_outcome_at').get(pk=event.pk)
+
+    def test_tracks_create_move_delete(self):
+        first, second = self.create_event(), self.create_event()
+        a = self.create_outcome(first)
+        b = self.create_outcome(first)
+        self.assertEqual(self.stats(first), (2, b.created_at))
+
+        moved = Outcome.objects.get(pk=b.pk)
+        moved.event = second
+        moved.save()
+        self.assertEqual(self.stats(first), (1, a.created_at))
+        self.assertEqual(self.stats(second), (1, b.created_at))
+
+        a.delete()
+        self.assertEqual(self.stats(first), (0, None))
+
+    def test_queryset_delete_recounts_once_per_event(self):
+        first, second = self.create_event(), self.create_event()
+        kept = self.create_outcome(first)
+        for event in (first, first, first, second):
+            self.create_outcome(event)
+
+        with CaptureQueriesContext(connection) as queries:
+            Outcome.objects.exclude(pk=kept.pk).delete()
+        updates = [q for q in queries if q['sql'].startswith('UPDATE "ems_event"')]
+        self.assertEqual(len(updates), 2)
+        self.assertEqual(self.stats(first), (1, kept.created_at))
+        self.assertEqual(self.stats(second), (0, None))
+
+    def test_user_delete_does_not_recount_cascaded_outcomes(self):
+        self.create_outcome(self.create_event())
+        with CaptureQueriesContext(connection) as queries:
+            User.objects.filter(pk=self.user.pk).delete()
+        self.assertFalse([q for q in queries if q['sql'].startswith('UPDATE "ems_event"')])
+
+    def test_event_save_does_not_overwrite_stats(self):
+        event = self.create_event()
+        stale = Event.objects.get(pk=event.pk)
+        self.create_outcome(event)
+        stale.name = 'renamed'
+        stale.save()
+        self.assertEqual(self.stats(event)[0], 1)
+
+    def test_awaiting_outcome_and_refresh(self):
+        ended, upcoming, recorded = (self.create_event(), self.create_event(timedelta(days=1)),
+                                     self.create_event())
+        self.create_outcome(recorded)
+        self.assertEqual(list(Event.objects.awaiting_outcome()), [ended])
+
+        Event.objects.update(outcome_count=7, last_outcome_at=None)
+        self.assertEqual(refresh_outcome_stats(), 3)
+        self.assertEqual(self.stats(recorded)[0], 1)
+        self.assertEqual(self.stats(ended), (0, None))
+        self.assertEqual(self.stats(upcoming), (0, None))
@@ -0,0 +1,157 @@
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from ems import analytics
+from ems.models import Category, Event, Outcome
+
+
+def at(day):
+    return datetime.combine(day, datetime.min.time(), tzinfo=dt_timezone.utc) + timedelta(hours=9)
+
+
+class AnalyticsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.alice = User.objects.create(username='alice')
+        cls.bob = User.objects.create(username='bob')
+        cls.workshops = Category.objects.create(name='Workshops')
+        cls.talks = Category.objects.create(name='Talks')
+        cls.today = timezone.localdate()
+        cls.month = analytics.bucket_start('month', cls.today)
+        cls.last_month = analytics.bucket_start('month', cls.month - timedelta(days=1))
+
+        cls.old = cls.event(cls.alice, cls.workshops, 'kwp2', cls.last_month)
+        cls.outcome(cls.old, cls.last_month, 2.5)
+        cls.outcome(cls.old, cls.last_month + timedelta(days=1), 1)
+        other = cls.event(cls.bob, cls.talks, 'other', cls.last_month)
+        cls.outcome(other, cls.last_month, 4)
+        current = cls.event(cls.alice, cls.workshops, 'kwp2', cls.month)
+        cls.outcome(current, cls.month, 3)
+
+    @classmethod
+    def event(cls, user, category, project_type, day):
+        return Event.objects.create(user=user, category=category, name='e', project_type=project_type,
+                                    start_date=at(day), end_date=at(day) + timedelta(hours=8))
+
+    @classmethod
+    def outcome(cls, event, day, hours):
+        return Outcome.objects.create(event=event, start_date=at(day), end_date=at(day), duration=hours,
+                                      rappo='r', topics='t', outcome_text='o', recommendation='r')
+
+    def setUp(self):
+        cache.clear()
+
+    def rows(self, bucket='month', group='project_type'):
+        return analytics.outcome_hours(bucket, group, self.last_month, self.today)
+
+    def test_buckets_and_groups(self):
+        self.assertEqual(self.rows(), [
+            {'period': self.last_month.isoformat(), 'group': 'kwp2', 'hours': 3.5, 'outcomes': 2, 'events': 1},
+            {'period': self.last_month.isoformat(), 'group': 'other', 'hours': 4.0, 'outcomes': 1, 'events': 1},
+            {'period': self.month.isoformat(), 'group': 'kwp2', 'hours': 3.0, 'outcomes': 1, 'events': 1},
+        ])
+        by_user = {(row['period'], row['group']): row['hours'] for row in self.rows(group='user')}
+        self.assertEqual(by_user[self.last_month.isoformat(), 'bob'], 4.0)
+        by_category = {(row['period'], row['group']): row['events'] for row in self.rows(group='category')}
+        self.assertEqual(by_category[self.month.isoformat(), 'Workshops'], 1)
+
+    def test_bucket_start(self):
+        self.assertEqual(analytics.bucket_start('week', date(2025, 3, 6)), date(2025, 3, 3))
+        self.assertEqual(analytics.bucket_start('month', date(2025, 3, 6)), date(2025, 3, 1))
+        self.assertEqual(analytics.bucket_start('quarter', date(2025, 8, 6)), date(2025, 7, 1))
+
+    def test_history_end(self):
+        # The week is the latest current bucket, unless the month began mid-week.
+        self.assertEqual(analytics.history_end(date(2026, 10, 17)), date(2026, 10, 12))
+        self.assertEqual(analytics.history_end(date(2026, 10, 2)), date(2026, 10, 1))
+
+    def test_only_the_current_bucket_is_recomputed(self):
+        self.rows()
+        with CaptureQueriesContext(connection) as queries:
+            rows = self.rows()
+        self.assertEqual(len(queries), 2)   # outcomes and events of the current month
+
+        # An outcome dated today shows up without touching the cached history.
+        self.outcome(self.old, self.today, 1)
+        with self.assertNumQueries(2):
+            self.assertEqual(self.rows()[-1]['hours'], 4.0)
+        self.assertEqual(rows[0]['hours'], 3.5)
+
+    def test_back_dated_writes_invalidate_history(self):
+        self.rows()
+        outcome = self.outcome(self.old, self.last_month, 10)
+        self.assertEqual(self.rows()[0]['hours'], 13.5)
+
+        outcome.delete()
+        self.assertEqual(self.rows()[0]['hours'], 3.5)
+
+        self.old.project_type = 'kwp3'
+        self.old.save()
+        self.assertEqual([row['group'] for row in self.rows()[:2]], ['kwp3', 'other'])
+
+    def test_writes_into_last_week_invalidate_weekly_history(self):
+        week = analytics.bucket_start('week', self.today)
+        last_week = week - timedelta(days=7)
+
+        def hours():
+            rows = analytics.outcome_hours('week', 'project_type', last_week, self.today)
+            return sum(row['hours'] for row in rows if row['period'] == last_week.isoformat())
+
+        before = hours()
+        self.outcome(self.old, last_week + timedelta(days=1), 5)
+        self.assertEqual(hours(), before + 5)
+
+    def test_other_edits_keep_history(self):
+        self.rows()
+        self.old.description = 'Updated'
+        self.old.save()
+        with self.assertNumQueries(2):
+            self.rows()
+        self.bob.last_name = 'Jones'
+        self.bob.save()
+        self.bob.save(update_fields=['last_login'])
+        with self.assertNumQueries(2):
+            self.rows()
+
+    def test_renames_invalidate_history(self):
+        def groups(group):
+            return {row['group'] for row in self.rows(group=group)}
+
+        self.assertIn('Talks', groups('category'))
+        self.talks.name = 'Lectures'
+        self.talks.save()
+        self.assertEqual(groups('category'), {'Workshops', 'Lectures'})
+
+        self.assertIn('bob', groups('user'))
+        self.bob.username = 'robert'
+        self.bob.save()
+        self.assertEqual(groups('user'), {'alice', 'robert'})
+
+
+class AnalyticsViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username='alice')
+
+    def setUp(self):
+        cache.clear()
+        self.client = Client(HTTP_HOST='localhost')
+        self.client.force_login(self.user)
+
+    def test_defaults(self):
+        data = self.client.get(reverse('analytics_data')).json()
+        self.assertEqual((data['bucket'], data['group']), ('month', 'project_type'))
+        self.assertEqual(data['totals'], {'hours': 0, 'outcomes': 0, 'events': 0})
+
+    def test_invalid_parameters(self):
+        url = reverse('analytics_data')
+        for params in ({'bucket': 'day'}, {'group': 'owner'}, {'start': 'soon'},
+                       {'start': '2025-02-01', 'end': '2025-01-01'}, {'start': '1990-01-01'}):
+            self.assertEqual(self.client.get(url, params).status_code, 400, params)
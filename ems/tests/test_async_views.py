@@ -0,0 +1,127 @@
+import importlib
+import json
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.http import Http404
+from django.test import AsyncRequestFactory, SimpleTestCase, TestCase
+
+import ems.urls
+from ems import async_views, views
+from ems.middleware import StaticFilesMiddleware
+from ems.models import Event, Outcome
+
+from .factories import seed_dataset
+
+
+class AsyncOutcomeViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        users, _, _ = seed_dataset(users=2, events_per_user=3, future_days=0)
+        cls.user, cls.other = users
+        cls.event = Event.objects.filter(user=cls.user, outcome_entries__isnull=False).first()
+        cls.outcome = cls.event.outcome_entries.first()
+
+    def setUp(self):
+        self.factory = AsyncRequestFactory(HTTP_HOST='localhost')
+
+    def _request(self, method, path, user, data=None):
+        request = getattr(self.factory, method)(path, data or {})
+        request.user = user
+
+        async def auser():
+            return user
+        request.auser = auser
+        return request
+
+    def _form(self, **overrides):
+        data = {
+            'start_date': '2024-03-01 09:00', 'end_date': '2024-03-01 12:00',
+            'duration': '3', 'rappo': 'Bob', 'topics': 'Budget',
+            'outcome_text': 'Agreed', 'recommendation': 'Follow up',
+        }
+        data.update(overrides)
+        return data
+
+    async def test_list_matches_sync_view(self):
+        path = f'/events/{self.event.pk}/outcomes/'
+        async_response = await async_views.outcome_list(self._request('get', path, self.user), self.event.pk)
+        sync_request = self._request('get', path, self.user)
+        sync_response = await sync_to_async(views.outcome_list)(sync_request, self.event.pk)
+        self.assertEqual(async_response.status_code, 200)
+        self.assertEqual(async_response.content, sync_response.content)
+
+    async def test_pages_match_sync_view(self):
+        path = f'/events/{self.event.pk}/outcomes/'
+        async_response = await async_views.outcome_list(
+            self._request('get', path, self.user, {'limit': 1}), self.event.pk)
+        cursor = json.loads(async_response.content)['next_cursor']
+        self.assertIsNotNone(cursor)
+        params = {'limit': 1, 'cursor': cursor}
+        async_response = await async_views.outcome_list(self._request('get', path, self.user, params), self.event.pk)
+        sync_response = await sync_to_async(views.outcome_list)(
+            self._request('get', path, self.user, params), self.event.pk)
+        self.assertEqual(async_response.content, sync_response.content)
+        self.assertEqual(len(json.loads(async_response.content)['outcomes']), 1)
+
+    async def test_create_and_update(self):
+        path = f'/events/{self.event.pk}/outcomes/'
+        response = await async_views.outcome_list(
+            self._request('post', path, self.user, self._form()), self.event.pk)
+        outcome_id = json.loads(response.content)['id']
+        self.assertTrue(await Outcome.objects.filter(pk=outcome_id, event=self.event).aexists())
+
+        response = await async_views.outcome_update(
+            self._request('post', f'/outcomes/{outcome_id}/update/', self.user, self._form(topics='Staffing')),
+            outcome_id)
+        self.assertEqual(json.loads(response.content), {'status': 'success'})
+        outcome = await Outcome.objects.aget(pk=outcome_id)
+        self.assertEqual(outcome.topics, 'Staffing')
+
+        response = await async_views.outcome_detail(
+            self._request('get', f'/outcomes/{outcome_id}/', self.user), outcome_id)
+        self.assertEqual(json.loads(response.content)['topics'], 'Staffing')
+
+    async def test_other_users_outcomes_are_hidden(self):
+        path = f'/outcomes/{self.outcome.pk}/'
+        with self.assertRaises(Http404):
+            await async_views.outcome_detail(self._request('get', path, self.other), self.outcome.pk)
+        with self.assertRaises(Http404):
+            await async_views.outcome_update(
+                self._request('post', path + 'update/', self.other, self._form()), self.outcome.pk)
+
+    async def test_login_required(self):
+        response = await async_views.outcome_detail(
+            self._request('get', f'/outcomes/{self.outcome.pk}/', AnonymousUser()), self.outcome.pk)
+        self.assertEqual(response.status_code, 302)
+
+
+class StaticFilesMiddlewareTests(TestCase):
+    async def test_passes_through_in_async_chain(self):
+        async def get_response(request):
+            return 'next'
+        middleware = StaticFilesMiddleware(get_response)
+        request = AsyncRequestFactory(HTTP_HOST='localhost').get('/timeline/')
+        self.assertEqual(await middleware(request), 'next')
+
+
+class OutcomeRoutingTests(SimpleTestCase):
+    def resolved_module(self):
+        try:
+            module = importlib.reload(ems.urls)
+            return module.outcome_views
+        finally:
+            importlib.reload(ems.urls)
+
+    def test_setting_selects_views(self):
+        with self.settings(EMS_ASYNC_OUTCOMES=True):
+            self.assertIs(self.resolved_module(), async_views)
+        with self.settings(EMS_ASYNC_OUTCOMES=False):
+            self.assertIs(self.resolved_module(), views)
+
+    def test_sync_views_without_the_setting(self):
+        # e.g. platlog/settings_development.py does not define it.
+        with self.settings():
+            del settings.EMS_ASYNC_OUTCOMES
+            self.assertIs(self.resolved_module(), views)
@@ -0,0 +1,112 @@
+import gzip
+import json
+from unittest import skipUnless
+
+from django.conf import settings
+from django.core.cache import cache
+from django.test import Client, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from ems import middleware
+from ems.models import Event
+
+from .factories import seed_dataset
+
+
+class CompressionTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        users, _, _ = seed_dataset(users=1, events_per_user=40, history_days=30, future_days=30)
+        cls.user = users[0]
+
+    def setUp(self):
+        cache.clear()
+        self.client = Client(HTTP_HOST='localhost')
+        self.client.force_login(self.user)
+
+    def test_gzip_json(self):
+        plain = self.client.get(reverse('home_data'))
+        self.assertNotIn('Content-Encoding', plain)
+        self.assertGreater(len(plain.content), settings.EMS_COMPRESS_MIN_SIZE)
+
+        response = self.client.get(reverse('home_data'), HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', response['Vary'])
+        self.assertEqual(gzip.decompress(response.content), plain.content)
+        self.assertTrue(response['ETag'].startswith('W/'))
+
+    def test_small_responses_are_left_alone(self):
+        response = self.client.get(reverse('outcome_list', args=[Event.objects.first().pk]),
+                                   HTTP_ACCEPT_ENCODING='gzip')
+        self.assertLess(len(response.content), settings.EMS_COMPRESS_MIN_SIZE)
+        self.assertNotIn('Content-Encoding', response)
+
+    def test_min_size_is_read_per_request(self):
+        url = reverse('outcome_list', args=[Event.objects.first().pk])
+        with override_settings(EMS_COMPRESS_MIN_SIZE=10):
+            response = self.client.get(url, HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+
+    def test_streaming_export_is_compressed(self):
+        url = reverse('export_events')
+        plain = b''.join(self.client.get(url, {'format': 'csv'}).streaming_content)
+        response = self.client.get(url, {'format': 'csv'}, HTTP_ACCEPT_ENCODING='gzip')
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(b''.join(response.streaming_content)), plain)
+
+    @skipUnless(middleware.brotli, "brotli is not installed")
+    def test_brotli_preferred_when_accepted(self):
+        plain = self.client.get(reverse('home_data'))
+        response = self.client.get(reverse('home_data'), HTTP_ACCEPT_ENCODING='gzip, br')
+        self.assertEqual(response['Content-Encoding'], 'br')
+        self.assertEqual(middleware.brotli.decompress(response.content), plain.content)
+
+        url = reverse('export_events')
+        plain = b''.join(self.client.get(url, {'format': 'ndjson'}).streaming_content)
+        response = self.client.get(url, {'format': 'ndjson'}, HTTP_ACCEPT_ENCODING='br')
+        self.assertEqual(response['Content-Encoding'], 'br')
+        self.assertEqual(middleware.brotli.decompress(b''.join(response.streaming_content)), plain)
+
+    @skipUnless(middleware.brotli, "brotli is not installed")
+    def test_html_gets_padded_gzip_even_when_brotli_is_accepted(self):
+        sizes = set()
+        for _ in range(5):
+            response = self.client.get(reverse('home'), HTTP_ACCEPT_ENCODING='gzip, br')
+            self.assertEqual(response['Content-Encoding'], 'gzip')
+            sizes.add(len(response.content))
+        # GZipMiddleware's random padding (BREACH mitigation) varies the length.
+        self.assertGreater(len(sizes), 1)
+
+
+class HomeDataTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        users, _, cls.events = seed_dataset(users=1, events_per_user=5, history_days=10, future_days=10)
+        cls.user = users[0]
+
+    def setUp(self):
+        cache.clear()
+        self.client = Client(HTTP_HOST='localhost')
+        self.client.force_login(self.user)
+
+    def test_shell_carries_no_event_data(self):
+        response = self.client.get(reverse('home'))
+        self.assertIn('max-age', response['Cache-Control'])
+        self.assertIn('private', response['Cache-Control'])
+        self.assertContains(response, reverse('home_data'))
+        self.assertNotContains(response, self.events[0].name)
+        self.assertContains(response, 'id="eventOutcomes"')
+
+    def test_data_revalidates_until_events_change(self):
+        url = reverse('home_data')
+        first = self.client.get(url)
+        self.assertEqual(len(json.loads(first.content)), 5)
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag']).status_code, 304)
+
+        Event.objects.create(user=self.user, category=self.events[0].category, name='New',
+                             project_type='other', start_date=timezone.now(), end_date=timezone.now())
+        second = self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(len(json.loads(second.content)), 6)
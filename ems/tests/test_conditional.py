@@ -0,0 +1,92 @@
+from datetime import datetime, timedelta, timezone as dt_timezone
+from unittest import mock
+
+from django.test import Client, TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from ems.models import Event, Outcome
+
+from .factories import seed_dataset
+
+
+class ConditionalGetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        users, _, _ = seed_dataset(users=1, events_per_user=6, history_days=10, future_days=10)
+        cls.user = users[0]
+        cls.event = Event.objects.filter(outcome_entries__isnull=False).first()
+        cls.outcome = cls.event.outcome_entries.first()
+
+    def setUp(self):
+        self.client = Client(HTTP_HOST='localhost')
+        self.client.force_login(self.user)
+
+    def revalidate(self, url, response, **params):
+        return self.client.get(url, params, HTTP_IF_NONE_MATCH=response['ETag'])
+
+    def test_outcome_list_revalidates(self):
+        url = reverse('outcome_list', args=[self.event.pk])
+        first = self.client.get(url)
+        self.assertEqual(first.status_code, 200)
+        self.assertIn('no-cache', first['Cache-Control'])
+        self.assertIn('Last-Modified', first)
+
+        with self.assertNumQueries(2):   # user, event with validators
+            second = self.revalidate(url, first)
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second['ETag'], first['ETag'])
+
+        self.outcome.outcome_text = 'Changed'
+        self.outcome.save()
+        third = self.revalidate(url, first)
+        self.assertEqual(third.status_code, 200)
+        self.assertNotEqual(third['ETag'], first['ETag'])
+
+    def test_deleting_an_older_outcome_changes_the_etag(self):
+        url = reverse('outcome_list', args=[self.event.pk])
+        Outcome.objects.create(event=self.event, start_date=timezone.now(), end_date=timezone.now(),
+                               duration=1, rappo='r', topics='t', outcome_text='o', recommendation='r')
+        first = self.client.get(url)
+        self.outcome.delete()
+        self.assertEqual(self.revalidate(url, first).status_code, 200)
+
+    def test_if_modified_since(self):
+        url = reverse('outcome_detail', args=[self.outcome.pk])
+        first = self.client.get(url)
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=first['Last-Modified'])
+        self.assertEqual(response.status_code, 304)
+
+    def test_timeline_data_revalidates(self):
+        url = reverse('event_timeline_data')
+        first = self.client.get(url, {'view_mode': 'Month'})
+        self.assertTrue(first.json()['events'])
+        self.assertEqual(self.revalidate(url, first, view_mode='Month').status_code, 304)
+
+        # A new outcome changes outcome_count in the payload.
+        Outcome.objects.create(event=self.event, start_date=timezone.now(), end_date=timezone.now(),
+                               duration=1, rappo='r', topics='t', outcome_text='o', recommendation='r')
+        self.assertEqual(self.revalidate(url, first, view_mode='Month').status_code, 200)
+
+    def test_timeline_data_notices_events_outside_the_window(self):
+        url = reverse('event_timeline_data')
+        first = self.client.get(url, {'view_mode': 'Day', 'start': '2000-01-01'})
+        self.assertFalse(first.json()['has_earlier'])
+        Event.objects.create(
+            user=self.user, category=self.event.category, name='Old', project_type='other',
+            start_date=datetime(1999, 1, 1, tzinfo=dt_timezone.utc),
+            end_date=datetime(1999, 1, 2, tzinfo=dt_timezone.utc),
+        )
+        response = self.revalidate(url, first, view_mode='Day', start='2000-01-01')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()['has_earlier'])
+
+    def test_timeline_default_window_moves_with_the_date(self):
+        url = reverse('event_timeline_data')
+        Event.objects.all().delete()   # same (empty) content on both days
+        first = self.client.get(url, {'view_mode': 'Day'})
+        tomorrow = timezone.now() + timedelta(days=1)
+        with mock.patch('ems.views.timezone.now', return_value=tomorrow):
+            response = self.revalidate(url, first, view_mode='Day')
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.json()['start'], first.json()['start'])
@@ -0,0 +1,53 @@
+import re
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from ems.models import Category, Event, assign_event_ids, generate_event_id
+
+EVENT_ID = re.compile(r'^EV-\d{8}-\d{4,}$')
+
+
+class EventIdTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username='alice')
+        cls.category = Category.objects.create(name='Workshops')
+
+    def event(self, **values):
+        now = timezone.now()
+        values = {'user': self.user, 'category': self.category, 'name': 'e',
+                  'project_type': 'other', 'start_date': now, 'end_date': now, **values}
+        return Event(**values)
+
+    def test_save_assigns_readable_id(self):
+        event = self.event()
+        self.assertEqual(event.event_id, '')
+        event.save()
+        self.assertRegex(event.event_id, EVENT_ID)
+        self.assertIn(timezone.now().strftime('%Y%m%d'), event.event_id)
+
+    def test_existing_ids_are_kept(self):
+        event = self.event(event_id='EV-20251109-1A2')
+        event.save()
+        event.save()
+        self.assertEqual(Event.objects.get(pk=event.pk).event_id, 'EV-20251109-1A2')
+
+    def test_bulk_create_reserves_ids_in_one_query(self):
+        events = [self.event() for _ in range(200)] + [self.event(event_id='EV-20251109-ABC')]
+        with CaptureQueriesContext(connection) as queries:
+            Event.objects.bulk_create(events)
+        reservations = [q for q in queries if 'nextval' in q['sql'] or 'ems_eventidcounter' in q['sql']]
+        self.assertEqual(len(reservations), 1)
+        ids = [event.event_id for event in events]
+        self.assertEqual(len(set(ids)), len(ids))
+        self.assertEqual(ids[-1], 'EV-20251109-ABC')
+        self.assertTrue(all(EVENT_ID.match(event_id) for event_id in ids[:-1]))
+
+    def test_numbers_are_never_reused(self):
+        seen = {generate_event_id() for _ in range(50)}
+        seen.update(event.event_id for event in assign_event_ids([self.event() for _ in range(50)]))
+        self.assertEqual(len(seen), 100)
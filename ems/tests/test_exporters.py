@@ -0,0 +1,58 @@
+import csv
+import io
+import json
+
+from django.contrib.auth.models import User
+from django.test import Client, TestCase
+from django.urls import reverse
+
+from ems.importers import import_file
+from ems.models import Event, Outcome
+
+from .factories import seed_dataset
+
+
+class ExportTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.users, cls.categories, cls.events = seed_dataset(users=2, events_per_user=6, outcomes_per_event=2)
+        cls.owner = cls.users[0]
+
+    def setUp(self):
+        self.client = Client(HTTP_HOST='localhost')
+        self.client.force_login(self.owner)
+
+    def export(self, **params):
+        response = self.client.get(reverse('export_events'), params)
+        self.assertTrue(response.streaming)
+        return b"".join(response.streaming_content).decode()
+
+    def test_csv_has_a_row_per_outcome_and_only_own_events(self):
+        rows = list(csv.DictReader(io.StringIO(self.export(format='csv', user='someone-else'))))
+        own = Event.objects.filter(user=self.owner)
+        with_outcomes = Outcome.objects.filter(event__user=self.owner).count()
+        without = own.filter(outcome_entries__isnull=True).count()
+        self.assertEqual(len(rows), with_outcomes + without)
+        self.assertEqual({row['user'] for row in rows}, {self.owner.username})
+
+    def test_ndjson_nests_outcomes_and_round_trips(self):
+        lines = self.export(format='ndjson', project_type='kwp2').splitlines()
+        records = [json.loads(line) for line in lines]
+        self.assertEqual(len(records), Event.objects.filter(user=self.owner, project_type='kwp2').count())
+        self.assertTrue(all(r['project_type'] == 'kwp2' for r in records))
+
+        Event.objects.all().delete()
+        result = import_file(io.BytesIO("\n".join(lines).encode()), 'jsonl')
+        self.assertEqual(result.error_count, 0)
+        self.assertEqual(result.events, len(records))
+        self.assertEqual(result.outcomes, sum(len(r['outcomes']) for r in records))
+
+    def test_rejects_bad_filters(self):
+        response = self.client.get(reverse('export_events'), {'start': 'yesterday'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_staff_can_filter_by_user(self):
+        staff = User.objects.create(username='staff', is_staff=True)
+        self.client.force_login(staff)
+        lines = self.export(format='ndjson', user=self.users[1].username).splitlines()
+        self.assertEqual(len(lines), Event.objects.filter(user=self.users[1]).count())
@@ -0,0 +1,120 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from ems.caching import HOME_CACHE_TIMEOUT, home_cache_key
+from ems.models import Category, Event, Outcome
+
+
+class HomeDataTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username='owner')
+        cls.other = User.objects.create(username='other')
+        cls.category = Category.objects.create(name='Workshops')
+
+    def setUp(self):
+        cache.clear()
+        self.client = Client()
+        self.client.force_login(self.user)
+
+    def create_event(self, user=None, ends_in=-timedelta(days=1), name='e'):
+        now = timezone.now()
+        return Event.objects.create(
+            user=user or self.user, name=name, category=self.category, project_type='other',
+            start_date=now - timedelta(days=2), end_date=now + ends_in,
+        )
+
+    def create_outcome(self, event):
+        now = timezone.now()
+        return Outcome.objects.create(event=event, start_date=now, end_date=now, duration=1,
+                                      rappo='r', topics='t', outcome_text='o', recommendation='r')
+
+    def fetch(self):
+        return {row['name']: row for row in self.client.get(reverse('home_data')).json()}
+
+    def warm(self, *users):
+        for user in users:
+            self.client.force_login(user)
+            self.client.get(reverse('home_data'))
+            self.assertIsNotNone(cache.get(home_cache_key(user.pk)))
+        self.client.force_login(self.user)
+
+    def test_flags(self):
+        self.create_event(name='pending')
+        self.create_outcome(self.create_event(name='recorded'))
+        self.create_event(ends_in=timedelta(days=1), name='upcoming')
+        self.create_event(user=self.other, name='not mine')
+
+        rows = self.fetch()
+        self.assertEqual(sorted(rows), ['pending', 'recorded', 'upcoming'])
+        flags = {name: (row['is_upcoming'], row['is_pending'], row['outcome_count'])
+                 for name, row in rows.items()}
+        self.assertEqual(flags, {
+            'pending': (False, True, 0),
+            'recorded': (False, False, 1),
+            'upcoming': (True, False, 0),
+        })
+
+    def test_payload_is_cached_until_a_write(self):
+        event = self.create_event(name='before')
+        self.fetch()
+        with self.assertNumQueries(1):   # the user; the payload is cached
+            self.client.get(reverse('home_data'))
+
+        event.name = 'after'
+        event.save()
+        self.assertEqual(list(self.fetch()), ['after'])
+
+        self.create_outcome(event)
+        self.assertEqual(self.fetch()['after']['outcome_count'], 1)
+
+    def test_cache_expires_when_an_upcoming_event_ends(self):
+        self.create_event(ends_in=timedelta(seconds=30))
+        with mock.patch.object(cache, 'set', wraps=cache.set) as cache_set:
+            self.fetch()
+        # Its flags flip then.
+        self.assertLessEqual(cache_set.call_args.args[2], 31)
+
+    def test_cache_timeout_is_capped(self):
+        self.create_event(ends_in=timedelta(days=10))
+        with mock.patch.object(cache, 'set', wraps=cache.set) as cache_set:
+            self.fetch()
+        self.assertLessEqual(cache_set.call_args.args[2], HOME_CACHE_TIMEOUT)
+
+    def test_moving_an_outcome_invalidates_both_owners(self):
+        mine, theirs = self.create_event(), self.create_event(user=self.other)
+        outcome = Outcome.objects.get(pk=self.create_outcome(mine).pk)
+        self.warm(self.user, self.other)
+
+        outcome.event = theirs
+        outcome.save()
+        self.assertIsNone(cache.get(home_cache_key(self.user.pk)))
+        self.assertIsNone(cache.get(home_cache_key(self.other.pk)))
+
+    def test_queryset_delete_invalidates_once_per_event(self):
+        event = self.create_event()
+        for _ in range(3):
+            self.create_outcome(event)
+        self.warm(self.user)
+
+        with CaptureQueriesContext(connection) as queries:
+            Outcome.objects.filter(event=event).delete()
+        owner_lookups = [q for q in queries if q['sql'].startswith('SELECT "ems_event"."user_id"')]
+        self.assertEqual(len(owner_lookups), 1)
+        self.assertIsNone(cache.get(home_cache_key(self.user.pk)))
+        self.assertEqual(self.fetch()['e']['outcome_count'], 0)
+
+    def test_user_delete_skips_cascaded_outcomes(self):
+        self.create_outcome(self.create_event(user=self.other))
+        with CaptureQueriesContext(connection) as queries:
+            User.objects.filter(pk=self.other.pk).delete()
+        owner_lookups = [q for q in queries if q['sql'].startswith('SELECT "ems_event"."user_id"')]
+        self.assertEqual(owner_lookups, [])
@@ -0,0 +1,65 @@
+import io
+import json
+
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import Client, TestCase
+from django.urls import reverse
+
+from ems.aggregates import pending_counts
+from ems.importers import import_file
+from ems.models import Category, Event, Outcome
+
+CSV = """kind,event_id,user,category,name,project_type,start_date,end_date,duration,rappo,outcome_text
+event,EV-HIST-0001,alice,Workshops,Kickoff,kwp2,2024-03-01 09:00,2024-03-01 17:00,,,
+event,,alice,Workshops,Review,kwp3,2024-04-01,2099-04-02,,,
+outcome,EV-HIST-0001,,,,,2024-03-01 09:00,2024-03-01 12:00,3,Bob,Agreed plan
+event,,alice,Nowhere,Lost,kwp2,2024-03-01,2024-03-02,,,
+event,,alice,Workshops,Bad type,nope,2024-03-01,2024-03-02,,,
+outcome,EV-MISSING,,,,,2024-03-01,2024-03-01,1,Bob,Orphan
+event,EV-HIST-0001,alice,Workshops,Duplicate,kwp2,2024-03-01,2024-03-02,,,
+"""
+
+
+class EventImporterTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.alice = User.objects.create(username='alice')
+        Category.objects.create(name='Workshops')
+
+    def test_csv_reports_bad_rows_and_loads_the_rest(self):
+        result = import_file(io.BytesIO(CSV.encode()), 'csv', batch_size=2)
+
+        self.assertEqual((result.events, result.outcomes), (2, 1))
+        self.assertEqual([line for line, _ in result.errors], [5, 6, 7, 8])
+        self.assertIn("Unknown category 'Nowhere'", result.errors[0][1])
+        self.assertIn("project_type", result.errors[1][1])
+        self.assertEqual(Outcome.objects.get().event.event_id, 'EV-HIST-0001')
+        self.assertEqual(Outcome.objects.get().event.outcome_count, 1)
+        self.assertEqual(pending_counts(), {'Workshops': 1})
+
+    def test_jsonl_with_inline_outcomes(self):
+        lines = [
+            {"user": "alice", "category": "Workshops", "name": "Clinic", "project_type": "other",
+             "start_date": "2024-05-01T09:00:00Z", "end_date": "2024-05-01T12:00:00Z",
+             "outcomes": [
+                 {"start_date": "2024-05-01T09:00", "end_date": "2024-05-01T10:00",
+                  "duration": 1, "rappo": "Bob", "outcome_text": "First"},
+                 {"start_date": "2024-05-01T10:00", "end_date": "2024-05-01T12:00",
+                  "duration": "x", "rappo": "Bob", "outcome_text": "Bad duration"},
+             ]},
+            "not json",
+        ]
+        data = "\n".join(json.dumps(l) if isinstance(l, dict) else l for l in lines)
+        result = import_file(io.BytesIO(data.encode()), 'jsonl')
+
+        self.assertEqual((result.events, result.outcomes, result.error_count), (1, 1, 2))
+        self.assertEqual(Event.objects.get().outcome_entries.get().outcome_text, 'First')
+
+    def test_staff_upload_view(self):
+        staff = User.objects.create(username='staff', is_staff=True)
+        client = Client(HTTP_HOST='localhost')
+        client.force_login(staff)
+        upload = SimpleUploadedFile('history.csv', CSV.encode())
+        response = client.post(reverse('import_events'), {'file': upload})
+        self.assertEqual(response.context['result'].events, 2)
@@ -0,0 +1,60 @@
+import json
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.template import engines
+from django.template.loaders import cached
+from django.test import Client, TestCase
+from django.urls import reverse
+
+from ems import instrumentation
+
+from .factories import seed_dataset
+
+
+class RequestInstrumentationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        users, _, _ = seed_dataset(users=1, events_per_user=3)
+        cls.user = users[0]
+        cls.staff = User.objects.create(username='staff', is_staff=True)
+
+    def setUp(self):
+        instrumentation.reset_view_stats()
+        self.client = Client(HTTP_HOST='localhost')
+
+    def test_server_timing_header(self):
+        self.client.force_login(self.user)
+        response = self.client.get(reverse('event_chart'))
+        timing = response.headers['Server-Timing']
+        self.assertRegex(timing, r'db;dur=[\d.]+;desc="3 queries"')
+        self.assertRegex(timing, r'tpl;dur=[\d.]+')
+        self.assertRegex(timing, r'total;dur=[\d.]+')
+
+    def test_slow_requests_are_logged(self):
+        self.client.force_login(self.user)
+        with mock.patch.object(instrumentation, 'SLOW_REQUEST_MS', 0), \
+                self.assertLogs('ems.requests', 'WARNING') as logs:
+            self.client.get(reverse('home'))
+        record = json.loads(logs.output[0].split('slow_request ', 1)[1])
+        self.assertEqual(record['view'], 'home')
+        self.assertEqual(record['status'], 200)
+        self.assertGreater(record['bytes'], 0)
+
+    def test_request_stats_is_staff_only(self):
+        self.client.force_login(self.user)
+        self.client.get(reverse('home_data'))
+        self.assertEqual(self.client.get(reverse('request_stats')).status_code, 302)
+
+        self.client.force_login(self.staff)
+        stats = self.client.get(reverse('request_stats')).json()['views']
+        self.assertEqual(stats['home_data']['requests'], 1)
+        self.assertEqual(stats['home_data']['db_queries'], 2)
+
+    def test_templates_are_compiled_once(self):
+        # The timed backend must keep Django's default cached template loader.
+        engine = engines.all()[0]
+        self.assertIsInstance(engine, instrumentation.TimedDjangoTemplates)
+        self.assertEqual([type(loader) for loader in engine.engine.template_loaders], [cached.Loader])
+        first = engine.get_template('ems/home.html').template
+        self.assertIs(engine.get_template('ems/home.html').template, first)
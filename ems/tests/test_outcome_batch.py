@@ -0,0 +1,107 @@
+import json
+from unittest import mock
+
+from django.test import Client, TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from ems.models import Event, Outcome
+
+from .factories import seed_dataset
+
+
+class OutcomeBatchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        users, _, _ = seed_dataset(users=2, events_per_user=4, future_days=0)
+        cls.user, cls.other = users
+        cls.events = list(Event.objects.filter(user=cls.user).order_by('pk'))
+        cls.outcome = Outcome.objects.filter(event__user=cls.user).first()
+        cls.foreign_outcome = Outcome.objects.filter(event__user=cls.other).first()
+
+    def setUp(self):
+        self.client = Client(HTTP_HOST='localhost')
+        self.client.force_login(self.user)
+
+    def item(self, **values):
+        data = {
+            'start_date': '2024-03-01 09:00', 'end_date': '2024-03-01 12:00',
+            'duration': 3, 'rappo': 'Bob', 'topics': 'Budget',
+            'outcome_text': 'Agreed', 'recommendation': 'Follow up',
+        }
+        data.update(values)
+        return data
+
+    def post(self, items):
+        return self.client.post(reverse('outcome_batch'), json.dumps({'outcomes': items}),
+                                content_type='application/json')
+
+    def test_creates_and_updates_in_one_request(self):
+        response = self.post([
+            self.item(event=self.events[0].pk),
+            self.item(event=self.events[1].pk, topics='Staffing'),
+            self.item(id=self.outcome.pk, outcome_text='Revised'),
+        ])
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual((body['created'], body['updated'], body['errors']), (2, 1, 0))
+        self.assertEqual([r['status'] for r in body['results']], ['created', 'created', 'updated'])
+
+        created = Outcome.objects.get(pk=body['results'][1]['id'])
+        self.assertEqual((created.event_id, created.topics), (self.events[1].pk, 'Staffing'))
+        self.outcome.refresh_from_db()
+        self.assertEqual(self.outcome.outcome_text, 'Revised')
+
+    def test_history_is_invalidated_only_for_back_dated_items(self):
+        today = timezone.localdate().isoformat()
+        current = self.item(start_date=f'{today} 09:00', end_date=f'{today} 12:00')
+        invalidate = 'ems.outcome_batch.analytics.invalidate_history'
+
+        with mock.patch(invalidate) as invalidate_history:
+            self.post([{**current, 'event': self.events[0].pk}])
+        invalidate_history.assert_not_called()
+
+        # Moving a past outcome to today takes it out of the cached history.
+        with mock.patch(invalidate) as invalidate_history:
+            self.post([{**current, 'id': self.outcome.pk}])
+        invalidate_history.assert_called_once()
+
+        with mock.patch(invalidate) as invalidate_history:
+            self.post([self.item(event=self.events[0].pk)])
+        invalidate_history.assert_called_once()
+
+    def test_invalid_item_rejects_whole_batch(self):
+        before = Outcome.objects.count()
+        response = self.post([
+            self.item(event=self.events[0].pk),
+            self.item(event=self.events[0].pk, duration='long'),
+            self.item(event=self.events[0].pk, end_date='2024-02-01 09:00'),
+        ])
+        self.assertEqual(response.status_code, 400)
+        results = response.json()['results']
+        self.assertEqual([r['status'] for r in results], ['skipped', 'error', 'error'])
+        self.assertIn('duration', results[1]['error'])
+        self.assertEqual(Outcome.objects.count(), before)
+
+    def test_other_users_rows_are_not_found(self):
+        other_event = Event.objects.filter(user=self.other).first()
+        response = self.post([
+            self.item(event=other_event.pk),
+            self.item(id=self.foreign_outcome.pk),
+            self.item(id=self.outcome.pk),
+            self.item(id=self.outcome.pk),
+            {'event': 'x'},
+        ])
+        self.assertEqual(response.status_code, 400)
+        errors = [r.get('error') for r in response.json()['results']]
+        self.assertEqual(errors[0], f"Event {other_event.pk} not found")
+        self.assertEqual(errors[1], f"Outcome {self.foreign_outcome.pk} not found")
+        self.assertIsNone(errors[2])
+        self.assertIn('more than once', errors[3])
+        self.assertIn("integer 'id'", errors[4])
+
+    def test_rejects_malformed_requests(self):
+        url = reverse('outcome_batch')
+        self.assertEqual(self.client.get(url).status_code, 405)
+        self.assertEqual(self.client.post(url, 'nope', content_type='application/json').status_code, 400)
+        self.assertEqual(self.post([]).status_code, 400)
@@ -0,0 +1,110 @@
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.test import Client, TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from ems import pagination
+from ems.models import Category, Event, Outcome
+
+
+class CursorTests(TestCase):
+    def test_round_trip(self):
+        key = (timezone.now(), 42)
+        self.assertEqual(pagination.decode_cursor(pagination.encode_cursor(*key)), key)
+
+    def test_invalid_cursors(self):
+        for cursor in ('', 'not base64!', pagination.encode_cursor(timezone.now(), 1)[:-3], 'c29vbnwx'):
+            with self.assertRaises(ValueError, msg=cursor):
+                pagination.decode_cursor(cursor)
+
+    def test_page_params(self):
+        self.assertEqual(pagination.page_params({}), (None, pagination.DEFAULT_PAGE_SIZE))
+        self.assertEqual(pagination.page_params({'limit': '5'}, 10), (None, 5))
+        for params in ({'limit': '0'}, {'limit': '101'}, {'limit': 'ten'}, {'cursor': 'x'}):
+            with self.assertRaises(ValueError, msg=params):
+                pagination.page_params(params)
+
+
+class KeysetViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username='alice')
+        cls.category = Category.objects.create(name='Workshops')
+        start = timezone.now() - timedelta(days=30)
+        # Pairs of events share a start date, so pages must break ties on id.
+        cls.events = [
+            Event.objects.create(user=cls.user, category=cls.category, name=f'e{i}', project_type='other',
+                                 start_date=start + timedelta(days=i // 2),
+                                 end_date=start + timedelta(days=i // 2, hours=2))
+            for i in range(7)
+        ]
+        cls.event = cls.events[0]
+        cls.outcomes = [
+            Outcome.objects.create(event=cls.event, start_date=start, end_date=start, duration=1,
+                                   rappo='r', topics='t', outcome_text=f'o{i}', recommendation='r')
+            for i in range(5)
+        ]
+        # Same creation time for all of them: only the id orders them.
+        Outcome.objects.filter(event=cls.event).update(created_at=start)
+
+    def setUp(self):
+        self.client = Client(HTTP_HOST='localhost')
+        self.client.force_login(self.user)
+
+    def walk(self, url, key, limit):
+        """Follow next_cursor through every page; returns the ids and the number of pages."""
+        ids, pages, params = [], 0, {'limit': limit}
+        while True:
+            data = self.client.get(url, params).json()
+            self.assertLessEqual(len(data[key]), limit)
+            ids += [item['id'] for item in data[key]]
+            pages += 1
+            if data['next_cursor'] is None:
+                return ids, pages
+            params['cursor'] = data['next_cursor']
+
+    def test_outcome_pages(self):
+        ids, pages = self.walk(reverse('outcome_list', args=[self.event.pk]), 'outcomes', 2)
+        self.assertEqual(ids, sorted((outcome.pk for outcome in self.outcomes), reverse=True))
+        self.assertEqual(pages, 3)
+
+    def test_category_event_pages(self):
+        url = reverse('category_events_data', args=[self.category.pk])
+        ids, pages = self.walk(url, 'events', 3)
+        expected = Event.objects.filter(category=self.category).order_by('-start_date', '-pk')
+        self.assertEqual(ids, list(expected.values_list('pk', flat=True)))
+        self.assertEqual(pages, 3)
+
+        first = self.client.get(url, {'limit': 7}).json()
+        self.assertIsNone(first['next_cursor'])
+        outcomes = {event['id']: len(event['outcomes']) for event in first['events']}
+        self.assertEqual(outcomes[self.event.pk], 5)
+
+    def test_cursor_survives_inserts(self):
+        url = reverse('outcome_list', args=[self.event.pk])
+        first = self.client.get(url, {'limit': 2}).json()
+        Outcome.objects.create(event=self.event, start_date=timezone.now(), end_date=timezone.now(),
+                               duration=1, rappo='r', topics='t', outcome_text='new', recommendation='r')
+        second = self.client.get(url, {'limit': 2, 'cursor': first['next_cursor']}).json()
+        self.assertEqual([o['id'] for o in second['outcomes']], [self.outcomes[2].pk, self.outcomes[1].pk])
+
+    def test_later_pages_cost_the_same(self):
+        url = reverse('category_events_data', args=[self.category.pk])
+        first = self.client.get(url, {'limit': 2}).json()
+        with self.assertNumQueries(4):   # user, category, events, outcomes
+            self.client.get(url, {'limit': 2, 'cursor': first['next_cursor']})
+
+    def test_invalid_parameters(self):
+        for url in (reverse('outcome_list', args=[self.event.pk]),
+                    reverse('category_events_data', args=[self.category.pk])):
+            for params in ({'cursor': 'garbage'}, {'limit': '0'}, {'limit': '1000'}):
+                response = self.client.get(url, params)
+                self.assertEqual(response.status_code, 400, (url, params))
+                self.assertIn('error', response.json())
+
+    def test_page_embeds_first_page(self):
+        response = self.client.get(reverse('category_events', args=[self.category.pk]))
+        self.assertEqual(len(response.context['page']['events']), 7)
+        self.assertContains(response, 'id="firstPage"')
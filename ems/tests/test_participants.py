@@ -0,0 +1,78 @@
+import io
+
+from django.contrib.auth.models import User
+from django.test import Client, TestCase
+from django.urls import reverse
+
+from ems.importers import import_file
+from ems.models import Category, Event, Participant
+from ems.participants import parse_participants
+
+
+class ParticipantTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username='owner')
+        cls.category = Category.objects.create(name='Workshops')
+
+    def setUp(self):
+        self.client = Client(HTTP_HOST='localhost')
+        self.client.force_login(self.user)
+
+    def post_event(self, url, participants, name='Kickoff'):
+        return self.client.post(url, {
+            'name': name, 'category': self.category.pk, 'project_type': 'other',
+            'start_date': '2026-01-01T09:00', 'end_date': '2026-01-01T17:00',
+            'description': '', 'location': '', 'organizer': '',
+            'participants': participants,
+        })
+
+    def test_parse_participants(self):
+        self.assertEqual(parse_participants(" Alice ,Bob,, alice,Bob , Carol  Jones"),
+                         ['Alice', 'Bob', 'alice', 'Carol Jones'])
+        self.assertEqual(parse_participants(None), [])
+
+    def test_create_and_update_write_attendees(self):
+        self.post_event(reverse('create_event'), "Alice, Bob")
+        event = Event.objects.get()
+        self.assertEqual(sorted(event.attendees.values_list('name', flat=True)), ['Alice', 'Bob'])
+
+        self.post_event(reverse('update_event', args=[event.pk]), "Bob, Carol")
+        self.assertEqual(sorted(event.attendees.values_list('name', flat=True)), ['Bob', 'Carol'])
+        self.assertEqual(Participant.objects.count(), 3)
+
+    def test_participant_endpoints(self):
+        self.post_event(reverse('create_event'), "Alice, Bob", name='First')
+        self.post_event(reverse('create_event'), "Alice", name='Second')
+        alice = Participant.objects.get(name='Alice')
+
+        events = self.client.get(reverse('participant_events', args=[alice.pk])).json()['events']
+        self.assertEqual({e['name'] for e in events}, {'First', 'Second'})
+
+        top = self.client.get(reverse('participant_list')).json()['participants']
+        self.assertEqual([(p['name'], p['event_count']) for p in top], [('Alice', 2), ('Bob', 1)])
+
+    def test_import_links_participants(self):
+        data = ("user,category,name,project_type,start_date,end_date,participants\n"
+                "owner,Workshops,Clinic,other,2024-05-01,2024-05-02,\"Dana, Eve\"\n")
+        import_file(io.BytesIO(data.encode()), 'csv')
+        self.assertEqual(sorted(Event.objects.get().attendees.values_list('name', flat=True)), ['Dana', 'Eve'])
+
+    def test_admin_edits_relink_attendees(self):
+        admin = User.objects.create(username='admin', is_staff=True, is_superuser=True)
+        self.client.force_login(admin)
+        form = {
+            'user': self.user.pk, 'name': 'Kickoff', 'category': self.category.pk,
+            'project_type': 'other', 'start_date_0': '2026-01-01', 'start_date_1': '09:00',
+            'end_date_0': '2026-01-01', 'end_date_1': '17:00',
+            'description': 'Planning', 'location': 'Hall', 'organizer': 'Ops',
+        }
+        response = self.client.post(reverse('admin:ems_event_add'), {**form, 'participants': "Alice, Bob"})
+        self.assertEqual(response.status_code, 302)
+        event = Event.objects.get()
+        self.assertEqual(sorted(event.attendees.values_list('name', flat=True)), ['Alice', 'Bob'])
+
+        self.client.post(reverse('admin:ems_event_change', args=[event.pk]),
+                         {**form, 'participants': "Bob, Carol"})
+        self.assertEqual(sorted(event.attendees.values_list('name', flat=True)), ['Bob', 'Carol'])
+        self.assertContains(self.client.get(reverse('admin:ems_event_change', args=[event.pk])), 'Carol')
@@ -0,0 +1,88 @@
+"""Check that the hot queries in ems.views are served by the access-path indexes.
+
+The plans come from ``QuerySet.explain()``: ``EXPLAIN`` on PostgreSQL and
+``EXPLAIN QUERY PLAN`` on SQLite. Both name the index they pick, and both
+report a full-table read (``Seq Scan on`` / ``SCAN <table>``) when none fits.
+"""
+import re
+from datetime import timedelta
+
+from django.db import connection
+from django.db.models import Count
+from django.test import TestCase
+from django.utils import timezone
+
+from ems import pagination, serializers
+from ems.models import Event, Outcome
+
+from .factories import seed_dataset
+
+
+class QueryPlanTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.users, cls.categories, cls.events = seed_dataset(
+            users=20, events_per_user=200, outcomes_per_event=2, categories=25,
+        )
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute("ANALYZE")
+
+    def assertUsesIndex(self, queryset, index_name, table):
+        """Assert the plan reads ``table`` through ``index_name`` (or one of a tuple of them)."""
+        plan = queryset.explain()
+        names = index_name if isinstance(index_name, tuple) else (index_name,)
+        self.assertTrue(any(name in plan for name in names), f"{' or '.join(names)} not used:\n{plan}")
+        full_scan = (
+            rf'Seq Scan on "?{table}"?' if connection.vendor == 'postgresql'
+            else rf'\bSCAN {table}\b(?! USING)'
+        )
+        self.assertIsNone(re.search(full_scan, plan), f"Full scan of {table}:\n{plan}")
+
+    def test_home_events_by_user_and_start(self):
+        qs = Event.objects.filter(user=self.users[3]).order_by('start_date')
+        self.assertUsesIndex(qs, 'ems_event_user_start_idx', 'ems_event')
+
+    def test_chart_pending_events_by_category(self):
+        qs = (
+            Event.objects.filter(end_date__gt=timezone.now())
+            .values('category__name')
+            .annotate(count=Count('id'))
+            .order_by('category__name')
+        )
+        self.assertUsesIndex(qs, 'ems_event_end_category_idx', 'ems_event')
+
+    def test_category_events_newest_first(self):
+        qs = pagination._page_rows(serializers.CATEGORY_EVENT, self.categories[7].event_set.all(),
+                                   'start_date', None, 25)
+        self.assertUsesIndex(qs, 'ems_event_category_start_idx', 'ems_event')
+
+    def test_category_events_keyset_page(self):
+        event = Event.objects.filter(category=self.categories[7]).order_by('-start_date', '-pk')[50]
+        qs = pagination._page_rows(serializers.CATEGORY_EVENT, self.categories[7].event_set.all(),
+                                   'start_date', (event.start_date, event.pk), 25)
+        self.assertUsesIndex(qs, 'ems_event_category_start_idx', 'ems_event')
+
+    def test_timeline_window(self):
+        # The default window around today: the end_date bound is the selective
+        # one, which PostgreSQL reads through the index leading with end_date.
+        start = timezone.now() - timedelta(days=15)
+        qs = Event.objects.filter(
+            start_date__lt=start + timedelta(days=31), end_date__gte=start,
+        ).order_by('start_date')
+        self.assertUsesIndex(qs, ('ems_event_window_idx', 'ems_event_end_category_idx'), 'ems_event')
+
+    def test_outcomes_by_event_and_created(self):
+        qs = pagination._page_rows(serializers.OUTCOME, self.events[10].outcome_entries.all(),
+                                   'created_at', None, 25)
+        self.assertUsesIndex(qs, 'ems_outcome_event_created_idx', 'ems_outcome')
+
+    def test_outcomes_keyset_page(self):
+        outcome = Outcome.objects.filter(event=self.events[10]).order_by('-created_at', '-pk').first()
+        qs = pagination._page_rows(serializers.OUTCOME, self.events[10].outcome_entries.all(),
+                                   'created_at', (outcome.created_at, outcome.pk), 25)
+        self.assertUsesIndex(qs, 'ems_outcome_event_created_idx', 'ems_outcome')
+
+    def test_outcomes_by_event_and_start(self):
+        qs = Outcome.objects.filter(event=self.events[10]).order_by('-start_date')
+        self.assertUsesIndex(qs, 'ems_outcome_event_start_idx', 'ems_outcome')
@@ -0,0 +1,75 @@
+from datetime import timedelta
+from unittest import skipUnless
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import Client, TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from ems.models import Category, Event, Outcome
+from ems.search import search_events
+
+
+class SearchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username='owner')
+        category = Category.objects.create(name='Workshops')
+        now = timezone.now()
+
+        def event(name, **fields):
+            return Event.objects.create(
+                user=cls.user, name=name, category=category, project_type='other',
+                start_date=now, end_date=now + timedelta(hours=2), **fields,
+            )
+
+        cls.irrigation = event('Irrigation workshop', description='Drip systems for smallholders')
+        cls.budget = event('Budget review', organizer='Finance office')
+        cls.field_day = event('Field day', location='Kisumu')
+        Outcome.objects.create(
+            event=cls.field_day, start_date=now, end_date=now, duration=1, rappo='r',
+            topics='Soil health', outcome_text='Farmers adopt drip irrigation', recommendation='',
+        )
+
+    def test_matches_event_and_outcome_text(self):
+        found = set(search_events('irrigation'))
+        self.assertEqual(found, {self.irrigation, self.field_day})
+
+    def test_all_terms_must_match(self):
+        self.assertEqual(list(search_events('budget finance')), [self.budget])
+        self.assertEqual(list(search_events('budget kisumu')), [])
+
+    @skipUnless(connection.vendor == 'postgresql', "ranking needs PostgreSQL full-text search")
+    def test_event_text_outranks_outcome_text(self):
+        self.assertEqual(list(search_events('irrigation'))[0], self.irrigation)
+
+    def test_search_endpoint(self):
+        client = Client(HTTP_HOST='localhost')
+        client.force_login(self.user)
+        response = client.get(reverse('search_events'), {'q': 'soil'})
+        self.assertEqual([e['id'] for e in response.json()['events']], [str(self.field_day.pk)])
+        self.assertEqual(client.get(reverse('search_events')).status_code, 400)
+
+    def admin_search(self, **params):
+        admin, _ = User.objects.get_or_create(username='admin', is_staff=True, is_superuser=True)
+        client = Client(HTTP_HOST='localhost')
+        client.force_login(admin)
+        response = client.get(reverse('admin:ems_event_changelist'), params)
+        return list(response.context['cl'].queryset)
+
+    def test_admin_search_uses_full_text(self):
+        self.assertEqual(set(self.admin_search(q='drip')), {self.irrigation, self.field_day})
+
+    def test_admin_search_matches_category_and_project_type(self):
+        self.budget.project_type = 'kwp3'
+        self.budget.save()
+        self.assertEqual(len(self.admin_search(q='workshops')), 3)
+        self.assertEqual(self.admin_search(q='kwp3'), [self.budget])
+
+    @skipUnless(connection.vendor == 'postgresql', "ranking needs PostgreSQL full-text search")
+    def test_admin_search_keeps_rank_order(self):
+        self.assertEqual(self.admin_search(q='irrigation')[0], self.irrigation)
+        # Sorting by a column still wins.
+        by_name = self.admin_search(q='irrigation', o='0')
+        self.assertEqual(by_name, [self.field_day, self.irrigation])
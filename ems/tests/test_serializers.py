@@ -0,0 +1,108 @@
+from datetime import datetime, timezone as dt_timezone
+
+from django.contrib.auth.models import User
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection
+from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from ems import pagination, serializers
+from ems.models import Category, Event, Outcome
+from ems.serializers import Projection, default, iso_date
+
+from .factories import seed_dataset
+
+
+class ProjectionTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create(username='alice')
+        category = Category.objects.create(name='Workshops')
+        cls.event = Event.objects.create(
+            user=user, category=category, name='Kick-off', project_type='kwp2',
+            start_date=datetime(2025, 3, 1, 9, tzinfo=dt_timezone.utc),
+            end_date=datetime(2025, 3, 2, 17, tzinfo=dt_timezone.utc),
+        )
+
+    def test_keys_keep_their_order_and_formatters_apply(self):
+        projection = Projection(
+            id=('id', str),
+            label=('project_type', serializers.project_type_label),
+            project_type='project_type',
+            start_date=('start_date', iso_date),
+            organizer=('organizer', default('-')),
+        )
+        self.assertEqual(projection.columns, ('id', 'project_type', 'start_date', 'organizer'))
+        self.assertEqual(projection.serialize(Event.objects.all()), [{
+            'id': str(self.event.pk),
+            'label': 'PROTECT WP2',
+            'project_type': 'kwp2',
+            'start_date': '2025-03-01',
+            'organizer': '-',
+        }])
+
+    def test_only_projected_columns_are_selected(self):
+        with CaptureQueriesContext(connection) as queries:
+            serializers.PARTICIPANT_EVENT.serialize(Event.objects.all())
+        self.assertNotIn('description', queries[0]['sql'])
+        self.assertNotIn('location', queries[0]['sql'])
+
+    def test_first(self):
+        self.assertEqual(serializers.PARTICIPANT_EVENT.first(Event.objects.all())['name'], 'Kick-off')
+        self.assertIsNone(serializers.PARTICIPANT_EVENT.first(Event.objects.none()))
+
+
+class SerializedViewTests(TestCase):
+    """The projected payloads match what the views built from model instances."""
+
+    @classmethod
+    def setUpTestData(cls):
+        users, categories, _ = seed_dataset(users=2, events_per_user=6, history_days=10, future_days=10)
+        cls.user, cls.other = users
+        cls.category = categories[0]
+        cls.outcome = Outcome.objects.filter(event__user=cls.user).first()
+
+    def setUp(self):
+        self.client = Client(HTTP_HOST='localhost')
+        self.client.force_login(self.user)
+
+    def test_timeline_events_match_model_fields(self):
+        response = self.client.get(reverse('event_timeline_data'), {'view_mode': 'Month'})
+        events = response.json()['events']
+        self.assertTrue(events)
+        for payload in events:
+            event = Event.objects.get(pk=payload['id'])
+            self.assertEqual(payload, {
+                'id': str(event.id),
+                'name': event.name,
+                'project_type': event.project_type,
+                'start_date': event.start_date.strftime("%Y-%m-%d"),
+                'end_date': event.end_date.strftime("%Y-%m-%d"),
+                'description': event.description or '',
+                'organizer': event.organizer or '',
+                'outcome_count': event.outcome_count,
+            })
+
+    def test_outcome_detail(self):
+        response = self.client.get(reverse('outcome_detail', args=[self.outcome.pk]))
+        data = response.json()
+        self.assertEqual(set(data), {'id', *serializers.OUTCOME_FIELDS})
+        self.assertEqual(data['rappo'], self.outcome.rappo)
+        self.assertEqual(data['start_date'], DjangoJSONEncoder().default(self.outcome.start_date))
+
+        other = Outcome.objects.filter(event__user=self.other).first()
+        self.assertEqual(self.client.get(reverse('outcome_detail', args=[other.pk])).status_code, 404)
+
+    def test_category_page_lists_outcomes_per_event(self):
+        response = self.client.get(reverse('category_events', args=[self.category.pk]))
+        events = response.context['page']['events']
+        self.assertEqual(len(events), min(self.category.event_set.count(), pagination.DEFAULT_PAGE_SIZE))
+        for event in events:
+            self.assertEqual(
+                [outcome['id'] for outcome in event['outcomes']],
+                sorted(Outcome.objects.filter(event_id=event['id']).values_list('pk', flat=True)),
+            )
+        first = Event.objects.get(pk=events[0]['id'])
+        self.assertEqual(events[0]['project_type_label'], first.get_project_type_display())
+        self.assertContains(response, first.get_project_type_display())
@@ -0,0 +1,45 @@
+import re
+from pathlib import Path
+
+from django.test import SimpleTestCase
+
+from ems.management.commands.vendor_assets import CDN_ASSETS, VENDOR_ASSETS, VENDOR_DIR, strip_source_map
+from ems.templatetags.vendor import vendor
+
+TEMPLATES = Path(__file__).resolve().parents[1] / 'templates' / 'ems'
+VENDOR_TAG = re.compile(r"""\{% vendor ['"]([^'"]+)['"] %\}""")
+SCRIPT_TAG = re.compile(r'<script\b[^>]*\bsrc=[^>]*>')
+
+
+class StaticAssetTests(SimpleTestCase):
+    def templates(self):
+        return {path.name: path.read_text() for path in TEMPLATES.glob('*.html')}
+
+    def test_templates_link_libraries_through_vendor(self):
+        referenced = set()
+        for name, source in self.templates().items():
+            self.assertNotRegex(source, r'<(?:script|link)\b[^>]*https?://', name)
+            referenced.update(VENDOR_TAG.findall(source))
+        self.assertEqual(referenced, {*VENDOR_ASSETS, *CDN_ASSETS})
+
+    def test_vendored_files_are_committed(self):
+        for path in VENDOR_ASSETS:
+            self.assertTrue((VENDOR_DIR / path).is_file(), path)
+
+    def test_vendor_tag(self):
+        self.assertEqual(vendor('jquery/jquery.min.js'), '/static/ems/vendor/jquery/jquery.min.js')
+        self.assertEqual(vendor('chartjs/chart.umd.js'), CDN_ASSETS['chartjs/chart.umd.js'])
+
+    def test_external_scripts_are_deferred(self):
+        for name, source in self.templates().items():
+            for tag in SCRIPT_TAG.findall(source):
+                self.assertIn(' defer ', tag, name)
+
+    def test_pinned_versions(self):
+        for path, url in {**VENDOR_ASSETS, **CDN_ASSETS}.items():
+            self.assertRegex(url, r'@\d+\.\d+\.\d+/|-\d+\.\d+\.\d+\.', path)
+
+    def test_strip_source_map(self):
+        self.assertEqual(strip_source_map(b'a{}\n/*# sourceMappingURL=bootstrap.min.css.map */'), b'a{}\n')
+        self.assertEqual(strip_source_map(b'x=1;\n//# sourceMappingURL=x.js.map\n'), b'x=1;\n')
+        self.assertEqual(strip_source_map(b'x=1;'), b'x=1;\n')
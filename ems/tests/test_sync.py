@@ -0,0 +1,105 @@
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import Client, TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from ems import sync
+from ems.models import Category, Event, Outcome, Tombstone
+
+
+class DeltaSyncTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username='alice')
+        cls.workshops = Category.objects.create(name='Workshops')
+        cls.talks = Category.objects.create(name='Talks')
+        start = timezone.now() - timedelta(days=3)
+        cls.events = [
+            Event.objects.create(user=cls.user, category=cls.workshops, name=f'e{i}', project_type='other',
+                                 start_date=start + timedelta(days=i), end_date=start + timedelta(days=i, hours=2))
+            for i in range(3)
+        ]
+        cls.outcome = Outcome.objects.create(event=cls.events[0], start_date=start, end_date=start, duration=1,
+                                             rappo='r', topics='t', outcome_text='o', recommendation='r')
+        # Everything above predates the watermark the tests sync from.
+        past = timezone.now() - timedelta(days=1)
+        Event.objects.update(updated_at=past)
+        Outcome.objects.update(updated_at=past)
+
+    def setUp(self):
+        self.client = Client(HTTP_HOST='localhost')
+        self.client.force_login(self.user)
+        self.url = reverse('event_timeline_changes')
+        self.since = (timezone.now() - timedelta(hours=1)).isoformat()
+
+    def changes(self, **params):
+        response = self.client.get(self.url, {'since': self.since, **params})
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_nothing_changed(self):
+        data = self.changes()
+        self.assertEqual((data['reset'], data['events'], data['deleted']), (False, [], []))
+
+    def test_saved_and_deleted_events(self):
+        event = self.events[1]
+        event.name = 'renamed'
+        event.save()
+        deleted_pk = self.events[2].pk
+        self.events[2].delete()
+
+        data = self.changes()
+        self.assertEqual([(e['id'], e['name']) for e in data['events']], [(str(event.pk), 'renamed')])
+        self.assertEqual(data['deleted'], [str(deleted_pk)])
+
+    def test_outcome_changes_resend_their_event(self):
+        self.outcome.delete()
+        data = self.changes()
+        self.assertEqual([e['id'] for e in data['events']], [str(self.events[0].pk)])
+        self.assertEqual(data['events'][0]['outcome_count'], 0)
+
+    def test_events_leaving_the_filter_are_deleted(self):
+        self.events[0].category = self.talks
+        self.events[0].save()
+        data = self.changes(category='Workshops')
+        self.assertEqual(data['events'], [])
+        self.assertEqual(data['deleted'], [str(self.events[0].pk)])
+
+    def test_tombstones(self):
+        self.outcome.delete()
+        self.assertEqual(Tombstone.objects.get().kind, Tombstone.OUTCOME)
+        Tombstone.objects.all().delete()
+
+        Outcome.objects.create(event=self.events[1], start_date=timezone.now(), end_date=timezone.now(),
+                               duration=1, rappo='r', topics='t', outcome_text='o', recommendation='r')
+        pk = self.events[1].pk
+        self.events[1].delete()
+        # The cascaded outcome is covered by its event's tombstone.
+        self.assertEqual(list(Tombstone.objects.values_list('kind', 'event_pk')), [(Tombstone.EVENT, pk)])
+
+    def test_reset(self):
+        self.assertTrue(self.client.get(self.url).json()['reset'])
+        old = (timezone.now() - sync.TOMBSTONE_RETENTION - timedelta(days=1)).isoformat()
+        self.assertTrue(self.changes(since=old)['reset'])
+        with mock.patch.object(sync, 'MAX_CHANGES', 1):
+            Event.objects.update(updated_at=timezone.now())
+            self.assertTrue(self.changes()['reset'])
+
+    def test_invalid_watermark(self):
+        for since in ('yesterday', '2026-01-01T00:00:00'):
+            response = self.client.get(self.url, {'since': since})
+            self.assertEqual(response.status_code, 400, since)
+            self.assertIn('error', response.json())
+
+    def test_prune_tombstones(self):
+        self.events[2].delete()
+        Tombstone.objects.update(deleted_at=timezone.now() - sync.TOMBSTONE_RETENTION - timedelta(hours=1))
+        pk = self.events[1].pk
+        self.events[1].delete()
+        call_command('prune_tombstones', stdout=StringIO())
+        self.assertEqual(list(Tombstone.objects.values_list('object_id', flat=True)), [pk])
@@ -0,0 +1,70 @@
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+
+from django.contrib.auth.models import User
+from django.test import Client, TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from ems.models import Category, Event, Outcome
+
+
+def at(day):
+    return datetime.combine(day, datetime.min.time(), tzinfo=dt_timezone.utc)
+
+
+class TimelineDataTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username='owner')
+        category = Category.objects.create(name='Workshops')
+
+        def event(name, start, end):
+            return Event.objects.create(user=cls.user, category=category, project_type='other',
+                                        name=name, start_date=at(start), end_date=at(end))
+
+        cls.before = event('Before', date(2026, 2, 1), date(2026, 2, 20))
+        cls.across = event('Across', date(2026, 2, 25), date(2026, 3, 2))
+        cls.inside = event('Inside', date(2026, 3, 10), date(2026, 3, 11))
+        cls.after = event('After', date(2026, 4, 5), date(2026, 4, 6))
+        for _ in range(2):
+            Outcome.objects.create(event=cls.inside, start_date=at(date(2026, 3, 10)),
+                                   end_date=at(date(2026, 3, 10)), duration=1, rappo='r',
+                                   topics='t', outcome_text='o', recommendation='r')
+
+    def setUp(self):
+        self.client = Client(HTTP_HOST='localhost')
+        self.client.force_login(self.user)
+
+    def get(self, **params):
+        return self.client.get(reverse('event_timeline_data'), params)
+
+    def test_returns_events_overlapping_the_window(self):
+        data = self.get(view_mode='Day', start='2026-03-01').json()
+        self.assertEqual((data['start'], data['end']), ('2026-03-01', '2026-04-01'))
+        self.assertEqual({e['name']: e['outcome_count'] for e in data['events']},
+                         {'Across': 0, 'Inside': 2})
+        # Where scrolling finds the nearest events on either side.
+        self.assertEqual((data['earlier_end'], data['later_start']), ('2026-02-21', '2026-04-05'))
+
+    def test_window_is_sized_by_view_mode(self):
+        for view_mode, days in (('Day', 31), ('Week', 183), ('Month', 366)):
+            data = self.get(view_mode=view_mode, end='2026-03-01').json()
+            self.assertEqual(date.fromisoformat(data['end']) - date.fromisoformat(data['start']),
+                             timedelta(days=days))
+
+        data = self.get(view_mode='Day').json()
+        self.assertLessEqual(date.fromisoformat(data['start']), timezone.localdate())
+        self.assertGreater(date.fromisoformat(data['end']), timezone.localdate())
+
+    def test_rejects_bad_windows(self):
+        for params in ({'view_mode': 'Year'}, {'start': 'March'}, {'start': '2026-03-01', 'end': '2026-02-01'},
+                       {'start': '2020-01-01', 'end': '2026-01-01'}):
+            response = self.get(**params)
+            self.assertEqual(response.status_code, 400, params)
+            self.assertIn('error', response.json())
+
+    def test_page_is_a_shell(self):
+        response = self.client.get(reverse('event_timeline'))
+        self.assertEqual(response.status_code, 200)
+        self.assertNotContains(response, 'Inside')
+        self.assertContains(response, reverse('event_timeline_data'))
@@ -0,0 +1,80 @@
+from datetime import datetime, timedelta
+
+from django.contrib.auth.models import User
+from django.test import Client, TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from ems.models import Category, Event
+
+
+class TimelineFilterTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.alice = User.objects.create(username='alice')
+        cls.bob = User.objects.create(username='bob')
+        cls.workshops = Category.objects.create(name='Workshops')
+        cls.trainings = Category.objects.create(name='Trainings')
+        today = timezone.localdate()
+
+        def event(name, user, category, project_type, days_from_today):
+            start = timezone.make_aware(datetime.combine(today + timedelta(days=days_from_today), datetime.min.time()))
+            return Event.objects.create(user=user, category=category, project_type=project_type, name=name,
+                                        description=f'{name} notes', start_date=start,
+                                        end_date=start + timedelta(hours=8))
+
+        cls.kickoff = event('Kickoff', cls.alice, cls.workshops, 'kwp2', 0)
+        cls.review = event('Budget review', cls.bob, cls.workshops, 'kwp3', 2)
+        cls.training = event('Field training', cls.alice, cls.trainings, 'kwp2', 3)
+        cls.archive = event('Archive meeting', cls.alice, cls.workshops, 'kwp2', -400)
+
+    def setUp(self):
+        self.client = Client(HTTP_HOST='localhost')
+        self.client.force_login(self.alice)
+
+    def names(self, **params):
+        response = self.client.get(reverse('event_timeline_data'), {'view_mode': 'Day', **params})
+        self.assertEqual(response.status_code, 200, response.content)
+        return sorted(event['name'] for event in response.json()['events'])
+
+    def test_each_filter_is_applied(self):
+        self.assertEqual(self.names(), ['Budget review', 'Field training', 'Kickoff'])
+        self.assertEqual(self.names(q='budget'), ['Budget review'])
+        self.assertEqual(self.names(project_type='kwp2'), ['Field training', 'Kickoff'])
+        self.assertEqual(self.names(category='Trainings'), ['Field training'])
+        self.assertEqual(self.names(owner='bob'), ['Budget review'])
+        today = timezone.localdate()
+        self.assertEqual(self.names(**{'from': (today + timedelta(days=1)).isoformat(),
+                                       'to': (today + timedelta(days=2)).isoformat()}),
+                         ['Budget review'])
+        self.assertEqual(self.names(owner='alice', category='Workshops'), ['Kickoff'])
+
+    def test_points_at_nearest_match_outside_the_window(self):
+        data = self.client.get(reverse('event_timeline_data'), {'view_mode': 'Day'}).json()
+        archive_day = timezone.localdate(self.archive.end_date)
+        self.assertEqual(data['earlier_end'], (archive_day + timedelta(days=1)).isoformat())
+        self.assertIsNone(data['later_start'])
+
+        jumped = self.client.get(reverse('event_timeline_data'),
+                                 {'view_mode': 'Day', 'end': data['earlier_end']}).json()
+        self.assertEqual([event['name'] for event in jumped['events']], ['Archive meeting'])
+        self.assertFalse(jumped['has_earlier'])
+
+    def test_date_range_moves_the_first_window(self):
+        to = timezone.localdate() - timedelta(days=300)
+        data = self.client.get(reverse('event_timeline_data'), {'view_mode': 'Day', 'to': to.isoformat()}).json()
+        self.assertEqual(data['end'], (to + timedelta(days=1)).isoformat())
+        self.assertEqual(data['events'], [])
+        self.assertEqual(data['earlier_end'],
+                         (timezone.localdate(self.archive.end_date) + timedelta(days=1)).isoformat())
+
+    def test_invalid_filters_are_rejected(self):
+        url = reverse('event_timeline_data')
+        self.assertEqual(self.client.get(url, {'project_type': 'nope'}).status_code, 400)
+        self.assertEqual(self.client.get(url, {'from': 'yesterday'}).status_code, 400)
+
+    def test_page_reflects_url_filters(self):
+        response = self.client.get(reverse('event_timeline'), {'category': 'Trainings', 'q': 'field'})
+        self.assertContains(response, '<option value="Trainings" selected>', html=False)
+        self.assertContains(response, 'value="field"')
+        self.assertEqual(list(response.context['owners']), ['alice', 'bob'])
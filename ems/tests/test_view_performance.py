@@ -0,0 +1,270 @@
+"""Query budgets for every view in ems.urls.
+
+Each view is requested against a small and a large seeded dataset. Both must
+stay within the same fixed budget, so a query count that grows with the
+number of events (M) or outcomes per event (K) fails the large run.
+
+Set ``EMS_PERF_REPORT=/path/to/file.jsonl`` to append the measured query
+count, wall time and response size of every view, one JSON line per dataset,
+so runs can be compared over time.
+"""
+import json
+import os
+import time
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from ems.models import Category, Event, Outcome
+
+from .factories import seed_dataset
+
+# Budgets are totals per request; authenticated requests spend 1 of them
+# loading the user (the cached_db session is read from the cache).
+VIEW_BUDGETS = {
+    'login': 0,
+    'logout': 3,
+    'home': 1,
+    'home_data': 2,
+    'category_list': 2,
+    'create_category': 1,
+    'create_category_post': 2,
+    'category_events': 4,
+    'category_events_data': 4,
+    'delete_category_post': 6,
+    'create_event': 2,
+    'create_event_post': 8,
+    'update_event': 4,
+    'update_event_post': 12,
+    'delete_event_post': 9,
+    'import_events': 1,
+    'export_events': 1,
+    'event_timeline': 3,
+    'event_timeline_data': 5,
+    'event_timeline_data_filtered': 5,
+    'event_timeline_changes': 5,
+    'event_chart': 3,
+    'outcome_analytics': 1,
+    'analytics_data': 5,
+    'participant_list': 2,
+    'participant_events': 3,
+    'search_events': 2,
+    'request_stats': 1,
+    'outcome_list': 3,
+    'outcome_list_post': 4,
+    'outcome_detail': 2,
+    'outcome_update_post': 4,
+    'outcome_batch_post': 7,
+}
+
+
+class ViewBudgetMixin:
+    USERS = 3
+    EVENTS = 5      # M: events per user
+    OUTCOMES = 1    # K: outcomes per past event
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.users, cls.categories, cls.events = seed_dataset(
+            users=cls.USERS,
+            events_per_user=cls.EVENTS,
+            outcomes_per_event=cls.OUTCOMES,
+            categories=2,
+            history_days=60,
+            future_days=30,
+            prefix=f"m{cls.EVENTS}",
+        )
+        cls.user = cls.users[0]
+        cls.empty_category = Category.objects.create(name=f"m{cls.EVENTS}-empty")
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.results = {}
+
+    @classmethod
+    def tearDownClass(cls):
+        path = os.environ.get('EMS_PERF_REPORT')
+        if path and cls.results:
+            with open(path, 'a') as report:
+                report.write(json.dumps({
+                    'timestamp': timezone.now().isoformat(),
+                    'vendor': connection.vendor,
+                    'dataset': {'users': cls.USERS, 'events': cls.EVENTS, 'outcomes': cls.OUTCOMES},
+                    'views': cls.results,
+                }) + "\n")
+        super().tearDownClass()
+
+    def setUp(self):
+        cache.clear()
+        self.client = Client(HTTP_HOST='localhost')
+        self.client.force_login(self.user)
+        # An event of the user with outcomes, in the shared category.
+        self.event = Event.objects.filter(user=self.user, outcome_entries__isnull=False).first()
+        self.outcome = self.event.outcome_entries.first()
+
+    def measure(self, name, method, url, data=None, **extra):
+        with CaptureQueriesContext(connection) as queries:
+            started = time.perf_counter()
+            response = getattr(self.client, method)(url, data or {}, **extra)
+            elapsed = time.perf_counter() - started
+        self.assertLess(response.status_code, 400, f"{name} returned {response.status_code}")
+        size = len(response.content) if not response.streaming else None
+        self.results[name] = {
+            'queries': len(queries),
+            'ms': round(elapsed * 1000, 2),
+            'bytes': size,
+        }
+        self.assertLessEqual(
+            len(queries), VIEW_BUDGETS[name],
+            f"{name} ran {len(queries)} queries (budget {VIEW_BUDGETS[name]}):\n"
+            + "\n".join(q['sql'] for q in queries.captured_queries),
+        )
+        return response
+
+    def event_form(self):
+        return {
+            'name': 'Budget event',
+            'category': self.categories[0].pk,
+            'project_type': 'other',
+            'start_date': '2026-01-01T09:00',
+            'end_date': '2026-01-02T17:00',
+            'description': 'd',
+            'location': 'l',
+            'organizer': 'o',
+            'participants': 'Alice, Bob',
+        }
+
+    def outcome_form(self):
+        return {
+            'start_date': '2026-01-01T09:00',
+            'end_date': '2026-01-01T17:00',
+            'duration': '8',
+            'rappo': 'r',
+            'topics': 't',
+            'outcome_text': 'o',
+            'recommendation': 'rec',
+        }
+
+    def test_login(self):
+        self.client.logout()
+        self.measure('login', 'get', reverse('login'))
+
+    def test_logout(self):
+        self.measure('logout', 'get', reverse('logout'))
+
+    def test_home(self):
+        self.measure('home', 'get', reverse('home'))
+
+    def test_home_data(self):
+        self.measure('home_data', 'get', reverse('home_data'))
+
+    def test_category_list(self):
+        self.measure('category_list', 'get', reverse('category_list'))
+
+    def test_create_category(self):
+        self.measure('create_category', 'get', reverse('create_category'))
+        self.measure('create_category_post', 'post', reverse('create_category'), {'name': 'New programme'})
+
+    def test_category_events(self):
+        self.measure('category_events', 'get', reverse('category_events', args=[self.categories[0].pk]))
+
+    def test_category_events_data(self):
+        url = reverse('category_events_data', args=[self.categories[0].pk])
+        first = self.measure('category_events_data', 'get', url, {'limit': 2}).json()
+        self.assertIsNotNone(first['next_cursor'])
+        self.measure('category_events_data', 'get', url, {'limit': 2, 'cursor': first['next_cursor']})
+
+    def test_delete_category(self):
+        self.measure('delete_category_post', 'post', reverse('delete_category', args=[self.empty_category.pk]))
+        self.assertFalse(Category.objects.filter(pk=self.empty_category.pk).exists())
+
+    def test_create_event(self):
+        self.measure('create_event', 'get', reverse('create_event'))
+        self.measure('create_event_post', 'post', reverse('create_event'), self.event_form())
+
+    def test_update_event(self):
+        url = reverse('update_event', args=[self.event.pk])
+        self.measure('update_event', 'get', url)
+        self.measure('update_event_post', 'post', url, self.event_form())
+
+    def test_delete_event(self):
+        self.measure('delete_event_post', 'post', reverse('delete_event', args=[self.event.pk]))
+        self.assertFalse(Outcome.objects.filter(event_id=self.event.pk).exists())
+
+    def test_import_events(self):
+        self.user.is_staff = True
+        self.user.save()
+        self.measure('import_events', 'get', reverse('import_events'))
+
+    def test_export_events(self):
+        response = self.measure('export_events', 'get', reverse('export_events'), {'format': 'ndjson'})
+        with CaptureQueriesContext(connection) as queries:
+            b"".join(response.streaming_content)
+        self.assertEqual(len(queries), 1)
+
+    def test_event_timeline(self):
+        self.measure('event_timeline', 'get', reverse('event_timeline'))
+        self.measure('event_timeline_data', 'get', reverse('event_timeline_data'), {'view_mode': 'Month'})
+        self.measure('event_timeline_data_filtered', 'get', reverse('event_timeline_data'), {
+            'view_mode': 'Month', 'q': 'event', 'project_type': 'kwp2',
+            'category': self.categories[0].name, 'owner': self.user.username,
+        })
+        since = (timezone.now() - timedelta(days=1)).isoformat()
+        self.measure('event_timeline_changes', 'get', reverse('event_timeline_changes'), {'since': since})
+
+    def test_search_events(self):
+        self.measure('search_events', 'get', reverse('search_events'), {'q': 'event'})
+
+    def test_participants(self):
+        self.measure('participant_list', 'get', reverse('participant_list'))
+        participant = self.event.attendees.first()
+        self.measure('participant_events', 'get', reverse('participant_events', args=[participant.pk]))
+
+    def test_event_chart(self):
+        self.measure('event_chart', 'get', reverse('event_chart'))
+
+    def test_outcome_analytics(self):
+        self.measure('outcome_analytics', 'get', reverse('outcome_analytics'))
+        self.measure('analytics_data', 'get', reverse('analytics_data'), {'bucket': 'week', 'group': 'category'})
+
+    def test_request_stats(self):
+        self.user.is_staff = True
+        self.user.save()
+        self.measure('request_stats', 'get', reverse('request_stats'))
+
+    def test_outcome_list(self):
+        url = reverse('outcome_list', args=[self.event.pk])
+        self.measure('outcome_list', 'get', url)
+        self.measure('outcome_list_post', 'post', url, self.outcome_form())
+
+    def test_outcome_detail(self):
+        self.measure('outcome_detail', 'get', reverse('outcome_detail', args=[self.outcome.pk]))
+
+    def test_outcome_update(self):
+        self.measure('outcome_update_post', 'post', reverse('outcome_update', args=[self.outcome.pk]),
+                     self.outcome_form())
+
+    def test_outcome_batch(self):
+        # Constant in the batch size: 20 creates across events plus updates of existing outcomes.
+        events = Event.objects.filter(user=self.user)[:4]
+        outcomes = Outcome.objects.filter(event__user=self.user)[:5]
+        items = [{'event': event.pk, **self.outcome_form()} for event in events for _ in range(5)]
+        items += [{'id': outcome.pk, **self.outcome_form()} for outcome in outcomes]
+        self.measure('outcome_batch_post', 'post', reverse('outcome_batch'),
+                     json.dumps({'outcomes': items}), content_type='application/json')
+
+
+class SmallDatasetViewBudgetTests(ViewBudgetMixin, TestCase):
+    EVENTS = 5
+    OUTCOMES = 1
+
+
+class LargeDatasetViewBudgetTests(ViewBudgetMixin, TestCase):
+    EVENTS = 60
+    OUTCOMES = 6
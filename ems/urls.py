@@ -1,7 +1,11 @@
+from django.conf import settings
 from django.urls import path
-from . import views
+from . import async_views, views
 from django.contrib.auth import views as auth_views
 
+# Outcome endpoints: async views when served through platlog.asgi.
+outcome_views = async_views if getattr(settings, 'EMS_ASYNC_OUTCOMES', False) else views
+
 urlpatterns = [
     # Auth
     #path('accounts/login/', auth_views.LoginView.as_view(template_name='ems/login.html'), name='login'),
@@ -10,20 +14,34 @@ urlpatterns = [
     path("logout/", views.user_logout, name="logout"),
     # Home
     path('', views.home, name='home'),
+    path('home/data/', views.home_data, name='home_data'),
     # Categories
     path('categories/', views.category_list, name='category_list'),
     path('categories/create/', views.create_category, name='create_category'),
     path('categories/<int:category_id>/', views.category_events, name='category_events'),
+    path('categories/<int:category_id>/data/', views.category_events_data, name='category_events_data'),
     path('categories/delete/<int:category_id>/', views.delete_category, name='delete_category'),
     # Events
     path('events/create/', views.create_event, name='create_event'),
     path('events/update/<int:event_id>/', views.update_event, name='update_event'),
     path('events/delete/<int:event_id>/', views.delete_event, name='delete_event'),
+    path('events/import/', views.import_events, name='import_events'),
+    path('events/export/', views.export_events, name='export_events'),
+    # Participants
+    path('participants/', views.participant_list, name='participant_list'),
+    path('participants/<int:participant_id>/events/', views.participant_events, name='participant_events'),
     # Event timeline & chart
     path('timeline/', views.event_timeline, name='event_timeline'),
+    path('timeline/data/', views.event_timeline_data, name='event_timeline_data'),
+    path('timeline/changes/', views.event_timeline_changes, name='event_timeline_changes'),
+    path('search/', views.search_events, name='search_events'),
     path('event-chart/', views.event_chart, name='event_chart'),
+    path('analytics/', views.outcome_analytics, name='outcome_analytics'),
+    path('analytics/data/', views.analytics_data, name='analytics_data'),
+    path('stats/requests/', views.request_stats, name='request_stats'),
     # Outcomes
-    path('events/<int:event_id>/outcomes/', views.outcome_list, name='outcome_list'),  # Create new outcomes & list
-    path('outcomes/<int:outcome_id>/', views.outcome_detail, name='outcome_detail'),   # Get single outcome
-    path('outcomes/<int:outcome_id>/update/', views.outcome_update, name='outcome_update'),  # Update existing outcome
+    path('events/<int:event_id>/outcomes/', outcome_views.outcome_list, name='outcome_list'),  # Create new outcomes & list
+    path('outcomes/<int:outcome_id>/', outcome_views.outcome_detail, name='outcome_detail'),   # Get single outcome
+    path('outcomes/<int:outcome_id>/update/', outcome_views.outcome_update, name='outcome_update'),  # Update existing outcome
+    path('outcomes/batch/', views.outcome_batch, name='outcome_batch'),  # Create & update many outcomes (JSON)
 ]
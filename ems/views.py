@@ -1,14 +1,25 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib import messages
 from django.utils import timezone
-from datetime import timedelta
-from django.db.models import Count
+from datetime import datetime, time, timedelta
+from django.db.models import BooleanField, Count, ExpressionWrapper, Max, Min, Q, Sum
+from django.core.cache import cache
 import json
-from django.utils import timezone
+import os
+from django.utils.dateparse import parse_date
 from django.contrib.auth.decorators import login_required
-from .models import Category, Event, Outcome
-from django.http import JsonResponse
+from django.views.decorators.cache import cache_control
+from django.contrib.admin.views.decorators import staff_member_required
+from . import aggregates, analytics, exporters, instrumentation, pagination, search, serializers, sync
+from .conditional import content_etag, not_modified, set_validators, validators
+from .caching import HOME_CACHE_TIMEOUT, HOME_SHELL_MAX_AGE, home_cache_key
+from .importers import detect_format, import_file
+from .models import Category, Event, Outcome, Participant
+from .outcome_batch import MAX_BATCH_SIZE, apply_outcome_batch
+from .participants import link_participants
+from django.http import Http404, HttpResponse, JsonResponse, StreamingHttpResponse
 from django.contrib.auth import authenticate, login, logout
+from django.contrib.auth.models import User
 
 def user_login(request):
     if request.method == "POST":
@@ -34,40 +45,56 @@ def category_list(request):
     return render(request, 'ems/category_list.html', {'categories': categories})
 
 @login_required(login_url='login')
+@cache_control(private=True, max_age=HOME_SHELL_MAX_AGE)
 def home(request):
-    logs = Event.objects.filter(user=request.user).prefetch_related('outcome_entries').order_by('start_date')
-
-    now = timezone.now()  # this is datetime.datetime
+    """Render the dashboard shell; its events are fetched from home_data."""
+    return render(request, 'ems/home.html')
 
-    logs_list = []
-    for event in logs:
-        # count related outcomes
-        outcome_count = event.outcome_entries.count()
 
-        # ensure start_date and end_date are datetime.datetime
-        start_dt = event.start_date
-        end_dt = event.end_date
-
-        # flags for frontend
-        is_upcoming = end_dt and end_dt >= now
-        is_pending = end_dt and end_dt < now and outcome_count == 0
+@login_required(login_url='login')
+def home_data(request):
+    """Return the dashboard events as JSON, revalidated by ETag."""
+    cache_key = home_cache_key(request.user.pk)
+    cached = cache.get(cache_key)
+    if cached is None:
+        logs_json, timeout = _home_payload(request.user)
+        cached = (logs_json, content_etag(logs_json))
+        cache.set(cache_key, cached, timeout)
+
+    logs_json, etag = cached
+    response = not_modified(request, etag, None)
+    if response is not None:
+        return response
+    return set_validators(HttpResponse(logs_json, content_type='application/json'), etag, None)
+
+
+def _home_payload(user):
+    """Build the dashboard JSON for a user and the number of seconds it stays valid."""
+    now = timezone.now()  # this is datetime.datetime
+    logs = (
+        Event.objects.filter(user=user)
+        .annotate(
+            # flags for frontend; is_pending matches Event.objects.awaiting_outcome()
+            is_upcoming=ExpressionWrapper(Q(end_date__gte=now), output_field=BooleanField()),
+            is_pending=ExpressionWrapper(
+                Q(end_date__lt=now) & Q(outcome_count=0), output_field=BooleanField()
+            ),
+        )
+        .order_by('start_date')
+    )
+    rows = serializers.HOME_EVENT.rows(logs)
 
-        logs_list.append({
-            'id': event.id,
-            'name': event.name or "Unnamed",
-            'project_type': event.project_type or "other",
-            'description': event.description or "",
-            'organizer': event.organizer or "",
-            'start_date': start_dt.strftime("%Y-%m-%d") if start_dt else "",
-            'end_date': end_dt.strftime("%Y-%m-%d") if end_dt else "",
-            'outcome_count': outcome_count,
-            'is_upcoming': is_upcoming,
-            'is_pending': is_pending,
-        })
+    # The flags flip once an upcoming event ends, so the payload must not outlive that.
+    columns = serializers.HOME_EVENT.columns
+    end_at, upcoming = columns.index('end_date'), columns.index('is_upcoming')
+    # HOME_CACHE_TIMEOUT caps it: other workers' caches miss the signal invalidation.
+    timeout = min([
+        HOME_CACHE_TIMEOUT,
+        *((row[end_at] - now).total_seconds() + 1 for row in rows if row[upcoming]),
+    ])
+    logs_list = serializers.HOME_EVENT.format_all(rows)
 
-    return render(request, 'ems/home.html', {
-        'logs_json': json.dumps(logs_list)
-    })
+    return json.dumps(logs_list), max(1, int(timeout))
 
 
 
@@ -99,10 +126,35 @@ def delete_category(request, category_id):
 
 @login_required(login_url='login')
 def category_events(request, category_id):
-    """Display all events under a specific category."""
+    """Display the newest events under a category; the page loads more from category_events_data."""
     category = get_object_or_404(Category, pk=category_id)
-    events = category.event_set.all().order_by('-start_date')
-    return render(request, 'ems/category_events.html', {'category': category, 'events': events})
+    page = _category_events_page(category, None, pagination.DEFAULT_PAGE_SIZE)
+    return render(request, 'ems/category_events.html', {'category': category, 'page': page})
+
+
+@login_required(login_url='login')
+def category_events_data(request, category_id):
+    """Return the category's events after ``cursor``, newest first, with their outcomes."""
+    category = get_object_or_404(Category, pk=category_id)
+    try:
+        after, size = pagination.page_params(request.GET)
+    except ValueError as exc:
+        return JsonResponse({"error": str(exc)}, status=400)
+    return JsonResponse(_category_events_page(category, after, size))
+
+
+def _category_events_page(category, after, size):
+    events, next_cursor = pagination.paginate(
+        serializers.CATEGORY_EVENT, category.event_set.all(), 'start_date', after, size
+    )
+    outcomes = {}
+    for outcome in serializers.CATEGORY_OUTCOME.serialize(
+        Outcome.objects.filter(event_id__in=[event['id'] for event in events]).order_by('pk')
+    ):
+        outcomes.setdefault(outcome['event_id'], []).append(outcome)
+    for event in events:
+        event['outcomes'] = outcomes.get(event['id'], [])
+    return {'events': events, 'next_cursor': next_cursor}
 
 
 # ------------------------------
@@ -126,7 +178,7 @@ def create_event(request):
 
         category = get_object_or_404(Category, pk=category_id)
 
-        Event.objects.create(
+        event = Event.objects.create(
             user=request.user,
             name=name,
             category=category,
@@ -138,6 +190,7 @@ def create_event(request):
             organizer=organizer,
             participants=participants,
         )
+        link_participants([event], replace=False)
 
         messages.success(request, f'Event "{name}" created successfully.')
         return redirect('event_timeline')
@@ -161,6 +214,7 @@ def update_event(request, event_id):
         event.organizer = request.POST.get('organizer')
         event.participants = request.POST.get('participants', '')
         event.save()
+        link_participants([event])
         messages.success(request, f'Event "{event.name}" updated successfully.')
         return redirect('event_timeline')
 
@@ -180,24 +234,142 @@ def delete_event(request, event_id):
     return redirect('event_timeline')
 
 
+# ------------------------------
+# PARTICIPANTS
+# ------------------------------
+@login_required(login_url='login')
+def participant_list(request):
+    """Participants ranked by how many events they attended, optionally within a date range."""
+    try:
+        events = exporters.filter_events(start=request.GET.get('start'), end=request.GET.get('end'))
+    except ValueError as exc:
+        return JsonResponse({"error": str(exc)}, status=400)
+
+    participants = (
+        Participant.objects.filter(events__in=events)
+        .annotate(event_count=Count('events'))
+        .order_by('-event_count', 'name')
+        .values('id', 'name', 'event_count')[:100]
+    )
+    return JsonResponse({'participants': list(participants)})
+
+
+@login_required(login_url='login')
+def participant_events(request, participant_id):
+    """List the events a participant attended, newest first."""
+    participant = get_object_or_404(Participant, pk=participant_id)
+    events = serializers.PARTICIPANT_EVENT.serialize(participant.events.order_by('-start_date'))
+    return JsonResponse({
+        'participant': {'id': participant.id, 'name': participant.name},
+        'events': events,
+    })
+
+
 # ------------------------------
 # ANALYTICS / VISUALIZATION
 # ------------------------------
 @login_required(login_url='login')
 def event_chart(request):
     """Display pending (upcoming or ongoing) events by category as a bar chart."""
-    now = timezone.now()
-    pending_counts_qs = (
-        Event.objects.filter(end_date__gt=now)
-        .values('category__name')
-        .annotate(count=Count('id'))
-        .order_by('category__name')
-    )
-    pending_counts = {item['category__name']: item['count'] for item in pending_counts_qs}
+    pending_counts = aggregates.pending_counts()
 
     return render(request, 'ems/event_chart.html', {'pending_counts': pending_counts})
 
 
+@login_required(login_url='login')
+def outcome_analytics(request):
+    """Render the outcome-hours chart; its rows are fetched from analytics_data."""
+    return render(request, 'ems/analytics.html', {
+        'buckets': list(analytics.BUCKETS),
+        'groups': [(name, name.replace('_', ' ').capitalize()) for name in analytics.GROUPS],
+    })
+
+
+@login_required(login_url='login')
+def analytics_data(request):
+    """Return outcome hours, outcome counts and event counts per bucket and group as JSON."""
+    try:
+        bucket, group, start, end = analytics.parse_params(request.GET)
+    except ValueError as exc:
+        return JsonResponse({"error": str(exc)}, status=400)
+
+    rows = analytics.outcome_hours(bucket, group, start, end)
+    return JsonResponse({
+        'bucket': bucket,
+        'group': group,
+        'start': start.isoformat(),
+        'end': end.isoformat(),
+        'rows': rows,
+        'totals': {
+            'hours': round(sum(row['hours'] for row in rows), 2),
+            'outcomes': sum(row['outcomes'] for row in rows),
+            'events': sum(row['events'] for row in rows),
+        },
+    })
+
+
+@staff_member_required
+def import_events(request):
+    """Bulk-load events and outcomes from an uploaded CSV or JSONL file."""
+    result = None
+    if request.method == 'POST':
+        upload = request.FILES.get('file')
+        if upload is None:
+            messages.error(request, "Choose a file to import.")
+        else:
+            fmt = request.POST.get('format') or detect_format(upload.name)
+            if fmt not in ('csv', 'jsonl'):
+                messages.error(request, "Unsupported file format.")
+            else:
+                result = import_file(upload.file, fmt, default_user=request.user)
+                messages.success(
+                    request,
+                    f"Imported {result.events} events and {result.outcomes} outcomes "
+                    f"({result.error_count} rows rejected).",
+                )
+    return render(request, 'ems/import_events.html', {'result': result})
+
+
+@login_required(login_url='login')
+def export_events(request):
+    """Stream events with their outcomes as CSV or NDJSON.
+
+    Staff may export any user's events; everyone else exports their own.
+    """
+    fmt = request.GET.get('format', 'csv')
+    if fmt not in exporters.FORMATS:
+        return JsonResponse({"error": f"Unsupported format {fmt!r}"}, status=400)
+    owner = request.GET.get('user') if request.user.is_staff else request.user.username
+    try:
+        events = exporters.filter_events(
+            user=owner,
+            category=request.GET.get('category'),
+            project_type=request.GET.get('project_type'),
+            start=request.GET.get('start'),
+            end=request.GET.get('end'),
+            awaiting_outcome=request.GET.get('awaiting_outcome') == '1',
+        )
+    except ValueError as exc:
+        return JsonResponse({"error": str(exc)}, status=400)
+
+    response = StreamingHttpResponse(
+        exporters.iter_export(events, fmt), content_type=exporters.FORMATS[fmt],
+    )
+    filename = f"events-{timezone.now():%Y%m%d}.{fmt}"
+    response.headers['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
+
+@staff_member_required
+def request_stats(request):
+    """Per-view request counters collected by this worker process."""
+    return JsonResponse({
+        'pid': os.getpid(),
+        'slow_request_ms': instrumentation.SLOW_REQUEST_MS,
+        'views': instrumentation.view_stats(),
+    })
+
+
 @login_required(login_url='login')
 def event_time(request):
     # Fetch all events for the current user
@@ -205,8 +377,7 @@ def event_time(request):
 
     logs_list = []
     for event in events:
-        # Count related outcome entries for this event
-        outcome_count = event.outcome_entries.count()
+        outcome_count = event.outcome_count
 
         logs_list.append({
             'id': event.id,
@@ -289,69 +460,211 @@ def outcome_list_create(request, event_id):
 
     return JsonResponse({"error": "Invalid method"}, status=405)
 
+# Span fetched per request for each Gantt view mode; the page asks for the
+# next window when the user scrolls towards either edge.
+TIMELINE_WINDOWS = {
+    'Day': timedelta(days=31),
+    'Week': timedelta(days=183),
+    'Month': timedelta(days=366),
+}
+TIMELINE_MAX_WINDOW = timedelta(days=3 * 366)
+
+
+# Filter parameters shared by the timeline page (kept in its URL) and the data endpoint.
+TIMELINE_FILTERS = ('q', 'project_type', 'category', 'owner', 'from', 'to')
+
+
 @login_required(login_url='login')
 def event_timeline(request):
-    """Render timeline with events and related outcomes."""
-    #events = Event.objects.filter(user=request.user).order_by('start_date')
-    events = Event.objects.all().order_by('start_date')
+    """Render the timeline shell; events are fetched window by window."""
+    return render(request, 'ems/event_timeline.html', {
+        'filters': {name: request.GET.get(name, '') for name in TIMELINE_FILTERS},
+        'project_types': Event.PROJECT_TYPES,
+        'categories': Category.objects.order_by('name').values_list('name', flat=True),
+        'owners': User.objects.filter(event__isnull=False).distinct().order_by('username')
+                  .values_list('username', flat=True),
+    })
 
-    logs_list = []
-    for event in events:
-        # Get all outcomes related to this event
-        outcomes = event.outcome_entries.all().order_by('-start_date')
-        outcome_entries = [
-            {
-                'outcome_text': o.outcome_text,
-                'recommendation': o.recommendation or '',
-                'start_date': o.start_date.strftime("%Y-%m-%d") if o.start_date else '',
-                'end_date': o.end_date.strftime("%Y-%m-%d") if o.end_date else ''
-            } 
-            for o in outcomes
-        ]
 
-        logs_list.append({
-            'id': str(event.id),
-            'name': event.name or "Unnamed",
-            'project_type': event.project_type or 'other',
-            'start_date': event.start_date.strftime("%Y-%m-%d") if event.start_date else '',
-            'end_date': event.end_date.strftime("%Y-%m-%d") if event.end_date else '',
-            'description': event.description or '',
-            'organizer': event.organizer or '',
-            'outcomes_entries': outcome_entries  # <-- use Outcome model instead of flat field
-        })
+def _timeline_events(request):
+    """Events matching the timeline's filter parameters, all applied in SQL."""
+    #events = Event.objects.filter(user=request.user)
+    events = exporters.filter_events(
+        user=request.GET.get('owner'),
+        category=request.GET.get('category'),
+        project_type=request.GET.get('project_type'),
+        start=request.GET.get('from'),
+        end=request.GET.get('to'),
+    )
+    query = request.GET.get('q', '').strip()
+    if query:
+        events = search.match_events(query, events)
+    return events
+
+
+def _timeline_window(request):
+    """Resolve the (start, end, view_mode) window requested by the timeline."""
+    view_mode = request.GET.get('view_mode', 'Day')
+    if view_mode not in TIMELINE_WINDOWS:
+        raise ValueError(f"Unknown view mode {view_mode!r}")
+    span = TIMELINE_WINDOWS[view_mode]
+
+    start = end = None
+    if request.GET.get('start'):
+        start = parse_date(request.GET['start'])
+        if start is None:
+            raise ValueError("start must be a YYYY-MM-DD date")
+    if request.GET.get('end'):
+        end = parse_date(request.GET['end'])
+        if end is None:
+            raise ValueError("end must be a YYYY-MM-DD date")
+
+    if start is None and end is None:
+        start = timezone.now().date() - span / 2
+        # Open inside the filtered date range when today lies outside it.
+        range_start = parse_date(request.GET.get('from') or '')
+        range_end = parse_date(request.GET.get('to') or '')
+        if range_start and start + span <= range_start:
+            start = range_start
+        elif range_end and start > range_end:
+            start = range_end + timedelta(days=1) - span
+    if start is None:
+        start = end - span
+    if end is None:
+        end = start + span
+    if end <= start:
+        raise ValueError("end must be after start")
+    if end - start > TIMELINE_MAX_WINDOW:
+        raise ValueError("Requested window is too large")
+    return start, end, view_mode
 
-    # Placeholder if no events exist
-    if not logs_list:
-        today = timezone.now().date()
-        week_start = today - timedelta(days=today.weekday())
-        week_end = week_start + timedelta(days=6)
-        logs_list.append({
-            "id": "placeholder",
-            "name": "No Activities Logged Yet",
-            "project_type": "placeholder",
-            "start_date": week_start.isoformat(),
-            "end_date": week_end.isoformat(),
-            "description": "",
-            "organizer": "",
-            "outcomes_entries": []
-        })
 
-    return render(request, 'ems/event_timeline.html', {
-        'logs_json': json.dumps(logs_list)
+@login_required(login_url='login')
+def event_timeline_data(request):
+    """Return the events overlapping a date window as JSON for the Gantt chart."""
+    try:
+        start, end, view_mode = _timeline_window(request)
+        events = _timeline_events(request)
+    except ValueError as exc:
+        return JsonResponse({"error": str(exc)}, status=400)
+
+    tz = timezone.get_current_timezone()
+    start_dt = datetime.combine(start, time.min, tzinfo=tz)
+    end_dt = datetime.combine(end, time.min, tzinfo=tz)
+
+    in_window = events.filter(start_date__lt=end_dt, end_date__gte=start_dt)
+    # Nearest matches outside the window, so scrolling can jump straight to them
+    # instead of stepping through empty windows when filters are narrow.
+    earlier = events.filter(end_date__lt=start_dt).aggregate(last=Max('end_date'))['last']
+    later = events.filter(start_date__gte=end_dt).aggregate(first=Min('start_date'))['first']
+    earlier_end = (timezone.localdate(earlier) + timedelta(days=1)).isoformat() if earlier else None
+    later_start = timezone.localdate(later).isoformat() if later else None
+    # Outcomes only show up here as counts, so the denormalised stats suffice.
+    summary = in_window.aggregate(
+        last_modified=Max('updated_at'),
+        events=Count('id'),
+        outcomes=Sum('outcome_count'),
+        last_outcome=Max('last_outcome_at'),
+    )
+    last_modified = max(filter(None, (summary['last_modified'], summary['last_outcome'])), default=None)
+    # The default window moves with the date under the same URL, so it is part
+    # of the ETag even when nothing in it changed.
+    etag, last_modified = validators(last_modified, summary['events'], summary['outcomes'],
+                                     earlier_end, later_start, start, end, view_mode)
+    response = not_modified(request, etag, last_modified)
+    if response is not None:
+        return response
+
+    logs_list = serializers.TIMELINE_EVENT.serialize(in_window.order_by('start_date'))
+
+    return set_validators(JsonResponse({
+        'view_mode': view_mode,
+        'start': start.isoformat(),
+        'end': end.isoformat(),
+        'has_earlier': earlier_end is not None,
+        'has_later': later_start is not None,
+        'earlier_end': earlier_end,
+        'later_start': later_start,
+        'events': logs_list,
+    }), etag, last_modified)
+
+
+@login_required(login_url='login')
+def event_timeline_changes(request):
+    """Return the timeline events changed or deleted since the ``since`` watermark.
+
+    Events that changed but no longer match the filters are reported as
+    deleted. Without a usable watermark the response only carries a fresh one
+    and ``reset``, telling the client to reload its windows.
+    """
+    watermark = timezone.now()
+    try:
+        since = sync.parse_watermark(request.GET.get('since'))
+        events = _timeline_events(request)
+    except ValueError as exc:
+        return JsonResponse({"error": str(exc)}, status=400)
+
+    payload = {'watermark': watermark.isoformat(), 'reset': True, 'events': [], 'deleted': []}
+    if since is None or sync.expired(since, watermark):
+        return JsonResponse(payload)
+    changed, deleted = sync.changed_events(since)
+    if len(changed) + len(deleted) > sync.MAX_CHANGES:
+        return JsonResponse(payload)
+
+    upserted = serializers.TIMELINE_EVENT.serialize(events.filter(pk__in=changed)) if changed else []
+    matching = {int(event['id']) for event in upserted}
+    payload.update(
+        reset=False,
+        events=upserted,
+        deleted=[str(pk) for pk in sorted(deleted | (changed - matching))],
+    )
+    return JsonResponse(payload)
+
+
+SEARCH_LIMIT = 100
+
+
+@login_required(login_url='login')
+def search_events(request):
+    """Return events matching ``q``, best matches first, for the timeline search."""
+    query = request.GET.get('q', '').strip()
+    if not query:
+        return JsonResponse({"error": "q is required"}, status=400)
+
+    #events = Event.objects.filter(user=request.user)
+    events = Event.objects.all()
+    results = search.search_events(query, events)[:SEARCH_LIMIT]
+
+    return JsonResponse({
+        'query': query,
+        'events': serializers.SEARCH_RESULT.serialize(results),
     })
 
 
 @login_required(login_url='login')
 def outcome_list(request, event_id):
-    """Return all outcomes for an event (GET) or create new outcome (POST)."""
-    event = get_object_or_404(Event, pk=event_id, user=request.user)
+    """Return a page of an event's outcomes, newest first (GET), or create new outcome (POST)."""
+    events = Event.objects.filter(user=request.user)
+    if request.method == "GET":
+        # Validators come with the ownership check, in the same query.
+        events = events.annotate(outcomes_modified=Max('outcome_entries__updated_at'),
+                                 outcome_total=Count('outcome_entries'))
+    event = get_object_or_404(events, pk=event_id)
 
     if request.method == "GET":
-        outcomes = list(event.outcome_entries.order_by("-created_at").values(
-            "id", "start_date", "end_date", "duration", "rappo",
-            "topics", "outcome_text", "recommendation"
-        ))
-        return JsonResponse({"outcomes": outcomes})
+        etag, last_modified = validators(event.outcomes_modified, event.outcome_total)
+        response = not_modified(request, etag, last_modified)
+        if response is not None:
+            return response
+        try:
+            after, size = pagination.page_params(request.GET)
+        except ValueError as exc:
+            return JsonResponse({"error": str(exc)}, status=400)
+        outcomes, next_cursor = pagination.paginate(
+            serializers.OUTCOME, event.outcome_entries.all(), 'created_at', after, size
+        )
+        return set_validators(JsonResponse({"outcomes": outcomes, "next_cursor": next_cursor}),
+                              etag, last_modified)
 
     elif request.method == "POST":
         start_date = request.POST.get("start_date")
@@ -380,24 +693,22 @@ def outcome_list(request, event_id):
 @login_required(login_url='login')
 def outcome_detail(request, outcome_id):
     """Return a single outcome for editing."""
-    outcome = get_object_or_404(Outcome, pk=outcome_id, event__user=request.user)
-    data = {
-        "id": outcome.id,
-        "start_date": outcome.start_date,
-        "end_date": outcome.end_date,
-        "duration": outcome.duration,
-        "rappo": outcome.rappo,
-        "topics": outcome.topics,
-        "outcome_text": outcome.outcome_text,
-        "recommendation": outcome.recommendation,
-    }
-    return JsonResponse(data)
+    data = serializers.OUTCOME_DETAIL.first(
+        Outcome.objects.filter(pk=outcome_id, event__user=request.user)
+    )
+    if data is None:
+        raise Http404("No Outcome matches the given query.")
+    etag, last_modified = validators(data.pop("updated_at"))
+    response = not_modified(request, etag, last_modified)
+    if response is not None:
+        return response
+    return set_validators(JsonResponse(data), etag, last_modified)
 
 
 @login_required(login_url='login')
 def outcome_update(request, outcome_id):
     """Update an existing outcome."""
-    outcome = get_object_or_404(Outcome, pk=outcome_id)
+    outcome = get_object_or_404(Outcome, pk=outcome_id, event__user=request.user)
 
     if request.method != "POST":
         return JsonResponse({"error": "Invalid method"}, status=405)
@@ -414,6 +725,26 @@ def outcome_update(request, outcome_id):
     return JsonResponse({"status": "success"})
 
 
+@login_required(login_url='login')
+def outcome_batch(request):
+    """Create and update several outcomes from one JSON body (see ems.outcome_batch)."""
+    if request.method != "POST":
+        return JsonResponse({"error": "Invalid method"}, status=405)
+
+    try:
+        payload = json.loads(request.body)
+    except ValueError:
+        return JsonResponse({"error": "Invalid JSON"}, status=400)
+    items = payload.get("outcomes") if isinstance(payload, dict) else None
+    if not isinstance(items, list) or not items:
+        return JsonResponse({"error": "Expected a non-empty 'outcomes' list"}, status=400)
+    if len(items) > MAX_BATCH_SIZE:
+        return JsonResponse({"error": f"At most {MAX_BATCH_SIZE} outcomes per batch"}, status=400)
+
+    result = apply_outcome_batch(request.user, items)
+    return JsonResponse(result.as_dict(), status=200 if result.ok else 400)
+
+
 
 @login_required(login_url='login')
 def outcome_list_create(request, event_id):
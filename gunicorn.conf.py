@@ -0,0 +1,37 @@
+"""Gunicorn configuration, picked up from the working directory by ``gunicorn``.
+
+Every setting can be overridden from the environment, e.g. to serve the ASGI
+app (async outcome views, EMS_ASYNC_OUTCOMES=1) from uvicorn workers::
+
+    GUNICORN_APP=platlog.asgi:application GUNICORN_WORKER_CLASS=uvicorn_worker.UvicornWorker gunicorn
+
+benchmarks/web_load.py has the load test behind these defaults: on the home and
+timeline pages gthread workers outperform uvicorn ones, because nearly every
+view is sync and under ASGI each of them is handed to a thread anyway.
+"""
+import os
+
+wsgi_app = os.environ.get("GUNICORN_APP", "platlog.wsgi:application")
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+
+# Each worker process serves `threads` requests at once and holds its own
+# database pool (EMS_DB_POOL_MAX_SIZE, which should be >= threads), so
+# workers x pool size bounds the connections on the database server.
+worker_class = os.environ.get("GUNICORN_WORKER_CLASS", "gthread")
+workers = int(os.environ.get("WEB_CONCURRENCY", 2))
+threads = int(os.environ.get("GUNICORN_THREADS", 4))
+
+# Import Django once in the master and fork the workers from it: faster
+# restarts and shared memory pages. Nothing connects to the database at import
+# time, so no pool or connection is inherited across the fork.
+preload_app = True
+
+# Recycle workers now and then so slow leaks cannot accumulate; the jitter
+# keeps them from all restarting at the same moment.
+max_requests = int(os.environ.get("GUNICORN_MAX_REQUESTS", 2000))
+max_requests_jitter = max_requests // 4
+
+timeout = 30            # kill a worker stuck on one request longer than this
+graceful_timeout = 20   # let in-flight requests finish on restart/deploy
+keepalive = 5           # seconds; above zero so the proxy can reuse connections
+
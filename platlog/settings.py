@@ -22,10 +22,13 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 # See https://docs.djangoproject.com/en/5.2/howto/deployment/checklist/
 
 # SECURITY WARNING: keep the secret key used in production secret!
-SECRET_KEY = 'django-insecure-i+jrw+vvu9qlez5@&*6v(_j2yx4(&cg=opi9t&ottiya^0dgj4'
+SECRET_KEY = os.environ.get(
+    "SECRET_KEY", 'django-insecure-i+jrw+vvu9qlez5@&*6v(_j2yx4(&cg=opi9t&ottiya^0dgj4'
+)
 
 # SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = True
+# On unless DEBUG=False is set, as render.yml does for every service.
+DEBUG = os.environ.get("DEBUG", "True").lower() in ("1", "true", "yes")
 
 ALLOWED_HOSTS = ['localhost', '.onrender.com']
 
@@ -43,10 +46,12 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'ems.middleware.RequestInstrumentationMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.middleware.security.SecurityMiddleware',
-    'whitenoise.middleware.WhiteNoiseMiddleware',
+    'ems.middleware.StaticFilesMiddleware',  # async-capable WhiteNoise
+    'ems.middleware.CompressionMiddleware',  # brotli/gzip; below WhiteNoise, above body-writing middleware
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
@@ -55,13 +60,24 @@ MIDDLEWARE = [
 
 ROOT_URLCONF = 'platlog.urls'
 SESSION_COOKIE_AGE = 900# seconds
+# Sessions are read from the cache and written through to the database, so a
+# request only queries django_session on a cache miss. EMS_SESSION_ENGINE=cache
+# drops the database copy; only do that with a shared, persistent CACHE_URL.
+SESSION_ENGINE = {
+    "cached_db": "django.contrib.sessions.backends.cached_db",
+    "cache": "django.contrib.sessions.backends.cache",
+    "db": "django.contrib.sessions.backends.db",
+}[os.environ.get("EMS_SESSION_ENGINE", "cached_db")]
 
 #LOGIN_URL = '/accounts/login/'  # redirect for anonymous users
 #LOGIN_REDIRECT_URL = '/'         # where to go after login
 
+# Without an explicit 'loaders' option Django wraps the loaders in the cached
+# loader: templates are compiled once per process (in development the
+# autoreloader clears it when a template changes). Keep it that way.
 TEMPLATES = [
     {
-        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        'BACKEND': 'ems.instrumentation.TimedDjangoTemplates',
         'DIRS': [],
         'APP_DIRS': True,
         'OPTIONS': {
@@ -76,6 +92,29 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'platlog.wsgi.application'
+ASGI_APPLICATION = 'platlog.asgi.application'
+
+# Serve the outcome endpoints with the async views (ems.async_views); only
+# worthwhile when running platlog.asgi under an ASGI worker.
+EMS_ASYNC_OUTCOMES = os.environ.get("EMS_ASYNC_OUTCOMES", "False").lower() in ("1", "true", "yes")
+
+# Request instrumentation (ems.middleware.RequestInstrumentationMiddleware)
+EMS_SLOW_REQUEST_MS = int(os.environ.get("EMS_SLOW_REQUEST_MS", 500))
+
+# Smallest buffered HTML/JSON response worth compressing
+# (ems.middleware.CompressionMiddleware); streaming responses always are.
+EMS_COMPRESS_MIN_SIZE = int(os.environ.get("EMS_COMPRESS_MIN_SIZE", 1024))
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler'},
+    },
+    'loggers': {
+        'ems.requests': {'handlers': ['console'], 'level': 'INFO', 'propagate': False},
+    },
+}
 
 
 # Database
@@ -85,9 +124,45 @@ DATABASES = {
     "default": dj_database_url.config(
         default=os.environ.get("DATABASE_URL"),
         conn_max_age=600,
+        conn_health_checks=True,
     )
 }
 
+# PostgreSQL goes through a per-process psycopg pool instead of one persistent
+# connection per thread. With CONN_HEALTH_CHECKS the pool checks a connection
+# before handing it out, so ones dropped by the provider's proxy while idle are
+# replaced rather than failing the request; it also recycles them after
+# max_lifetime. Requests beyond max_size wait for a free connection, so workers
+# x max_size (gunicorn.conf.py) bounds the connections on the server.
+# EMS_DB_POOL=0 falls back to persistent connections, e.g. behind PgBouncer.
+EMS_DB_POOL = os.environ.get("EMS_DB_POOL", "True").lower() in ("1", "true", "yes")
+if EMS_DB_POOL and DATABASES["default"].get("ENGINE") == "django.db.backends.postgresql":
+    DATABASES["default"]["CONN_MAX_AGE"] = 0   # the pool owns connection reuse
+    DATABASES["default"].setdefault("OPTIONS", {})["pool"] = {
+        "min_size": int(os.environ.get("EMS_DB_POOL_MIN_SIZE", 1)),
+        "max_size": int(os.environ.get("EMS_DB_POOL_MAX_SIZE", 4)),
+        "timeout": 10,       # seconds a request waits for a free connection
+        "max_idle": 300,
+        "max_lifetime": 1800,
+    }
+
+
+# Cache
+# CACHE_URL selects the backend: redis://host:6379/0 is shared by every worker
+# and instance; file:///var/tmp/platlog-cache is shared by the workers of one
+# machine; unset falls back to per-process local memory (development, tests).
+CACHE_URL = os.environ.get("CACHE_URL", "")
+if CACHE_URL.startswith(("redis://", "rediss://")):
+    _cache = {"BACKEND": "django.core.cache.backends.redis.RedisCache", "LOCATION": CACHE_URL}
+elif CACHE_URL.startswith("file://"):
+    _cache = {"BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+              "LOCATION": CACHE_URL[len("file://"):]}
+elif not CACHE_URL or CACHE_URL.startswith("locmem://"):
+    _cache = {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+else:
+    raise ValueError(f"Unsupported CACHE_URL: {CACHE_URL}")
+CACHES = {"default": {**_cache, "KEY_PREFIX": "platlog"}}
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -125,7 +200,16 @@ USE_TZ = True
 STATIC_ROOT = os.path.join(BASE_DIR, "staticfiles")
 STATIC_URL = '/static/'
 
-STATICFILES_STORAGE = "whitenoise.storage.CompressedManifestStaticFilesStorage"
+# collectstatic writes content-hashed copies plus .gz/.br variants; WhiteNoise
+# serves the hashed names with a far-future immutable Cache-Control.
+# (STATICFILES_STORAGE was removed in Django 5.1, so it must be STORAGES.)
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {"BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage"},
+}
+# Tests render templates without collectstatic; this runner swaps in plain storage.
+TEST_RUNNER = "platlog.test_runner.TestRunner"
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 